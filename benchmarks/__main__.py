@@ -0,0 +1,66 @@
+"""Runs the benchmarks, compares them to a baseline and optionally saves them as the new baseline.
+
+Usage: python -m benchmarks [--save] [--baseline benchmarks/baseline.json] [--tolerance 0.1] [--quick]
+Exits with status 1 if a metric regressed by more than the tolerance compared to the baseline.
+"""
+import argparse
+import json
+import os
+import sys
+from typing import Dict
+
+from . import cases
+from .metric import Metric
+
+DEFAULT_BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def run(quick: bool) -> Dict[str, Metric]:
+    size, repeat, iterations = (100, 3, 1000) if quick else (1000, 5, 100000)
+    metrics: Dict[str, Metric] = {}
+    metrics.update(cases.injector_build(size, repeat))
+    metrics.update(cases.inject_latency(iterations, repeat))
+    metrics.update(cases.threaded_throughput(8, iterations))
+    metrics.update(cases.memory_per_binding(size))
+    metrics.update(cases.import_time(repeat))
+    return metrics
+
+
+def compare(metrics: Dict[str, Metric], baseline: Dict[str, Metric], tolerance: float) -> bool:
+    """Prints the metrics with their change since the baseline, returns False if one of them regressed."""
+    success = True
+    for name, metric in metrics.items():
+        line = f"{name:<30} {metric.value:>14.3f} {metric.unit:<4}"
+        if name in baseline:
+            regression = metric.get_regression(baseline[name])
+            line += f" {regression:+8.1%} vs {baseline[name].value:.3f}"
+            if regression > tolerance:
+                line += "  REGRESSION"
+                success = False
+        print(line)
+    return success
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Runs the opyoid benchmarks")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE_PATH, help="Baseline results file")
+    parser.add_argument("--save", action="store_true", help="Saves the results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="Allowed regression ratio")
+    parser.add_argument("--quick", action="store_true", help="Runs smaller benchmarks, less precise")
+    arguments = parser.parse_args()
+
+    metrics = run(arguments.quick)
+    baseline: Dict[str, Metric] = {}
+    if os.path.exists(arguments.baseline):
+        with open(arguments.baseline, encoding="utf-8") as baseline_file:
+            baseline = {name: Metric.from_dict(metric) for name, metric in json.load(baseline_file).items()}
+    success = compare(metrics, baseline, arguments.tolerance)
+    if arguments.save:
+        with open(arguments.baseline, "w", encoding="utf-8") as baseline_file:
+            json.dump({name: metric.to_dict() for name, metric in metrics.items()}, baseline_file, indent=2)
+        print(f"Saved baseline to {arguments.baseline}")
+    return 0 if success or arguments.save else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
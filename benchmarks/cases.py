@@ -0,0 +1,101 @@
+"""Benchmark cases, each one returning metrics by name."""
+import contextvars
+import statistics
+import subprocess
+import sys
+import tracemalloc
+from functools import partial
+from threading import Thread
+from time import perf_counter
+from typing import Callable, Dict, Iterator, List
+
+from opyoid import AbstractModule, ContextScope, Injector, PerLookupScope, RequestScope, SelfBinding, SingletonScope, \
+    ThreadScope
+from .graphs import GRAPHS, create_classes
+from .metric import Metric
+
+
+def _measure(function: Callable[[], None], repeat: int) -> float:
+    """Returns the median duration of function in seconds."""
+    durations = []
+    for _ in range(repeat):
+        start_time = perf_counter()
+        function()
+        durations.append(perf_counter() - start_time)
+    return statistics.median(durations)
+
+
+def _build_injector(modules_iterator: Iterator[List[AbstractModule]]) -> None:
+    Injector(next(modules_iterator))
+
+
+def _inject_many(injector: Injector, target_type: type, iterations: int) -> None:
+    for _ in range(iterations):
+        injector.inject(target_type)
+
+
+def injector_build(size: int, repeat: int) -> Dict[str, Metric]:
+    metrics = {}
+    for graph_name, create_modules in GRAPHS.items():
+        # Modules are created outside of the measure, classes are parsed once per class so they must be new each time
+        modules_list = [create_modules(size) for _ in range(repeat)]
+        modules_iterator = iter(modules_list)
+        metrics[f"build.{graph_name}"] = Metric(
+            _measure(partial(_build_injector, modules_iterator), repeat), "s")
+    return metrics
+
+
+def inject_latency(iterations: int, repeat: int) -> Dict[str, Metric]:
+    classes = create_classes({"Leaf0": [], "Leaf1": [], "Leaf2": [], "Root": ["Leaf0", "Leaf1", "Leaf2"]})
+    metrics = {}
+    for scope in (SingletonScope, PerLookupScope, ThreadScope, ContextScope, RequestScope):
+        injector = Injector(bindings=[
+            SelfBinding(classes["Leaf0"]),
+            SelfBinding(classes["Leaf1"]),
+            SelfBinding(classes["Leaf2"]),
+            SelfBinding(classes["Root"], scope=scope),
+        ])
+        inject_many = partial(_inject_many, injector, classes["Root"], iterations)
+        with injector.scope(RequestScope):
+            duration = contextvars.copy_context().run(_measure, inject_many, repeat)
+        metrics[f"inject.{scope.__name__}"] = Metric(duration / iterations * 1e9, "ns")
+    return metrics
+
+
+def threaded_throughput(threads_count: int, iterations: int) -> Dict[str, Metric]:
+    metrics = {}
+    for scope in (SingletonScope, ThreadScope):
+        classes = create_classes({"Shared": []})
+        injector = Injector(bindings=[SelfBinding(classes["Shared"], scope=scope)])
+        inject_many = partial(_inject_many, injector, classes["Shared"], iterations)
+        threads: List[Thread] = [Thread(target=inject_many) for _ in range(threads_count)]
+        start_time = perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        duration = perf_counter() - start_time
+        metrics[f"threads.{scope.__name__}"] = Metric(threads_count * iterations / duration, "op/s",
+                                                      higher_is_better=True)
+    return metrics
+
+
+def memory_per_binding(size: int) -> Dict[str, Metric]:
+    modules = GRAPHS["wide"](size)
+    tracemalloc.start()
+    try:
+        injector = Injector(modules)
+        allocated_size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del injector
+    return {"memory.per_binding": Metric(allocated_size / size, "B")}
+
+
+def import_time(repeat: int) -> Dict[str, Metric]:
+    script = "import time; start_time = time.perf_counter(); import opyoid; print(time.perf_counter() - start_time)"
+    durations = [
+        float(subprocess.run([sys.executable, "-c", script], check=True, stdout=subprocess.PIPE).stdout)
+        for _ in range(repeat)
+    ]
+    return {"import.opyoid": Metric(statistics.median(durations), "s")}
@@ -0,0 +1,104 @@
+"""Synthetic binding graphs, the classes are generated so that their constructors are typed like real code."""
+from typing import Dict, List
+
+from opyoid import AbstractModule, ItemBinding, Module, MultiBinding, PrivateModule
+
+
+def create_classes(dependencies_by_name: Dict[str, List[str]]) -> Dict[str, type]:
+    """Creates one class per name, in order, each constructor taking the classes listed in its dependencies."""
+    namespace: Dict[str, type] = {}
+    for name, dependencies in dependencies_by_name.items():
+        parameters = "".join(f", dependency_{index}: {dependency}" for index, dependency in enumerate(dependencies))
+        assignments = "".join(
+            f"\n        self.dependency_{index} = dependency_{index}" for index in range(len(dependencies))
+        ) or "\n        pass"
+        exec(f"class {name}:\n    def __init__(self{parameters}):{assignments}", namespace)  # pylint: disable=exec-used
+    return {name: namespace[name] for name in dependencies_by_name}
+
+
+class BindingsModule(Module):
+    def __init__(self, classes: List[type]) -> None:
+        Module.__init__(self)
+        self._classes = classes
+
+    def configure(self) -> None:
+        for klass in self._classes:
+            self.bind(klass)
+
+
+class ExposingPrivateModule(PrivateModule):
+    def __init__(self, classes: List[type]) -> None:
+        PrivateModule.__init__(self)
+        self._classes = classes
+
+    def configure(self) -> None:
+        for klass in self._classes[:-1]:
+            self.bind(klass)
+        self.expose(self.bind(self._classes[-1]))
+
+
+class MultiBindingsModule(Module):
+    def __init__(self, item_type: type, classes: List[type]) -> None:
+        Module.__init__(self)
+        self._item_type = item_type
+        self._classes = classes
+
+    def configure(self) -> None:
+        self.bind(self._item_type)
+        for klass in self._classes:
+            self._register(MultiBinding(self._item_type, [ItemBinding(klass)], override_bindings=False))
+
+
+def wide_graph(size: int) -> List[AbstractModule]:
+    """size independent classes."""
+    classes = create_classes({f"Wide{index}": [] for index in range(size)})
+    return [BindingsModule(list(classes.values()))]
+
+
+def deep_graph(size: int) -> List[AbstractModule]:
+    """A chain of size classes, each one depending on the previous one."""
+    classes = create_classes({
+        f"Deep{index}": [f"Deep{index - 1}"] if index else []
+        for index in range(size)
+    })
+    return [BindingsModule(list(classes.values()))]
+
+
+def diamond_graph(size: int, width: int = 10) -> List[AbstractModule]:
+    """Layers of width classes, each class depending on all the classes of the previous layer."""
+    dependencies_by_name = {}
+    for index in range(size):
+        layer, column = divmod(index, width)
+        dependencies_by_name[f"Diamond{layer}_{column}"] = [
+            f"Diamond{layer - 1}_{previous_column}"
+            for previous_column in range(width)
+        ] if layer else []
+    return [BindingsModule(list(create_classes(dependencies_by_name).values()))]
+
+
+def multi_binding_graph(size: int) -> List[AbstractModule]:
+    """size classes bound as items of a single list."""
+    classes = create_classes({"MultiItem": [], **{f"Multi{index}": [] for index in range(size)}})
+    item_type = classes.pop("MultiItem")
+    return [MultiBindingsModule(item_type, list(classes.values()))]
+
+
+def private_module_graph(size: int, module_size: int = 5) -> List[AbstractModule]:
+    """Private modules of module_size chained classes, exposing the last one."""
+    modules = []
+    for module_index in range(size // module_size):
+        classes = create_classes({
+            f"Private{module_index}_{index}": [f"Private{module_index}_{index - 1}"] if index else []
+            for index in range(module_size)
+        })
+        modules.append(ExposingPrivateModule(list(classes.values())))
+    return modules
+
+
+GRAPHS = {
+    "wide": wide_graph,
+    "deep": deep_graph,
+    "diamond": diamond_graph,
+    "multi_binding": multi_binding_graph,
+    "private_module": private_module_graph,
+}
@@ -0,0 +1,24 @@
+from typing import Any, Dict
+
+import attr
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class Metric:
+    value: float
+    unit: str
+    higher_is_better: bool = False
+
+    def get_regression(self, baseline: "Metric") -> float:
+        """Returns how much worse this metric is than the baseline, as a ratio, negative if it is better."""
+        if not baseline.value:
+            return 0.
+        ratio = self.value / baseline.value
+        return 1 / ratio - 1 if self.higher_is_better else ratio - 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        return attr.asdict(self)
+
+    @classmethod
+    def from_dict(cls, metric_dict: Dict[str, Any]) -> "Metric":
+        return cls(**metric_dict)
@@ -1,10 +1,18 @@
 from .named import named_arg
+from .async_provider import AsyncProvider
 from .bindings import AbstractModule, ClassBinding, InstanceBinding, ItemBinding, Module, MultiBinding, PrivateModule, \
     ProviderBinding, SelfBinding
-from .exceptions import NamedError, BindingError, InjectException, NoBindingFound, NonInjectableTypeError
+from .dependency_graph import DependencyEdge, DependencyGraph, DependencyNode
+from .exceptions import NamedError, BindingError, InjectException, NoBindingFound, NonInjectableTypeError, \
+    PoolExhaustedError, ScopeMismatchError, WarmUpError
 from .injector import Injector
 from .injector_options import InjectorOptions
+from .lazy import Lazy
+from .listeners import InjectionEvent, InjectionListener, StartupReport
+from .pooled import Pooled
 from .provider import Provider
-from .scopes import ImmediateScope, PerLookupScope, SingletonScope, ThreadScope
+from .scope_mismatch_policy import ScopeMismatchPolicy
+from .scopes import AsyncSingletonScope, ContextScope, ImmediateScope, PerLookupScope, PooledScope, RequestScope, \
+    SingletonScope, ThreadScope, close_instance, close_instance_async
 from .target import Target
 from .utils import InjectedT
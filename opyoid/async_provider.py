@@ -0,0 +1,13 @@
+from opyoid.exceptions import NonInjectableTypeError
+from opyoid.provider import Provider
+from opyoid.utils import InjectedT
+
+
+class AsyncProvider(Provider[InjectedT]):
+    """Base class for providers creating their instance asynchronously, can only be used with Injector.inject_async."""
+
+    async def get_async(self) -> InjectedT:
+        raise NotImplementedError
+
+    def get(self) -> InjectedT:
+        raise NonInjectableTypeError(f"{self!r} is asynchronous, use Injector.inject_async to inject it")
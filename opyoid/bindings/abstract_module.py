@@ -1,3 +1,4 @@
+from time import perf_counter
 from typing import List, Optional, Type, Union
 
 from opyoid.exceptions import BindingError
@@ -21,11 +22,22 @@ class AbstractModule:
     def __init__(self, log_bindings: bool = False):
         self._is_configured = False
         self._binding_registry = BindingRegistry(log_bindings)
+        self._installed_modules: List["AbstractModule"] = []
+        self._configure_duration = 0.
 
     @property
     def binding_registry(self) -> BindingRegistry:
         return self._binding_registry
 
+    @property
+    def installed_modules(self) -> List["AbstractModule"]:
+        return self._installed_modules
+
+    @property
+    def configure_duration(self) -> float:
+        """Time spent in configure in seconds, including the configuration of the installed modules."""
+        return self._configure_duration
+
     def __repr__(self) -> str:
         return ".".join([self.__class__.__module__, self.__class__.__qualname__])
 
@@ -43,6 +55,7 @@ class AbstractModule:
         from .private_module import PrivateModule
 
         module.configure_once()
+        self._installed_modules.append(module)
         for binding in module.binding_registry.get_bindings_by_target().values():
             if isinstance(module, PrivateModule):
                 if not module.is_exposed(binding.target):
@@ -92,7 +105,9 @@ class AbstractModule:
 
         if not self._is_configured:
             self._is_configured = True
+            start_time = perf_counter()
             self.configure()
+            self._configure_duration = perf_counter() - start_time
 
     def multi_bind(self,
                    item_target_type: Type[InjectedT],
@@ -6,7 +6,7 @@ from opyoid.frozen_target import FrozenTarget
 from opyoid.utils import InjectedT
 
 
-@attr.s(auto_attribs=True, frozen=True)
+@attr.s(auto_attribs=True, frozen=True, slots=True)
 class Binding(Generic[InjectedT]):
     """Abstract class representing a link between a Target and something used to create it."""
 
@@ -20,4 +20,4 @@ class Binding(Generic[InjectedT]):
 
     @property
     def target(self) -> FrozenTarget[InjectedT]:
-        return FrozenTarget(self.target_type, self.named)
+        return FrozenTarget.create(self.target_type, self.named)
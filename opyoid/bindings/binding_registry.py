@@ -1,10 +1,10 @@
 import logging
 from typing import Dict, Optional, cast
 
-from opyoid.exceptions import NonInjectableTypeError
 from opyoid.frozen_target import FrozenTarget
 from opyoid.provider import Provider
 from opyoid.target import Target
+from opyoid.type_name_index import TypeNameIndex
 from opyoid.utils import InjectedT
 from .class_binding import ClassBinding
 from .instance_binding import InstanceBinding
@@ -21,6 +21,7 @@ class BindingRegistry:
 
     def __init__(self, log_bindings: bool = False):
         self._bindings_by_target: Dict[FrozenTarget[InjectedT], RegisteredBinding[InjectedT]] = {}
+        self._type_name_index = TypeNameIndex()
         self._log_bindings = log_bindings
 
     def __contains__(self, item: Target[InjectedT]) -> bool:
@@ -42,6 +43,7 @@ class BindingRegistry:
             elif not previous_binding:
                 self.logger.debug(f"Registering {registered_binding.raw_binding!r}")
         self._bindings_by_target[registered_binding.target] = registered_binding
+        self._type_name_index.add(registered_binding.target.type)
         if add_self_binding:
             self._register_self_binding(registered_binding)
 
@@ -69,16 +71,6 @@ class BindingRegistry:
 
     def get_binding(self, target: Target[InjectedT]) -> Optional[RegisteredBinding]:
         if isinstance(target.type, str):
-            possible_target_types = list(set(
-                available_target.type
-                for available_target in self._bindings_by_target
-                if isinstance(available_target.type, type)
-                and available_target.type.__name__ == target.type
-            ))
-            if len(possible_target_types) == 1:
-                target.type = possible_target_types[0]
-            elif possible_target_types:
-                raise NonInjectableTypeError(
-                    f"Could not find binding for '{target.type}': multiple types with this name found")
-        frozen_target = FrozenTarget(target.type, target.named)
+            target.type = self._type_name_index.get_type(target.type) or target.type
+        frozen_target = FrozenTarget.create(target.type, target.named)
         return self._bindings_by_target.get(frozen_target)
@@ -8,7 +8,7 @@ from opyoid.scopes import Scope, SingletonScope
 from opyoid.utils import InjectedT, get_class_full_name
 
 
-@attr.s(auto_attribs=True, frozen=True, repr=False)
+@attr.s(auto_attribs=True, frozen=True, repr=False, slots=True)
 class ClassBinding(Binding[InjectedT]):
     _target_type: Type[InjectedT]
     bound_type: Type[InjectedT]
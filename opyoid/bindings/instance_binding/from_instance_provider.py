@@ -1,3 +1,5 @@
+from typing import Any, Callable, Dict
+
 from opyoid.provider import Provider
 from opyoid.utils import InjectedT
 
@@ -8,3 +10,7 @@ class FromInstanceProvider(Provider[InjectedT]):
 
     def get(self) -> InjectedT:
         return self._instance
+
+    def _compile(self, compiled_getters: Dict[Provider, Callable[[], Any]]) -> Callable[[], InjectedT]:
+        instance = self._instance
+        return lambda: instance
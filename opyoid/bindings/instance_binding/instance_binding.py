@@ -6,7 +6,7 @@ from opyoid.bindings.binding import Binding
 from opyoid.utils import InjectedT
 
 
-@attr.s(auto_attribs=True, frozen=True, repr=False)
+@attr.s(auto_attribs=True, frozen=True, repr=False, slots=True)
 class InstanceBinding(Binding[InjectedT]):
     _target_type: Type[InjectedT]
     bound_instance: InjectedT
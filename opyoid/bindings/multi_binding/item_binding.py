@@ -6,7 +6,7 @@ from opyoid.provider import Provider
 from opyoid.utils import EMPTY, InjectedT, get_class_full_name
 
 
-@attr.s(auto_attribs=True, frozen=True, repr=False)
+@attr.s(auto_attribs=True, frozen=True, repr=False, slots=True)
 class ItemBinding(Generic[InjectedT]):
     bound_type: Type[InjectedT] = EMPTY
     bound_instance: InjectedT = EMPTY
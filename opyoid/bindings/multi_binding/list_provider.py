@@ -1,4 +1,5 @@
-from typing import List
+import asyncio
+from typing import Any, Callable, Dict, List
 
 from opyoid.provider import Provider
 from opyoid.utils import InjectedT
@@ -13,3 +14,16 @@ class ListProvider(Provider[List[InjectedT]]):
             provider.get()
             for provider in self._item_providers
         ]
+
+    async def get_async(self) -> List[InjectedT]:
+        return list(await asyncio.gather(*(
+            provider.get_async()
+            for provider in self._item_providers
+        )))
+
+    def _compile(self, compiled_getters: Dict[Provider, Callable[[], Any]]) -> Callable[[], List[InjectedT]]:
+        item_getters = [
+            provider.compile(compiled_getters)
+            for provider in self._item_providers
+        ]
+        return lambda: [item_getter() for item_getter in item_getters]
@@ -8,7 +8,7 @@ from opyoid.scopes import Scope, SingletonScope
 from opyoid.utils import InjectedT
 
 
-@attr.s(auto_attribs=True, frozen=True, repr=False)
+@attr.s(auto_attribs=True, frozen=True, repr=False, slots=True)
 class MultiBinding(Binding[List[InjectedT]]):
     item_target_type: Type[InjectedT]
     item_bindings: List[ItemBinding[InjectedT]]
@@ -1,9 +1,12 @@
+from functools import partial
 from typing import TYPE_CHECKING
 
 from opyoid.bindings.binding import Binding
 from opyoid.bindings.binding_to_provider_adapter import BindingToProviderAdapter
+from opyoid.bindings.scope_mismatch_checker import ScopeMismatchChecker
 from opyoid.exceptions import NoBindingFound, NonInjectableTypeError
 from opyoid.injection_context import InjectionContext
+from opyoid.listeners import create_scoped_provider
 from opyoid.provider import Provider
 from opyoid.target import Target
 from opyoid.utils import InjectedT
@@ -22,6 +25,7 @@ class MultiBindingToProviderAdapter(BindingToProviderAdapter[MultiBinding]):
 
     def __init__(self, item_provider_factory: "FromRegisteredBindingProviderFactory") -> None:
         self._item_provider_factory = item_provider_factory
+        self._scope_mismatch_checker = ScopeMismatchChecker()
 
     def accept(self, binding: Binding[InjectedT], context: InjectionContext[InjectedT]) -> bool:
         return isinstance(binding, MultiBinding)
@@ -32,7 +36,19 @@ class MultiBindingToProviderAdapter(BindingToProviderAdapter[MultiBinding]):
         item_providers = []
         for sub_binding in binding.item_bindings:
             new_context = context.get_child_context(Target(sub_binding.target.type, sub_binding.target.named))
-            item_providers.append(self._item_provider_factory.create(sub_binding, new_context, cache_provider=False))
+            item_provider = context.injection_state.provider_creator.create_item_provider(
+                new_context,
+                sub_binding,
+                partial(self._item_provider_factory.create, sub_binding, new_context, cache_provider=False),
+            )
+            # Multi bindings with the same target are merged, their items can have a different scope than the list
+            item_scope = getattr(sub_binding.raw_binding, "scope", None)
+            item_providers.append(self._scope_mismatch_checker.check(
+                binding.raw_binding.scope,
+                new_context,
+                item_provider,
+                item_scope.lifetime if item_scope else None,
+            ))
 
         unscoped_provider = ListProvider(item_providers)
 
@@ -42,4 +58,4 @@ class MultiBindingToProviderAdapter(BindingToProviderAdapter[MultiBinding]):
         except NoBindingFound:
             raise NonInjectableTypeError(f"Could not create a provider for {binding!r}: they are no bindings for"
                                          f" {binding.raw_binding.scope.__name__!r}")
-        return scope_provider.get().get_scoped_provider(unscoped_provider)
+        return create_scoped_provider(scope_provider.get(), unscoped_provider, context)
@@ -1,3 +1,5 @@
+from typing import Any, Callable, Dict
+
 from opyoid.provider import Provider
 from opyoid.utils import InjectedT
 
@@ -9,3 +11,11 @@ class FromProviderProvider(Provider[InjectedT]):
     def get(self) -> InjectedT:
         provider: Provider[InjectedT] = self._provider_provider.get()
         return provider.get()
+
+    async def get_async(self) -> InjectedT:
+        provider: Provider[InjectedT] = await self._provider_provider.get_async()
+        return await provider.get_async()
+
+    def _compile(self, compiled_getters: Dict[Provider, Callable[[], Any]]) -> Callable[[], InjectedT]:
+        provider_getter = self._provider_provider.compile(compiled_getters)
+        return lambda: provider_getter().get()
@@ -3,6 +3,7 @@ from opyoid.bindings.binding_to_provider_adapter import BindingToProviderAdapter
 from opyoid.bindings.registered_binding import RegisteredBinding
 from opyoid.exceptions import NoBindingFound, NonInjectableTypeError
 from opyoid.injection_context import InjectionContext
+from opyoid.listeners import create_scoped_provider
 from opyoid.provider import Provider
 from opyoid.target import Target
 from opyoid.utils import InjectedT
@@ -34,4 +35,4 @@ class ProviderBindingToProviderAdapter(BindingToProviderAdapter[ProviderBinding]
         except NoBindingFound:
             raise NonInjectableTypeError(f"Could not create a provider for {binding}: they are no bindings for"
                                          f"the scope {binding.raw_binding.scope}")
-        return scope_provider.get().get_scoped_provider(unscoped_provider)
+        return create_scoped_provider(scope_provider.get(), unscoped_provider, context)
@@ -12,7 +12,7 @@ if TYPE_CHECKING:
 BindingT = TypeVar("BindingT", bound=Binding)
 
 
-@attr.s(auto_attribs=True, frozen=True)
+@attr.s(auto_attribs=True, frozen=True, slots=True)
 class RegisteredBinding(Generic[BindingT]):
     raw_binding: BindingT
     source_path: Tuple["PrivateModule", ...] = attr.Factory(tuple)
@@ -7,6 +7,6 @@ from .multi_binding import MultiBinding
 from .registered_binding import RegisteredBinding
 
 
-@attr.s(auto_attribs=True, frozen=True)
+@attr.s(auto_attribs=True, frozen=True, slots=True)
 class RegisteredMultiBinding(RegisteredBinding[MultiBinding[InjectedT]]):
     item_bindings: List[RegisteredBinding[InjectedT]] = attr.Factory(list)
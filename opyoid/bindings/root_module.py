@@ -1,6 +1,7 @@
 from typing import List, Optional, TYPE_CHECKING
 
-from opyoid.scopes import ImmediateScope, PerLookupScope, SingletonScope, ThreadScope
+from opyoid.scopes import AsyncSingletonScope, ContextScope, ImmediateScope, PerLookupScope, PooledScope, \
+    RequestScope, SingletonScope, ThreadScope
 from .abstract_module import AbstractModule
 from .binding import Binding
 from .module import Module
@@ -24,8 +25,12 @@ class RootModule(Module):
         from opyoid.injector import Injector
 
         self.bind(Injector, to_instance=self._injector)
+        self.bind(AsyncSingletonScope, to_instance=AsyncSingletonScope())
+        self.bind(ContextScope, to_instance=ContextScope())
         self.bind(ImmediateScope, to_instance=ImmediateScope())
         self.bind(PerLookupScope, to_instance=PerLookupScope())
+        self.bind(PooledScope, to_instance=PooledScope())
+        self.bind(RequestScope, to_instance=RequestScope())
         self.bind(SingletonScope, to_instance=SingletonScope())
         self.bind(ThreadScope, to_instance=ThreadScope())
         for module in self._modules:
@@ -0,0 +1,45 @@
+import logging
+from typing import Optional, Type
+
+from opyoid.exceptions import ScopeMismatchError
+from opyoid.injection_context import InjectionContext
+from opyoid.provider import Provider
+from opyoid.provider_proxy import ProviderProxy
+from opyoid.scope_mismatch_policy import ScopeMismatchPolicy
+from opyoid.scopes import Scope, ScopeLifetime
+from opyoid.utils import EMPTY, InjectedT
+from .instance_binding import FromInstanceProvider
+
+
+class ScopeMismatchChecker:
+    """Detects the longer-lived instances depending on shorter-lived ones, following the scope_mismatch option."""
+
+    logger = logging.getLogger(__name__)
+
+    def check(self,
+              scope: Type[Scope],
+              dependency_context: InjectionContext[InjectedT],
+              dependency_provider: Provider[InjectedT],
+              dependency_lifetime: Optional[ScopeLifetime] = EMPTY) -> Provider[InjectedT]:
+        """Returns the provider to use for a dependency of an instance in scope.
+
+        The dependency lifetime is the one saved with its provider if not given.
+        """
+        policy = dependency_context.injection_state.options.scope_mismatch
+        if policy == ScopeMismatchPolicy.IGNORE or scope.lifetime is None:
+            return dependency_provider
+        if dependency_lifetime is EMPTY:
+            dependency_lifetime = dependency_context.injection_state.provider_registry.get_lifetime(
+                dependency_context.target)
+        if dependency_lifetime is None or dependency_lifetime >= scope.lifetime:
+            return dependency_provider
+        # Thread, context and request scoped providers return the instance of the current context, per lookup or pooled
+        # providers would create or check out a new instance on each access
+        if policy == ScopeMismatchPolicy.AUTO_PROXY and dependency_lifetime != ScopeLifetime.PER_LOOKUP:
+            return FromInstanceProvider(ProviderProxy(dependency_provider))
+        message = f"{dependency_context.parent_context.target!r} is {scope.__name__} scoped and depends on " \
+                  f"{dependency_context.target!r} that has a shorter lifetime, inject a Provider instead"
+        if policy in (ScopeMismatchPolicy.STRICT, ScopeMismatchPolicy.AUTO_PROXY):
+            raise ScopeMismatchError(message)
+        self.logger.warning(message)
+        return dependency_provider
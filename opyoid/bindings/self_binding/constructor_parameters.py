@@ -0,0 +1,58 @@
+from inspect import Parameter, signature
+from typing import Any, Callable, Optional, Tuple
+
+import attr
+
+from opyoid.constructor_parameters_cache import cache_parameters, get_cached_parameters
+from opyoid.type_checker import TypeChecker
+from .constructor_type_hints import get_constructor_type_hints
+
+
+@attr.s(auto_attribs=True, frozen=True, slots=True)
+class ConstructorParameter:
+    """Injectable constructor parameter, with its string annotation and Named wrapper resolved."""
+
+    name: str
+    kind: Any
+    annotation: Any = Parameter.empty
+    named: Optional[str] = None
+    default: Any = Parameter.empty
+
+
+def get_constructor_parameters(target_type: type) -> Tuple[ConstructorParameter, ...]:
+    """Returns the parameters to inject in the constructor of target_type, without self and **kwargs.
+
+    Results are cached for each class, and shared between all injectors.
+    """
+    parameters = get_cached_parameters(target_type)
+    if parameters is None:
+        constructor = target_type.__init__
+        parameters = _parse_constructor_parameters(constructor)
+        cache_parameters(target_type, constructor, parameters)
+    return parameters
+
+
+def set_constructor_parameters(target_type: type,
+                               constructor: Callable,
+                               parameters: Tuple[ConstructorParameter, ...]) -> None:
+    """Caches parameters parsed beforehand, they are ignored if target_type.__init__ is not constructor anymore."""
+    cache_parameters(target_type, constructor, tuple(parameters))
+
+
+def _parse_constructor_parameters(constructor: Callable) -> Tuple[ConstructorParameter, ...]:
+    parameters = []
+    # Ignore 'self'
+    for parameter in list(signature(constructor).parameters.values())[1:]:
+        # Ignore '**kwargs'
+        if parameter.kind == Parameter.VAR_KEYWORD:
+            continue
+        annotation = parameter.annotation
+        named = None
+        if TypeChecker.is_named(annotation):
+            named = annotation.name
+            annotation = annotation.original_type
+        if isinstance(annotation, str):
+            # String annotations (e.g. with 'from __future__ import annotations') are replaced by their type
+            annotation = get_constructor_type_hints(constructor).get(parameter.name, annotation)
+        parameters.append(ConstructorParameter(parameter.name, parameter.kind, annotation, named, parameter.default))
+    return tuple(parameters)
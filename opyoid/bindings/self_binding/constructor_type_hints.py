@@ -0,0 +1,44 @@
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, get_type_hints
+from weakref import WeakKeyDictionary
+
+_type_hints_by_constructor: "WeakKeyDictionary[Callable, Dict[str, Any]]" = WeakKeyDictionary()
+
+
+def get_constructor_type_hints(constructor: Callable) -> Dict[str, Any]:
+    """Returns the type hints of a constructor, string annotations being resolved with the constructor module globals.
+
+    Results are cached for each constructor. Annotations that cannot be resolved (e.g. classes defined in a function)
+    are missing from the result.
+    """
+    try:
+        return _type_hints_by_constructor[constructor]
+    except KeyError:
+        pass
+    type_hints = _resolve_type_hints(constructor)
+    _type_hints_by_constructor[constructor] = type_hints
+    return type_hints
+
+
+def _resolve_type_hints(constructor: Callable) -> Dict[str, Any]:
+    global_namespace = getattr(constructor, "__globals__", {})
+    try:
+        # Only the annotations are given, as get_type_hints turns `x: "MyType" = None` into Optional[MyType] on
+        # functions before Python 3.11
+        return get_type_hints(SimpleNamespace(__annotations__=constructor.__annotations__), global_namespace)
+    # pylint: disable=broad-except
+    except Exception:
+        pass
+    # At least one annotation cannot be resolved, resolve the other ones one by one
+    type_hints = {}
+    for parameter_name, annotation in getattr(constructor, "__annotations__", {}).items():
+        if not isinstance(annotation, str):
+            type_hints[parameter_name] = annotation
+            continue
+        try:
+            # pylint: disable=eval-used
+            type_hints[parameter_name] = eval(annotation, global_namespace)
+        # pylint: disable=broad-except
+        except Exception:
+            pass
+    return type_hints
@@ -1,4 +1,6 @@
-from typing import Dict, List, Optional, Type
+import asyncio
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
 
 from opyoid.provider import Provider
 from opyoid.utils import InjectedT
@@ -14,19 +16,75 @@ class FromClassProvider(Provider[InjectedT]):
         self._positional_providers = positional_providers
         self._args_provider = args_provider
         self._keyword_providers = keyword_providers
+        # Specialized for this class, avoids building the arguments list and dict on each call
+        self._constructor = self._create_constructor(
+            [positional_provider.get for positional_provider in positional_providers],
+            args_provider.get if args_provider else None,
+            {
+                arg_name: keyword_provider.get
+                for arg_name, keyword_provider in keyword_providers.items()
+            },
+        )
 
     def get(self) -> InjectedT:
-        args = [
-            positional_provider.get()
-            for positional_provider in self._positional_providers
-        ]
+        return self._constructor()
+
+    async def get_async(self) -> InjectedT:
+        """Gets all dependencies concurrently, then creates the instance."""
+        keyword_names = list(self._keyword_providers)
+        dependency_providers = self._positional_providers + list(self._keyword_providers.values())
+        if self._args_provider:
+            dependency_providers.append(self._args_provider)
+        values = await asyncio.gather(*(
+            dependency_provider.get_async()
+            for dependency_provider in dependency_providers
+        ))
+        positional_count = len(self._positional_providers)
+        args = list(values[:positional_count])
         if self._args_provider:
-            args += self._args_provider.get()
-        kwargs = {
-            arg_name: keyword_provider.get()
-            for arg_name, keyword_provider in self._keyword_providers.items()
-        }
+            args += values[-1]
+        kwargs = dict(zip(keyword_names, values[positional_count:positional_count + len(keyword_names)]))
         return self._injected_type(
             *args,
             **kwargs,
         )
+
+    def _compile(self, compiled_getters: Dict[Provider, Callable[[], Any]]) -> Callable[[], InjectedT]:
+        return self._create_constructor(
+            [positional_provider.compile(compiled_getters) for positional_provider in self._positional_providers],
+            self._args_provider.compile(compiled_getters) if self._args_provider else None,
+            {
+                arg_name: keyword_provider.compile(compiled_getters)
+                for arg_name, keyword_provider in self._keyword_providers.items()
+            },
+        )
+
+    def _create_constructor(self,
+                            positional_getters: List[Callable[[], Any]],
+                            args_getter: Optional[Callable[[], List]],
+                            keyword_getters: Dict[str, Callable[[], Any]]) -> Callable[[], InjectedT]:
+        """Returns a lambda calling the injected type with each getter result as a direct argument."""
+        constructor_factory = _get_constructor_factory(
+            len(positional_getters),
+            args_getter is not None,
+            tuple(keyword_getters),
+        )
+        getters = positional_getters + ([args_getter] if args_getter else []) + list(keyword_getters.values())
+        return constructor_factory(self._injected_type, *getters)
+
+
+@lru_cache(maxsize=None)
+def _get_constructor_factory(positional_count: int,
+                             has_args: bool,
+                             keyword_names: Tuple[str, ...]) -> Callable[..., Callable[[], Any]]:
+    """Generates a function creating constructor lambdas from getters, shared by classes with the same parameters."""
+    parameters = [f"positional_{index}" for index in range(positional_count)]
+    arguments = [f"positional_{index}()" for index in range(positional_count)]
+    if has_args:
+        parameters.append("args")
+        arguments.append("*args()")
+    for index, arg_name in enumerate(keyword_names):
+        parameters.append(f"keyword_{index}")
+        arguments.append(f"{arg_name}=keyword_{index}()")
+    # pylint: disable=eval-used
+    return eval(f"lambda {', '.join(['injected_type'] + parameters)}: lambda: injected_type({', '.join(arguments)})")
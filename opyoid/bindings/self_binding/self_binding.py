@@ -7,7 +7,7 @@ from opyoid.scopes import Scope, SingletonScope
 from opyoid.utils import InjectedT
 
 
-@attr.s(auto_attribs=True, frozen=True, repr=False)
+@attr.s(auto_attribs=True, frozen=True, repr=False, slots=True)
 class SelfBinding(Binding[InjectedT]):
     _target_type: Type[InjectedT]
     scope: Type[Scope] = SingletonScope
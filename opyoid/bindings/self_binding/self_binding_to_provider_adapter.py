@@ -1,17 +1,20 @@
 import logging
-from inspect import Parameter, signature
+from inspect import Parameter
 from typing import Dict, List, Optional, Type
 
 from opyoid.bindings.binding import Binding
 from opyoid.bindings.binding_to_provider_adapter import BindingToProviderAdapter
 from opyoid.bindings.instance_binding import FromInstanceProvider
 from opyoid.bindings.registered_binding import RegisteredBinding
+from opyoid.bindings.scope_mismatch_checker import ScopeMismatchChecker
 from opyoid.exceptions import NoBindingFound, NonInjectableTypeError
 from opyoid.injection_context import InjectionContext
+from opyoid.listeners import create_scoped_provider
 from opyoid.provider import Provider
+from opyoid.scopes import Scope
 from opyoid.target import Target
-from opyoid.type_checker import TypeChecker
 from opyoid.utils import EMPTY, InjectedT
+from .constructor_parameters import ConstructorParameter, get_constructor_parameters
 from .from_class_provider import FromClassProvider
 from .self_binding import SelfBinding
 
@@ -22,27 +25,25 @@ class SelfBindingToProviderAdapter(BindingToProviderAdapter[SelfBinding]):
 
     logger = logging.getLogger(__name__)
 
+    def __init__(self) -> None:
+        self._scope_mismatch_checker = ScopeMismatchChecker()
+
     def accept(self, binding: Binding[InjectedT], context: InjectionContext) -> bool:
         return isinstance(binding, SelfBinding)
 
     def create(self,
                binding: RegisteredBinding[SelfBinding[InjectedT]],
                context: InjectionContext[InjectedT]) -> Provider[InjectedT]:
-        parameters = signature(binding.target.type.__init__).parameters
         positional_providers: List[Provider] = []
         args_provider: Optional[Provider[List]] = None
         keyword_providers: Dict[str, Provider] = {}
-        # Ignore 'self'
-        for parameter in list(parameters.values())[1:]:
-            # Ignore '**kwargs'
-            if parameter.kind == Parameter.VAR_KEYWORD:
-                continue
-
+        scope = binding.raw_binding.scope
+        for parameter in get_constructor_parameters(binding.target.type):
             if parameter.kind == Parameter.VAR_POSITIONAL:
                 # *args
-                args_provider = self._get_positional_parameter_provider(parameter, binding.target.type, context)
+                args_provider = self._get_positional_parameter_provider(parameter, binding.target.type, scope, context)
                 continue
-            parameter_provider = self._get_parameter_provider(parameter, binding.target.type, context)
+            parameter_provider = self._get_parameter_provider(parameter, binding.target.type, scope, context)
             if parameter.kind == Parameter.KEYWORD_ONLY:
                 # After *args
                 keyword_providers[parameter.name] = parameter_provider
@@ -61,22 +62,23 @@ class SelfBindingToProviderAdapter(BindingToProviderAdapter[SelfBinding]):
         except NoBindingFound:
             raise NonInjectableTypeError(f"Could not create a provider for {binding!r}: they are no bindings for"
                                          f" {binding.raw_binding.scope.__name__!r}")
-        return scope_provider.get().get_scoped_provider(unscoped_provider)
+        return create_scoped_provider(scope_provider.get(), unscoped_provider, context)
 
     def _get_parameter_provider(self,
-                                parameter: Parameter,
+                                parameter: ConstructorParameter,
                                 current_class: Type,
+                                scope: Type[Scope],
                                 context: InjectionContext[InjectedT]) -> Provider[InjectedT]:
         default_value = parameter.default if parameter.default is not Parameter.empty else EMPTY
         if parameter.annotation is not Parameter.empty:
-            if TypeChecker.is_named(parameter.annotation):
+            if parameter.named is not None:
                 provider = self._get_provider([
-                    Target(parameter.annotation.original_type, parameter.annotation.name, default_value)], context)
+                    Target(parameter.annotation, parameter.named, default_value)], scope, context)
             else:
                 provider = self._get_provider([
                     Target(parameter.annotation, parameter.name, default_value),
                     Target(parameter.annotation, None, default_value),
-                ], context)
+                ], scope, context)
             if provider:
                 return provider
         if parameter.default is not Parameter.empty:
@@ -85,33 +87,36 @@ class SelfBindingToProviderAdapter(BindingToProviderAdapter[SelfBinding]):
                                      f"{parameter.annotation} required by {current_class}")
 
     def _get_positional_parameter_provider(self,
-                                           parameter: Parameter,
+                                           parameter: ConstructorParameter,
                                            current_class: Type,
+                                           scope: Type[Scope],
                                            context: InjectionContext[InjectedT]) -> Provider[List[InjectedT]]:
         if parameter.annotation is Parameter.empty:
             return FromInstanceProvider([])
-        if TypeChecker.is_named(parameter.annotation):
+        if parameter.named is not None:
             provider = self._get_provider([
-                Target(List[parameter.annotation.original_type], parameter.annotation.name, default=[])
-            ], context)
+                Target(List[parameter.annotation], parameter.named, default=[])
+            ], scope, context)
         else:
             provider = self._get_provider([
                 Target(List[parameter.annotation], parameter.name, default=[]),
                 Target(List[parameter.annotation], default=[]),
-            ], context)
+            ], scope, context)
         if provider:
             return provider
         self.logger.debug(f"Could not find a binding for *{parameter.name}: {parameter.annotation} required by "
                           f"{current_class}, will inject nothing")
         return FromInstanceProvider([])
 
-    @staticmethod
-    def _get_provider(targets: List[Target[InjectedT]],
+    def _get_provider(self,
+                      targets: List[Target[InjectedT]],
+                      scope: Type[Scope],
                       parent_context: InjectionContext) -> Optional[Provider[InjectedT]]:
         for target in targets:
             context = parent_context.get_child_context(target)
             try:
-                return context.get_provider()
+                provider = context.get_provider()
             except NoBindingFound:
-                pass
+                continue
+            return self._scope_mismatch_checker.check(scope, context, provider)
         return None
@@ -0,0 +1,34 @@
+from typing import Any, Callable, Optional, Tuple
+from weakref import ref, WeakKeyDictionary
+
+# The constructors are weakly referenced, as constructors using super() reference their class
+_ConstructorReference = Callable[[], Optional[Callable]]
+_parameters_by_class: "WeakKeyDictionary[type, Tuple[_ConstructorReference, Tuple[Any, ...]]]" = WeakKeyDictionary()
+
+
+def get_cached_parameters(target_type: type) -> Optional[Tuple[Any, ...]]:
+    """Returns the cached constructor parameters of target_type, None if they are missing or its __init__ changed."""
+    constructor_reference, parameters = _parameters_by_class.get(target_type, (None, None))
+    if constructor_reference is None or constructor_reference() is not target_type.__init__:
+        return None
+    return parameters
+
+
+def cache_parameters(target_type: type, constructor: Callable, parameters: Tuple[Any, ...]) -> None:
+    """Caches the parameters of a constructor, they are ignored if target_type.__init__ is not constructor anymore."""
+    _parameters_by_class[target_type] = (_get_reference(constructor), parameters)
+
+
+def invalidate_constructor_parameters(constructor: Callable) -> None:
+    """Removes the cached parameters of all classes using this constructor, to call when its signature is modified."""
+    for target_type, (constructor_reference, _) in list(_parameters_by_class.items()):
+        if constructor_reference() is constructor:
+            del _parameters_by_class[target_type]
+
+
+def _get_reference(constructor: Callable) -> _ConstructorReference:
+    try:
+        return ref(constructor)
+    except TypeError:
+        # Built-in constructors such as object.__init__ cannot be weakly referenced, they do not reference any class
+        return lambda: constructor
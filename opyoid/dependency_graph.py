@@ -0,0 +1,344 @@
+import json
+from collections import deque
+from typing import Any, Deque, Dict, Hashable, Iterable, List, Optional, Set, Tuple, Type, TYPE_CHECKING, Union
+
+import attr
+
+from .bindings import RegisteredBinding
+from .frozen_target import FrozenTarget
+from .scopes import Scope, ScopeLifetime, SingletonScope
+from .target import Target
+from .type_checker import TypeChecker
+from .utils import get_class_full_name
+
+if TYPE_CHECKING:
+    from .injection_state import InjectionState
+    from .providers.dependency_recorder import DependencyRecorder, RecordedTarget
+
+_EDGE_KIND_BY_NODE_KIND = {
+    "SelfBinding": "parameter",
+    "AutoBinding": "parameter",
+    "ClassBinding": "bound_class",
+    "ProviderBinding": "provider",
+    "MultiBinding": "item",
+    "List": "item",
+    "Set": "item",
+    "Tuple": "item",
+}
+
+
+def _get_target_name(target: FrozenTarget) -> str:
+    # Generic types keep their parameters, e.g. typing.List[MyType]
+    name = str(target.type) if hasattr(target.type, "__args__") else get_class_full_name(target.type)
+    return name + (f"#{target.named}" if target.named else "")
+
+
+@attr.s(auto_attribs=True, frozen=True, eq=False)
+class DependencyNode:
+    """A binding of the dependency graph, or a target injected without binding.
+
+    kind is the name of the binding class for bound targets, AutoBinding for targets bound with the auto_bindings option
+    and List, Set, Tuple, Optional, Lazy, Type, Provider or Pooled for the other targets.
+    scope is None for targets without scope, such as instance bindings.
+    module_path contains the PrivateModules the binding comes from, a target can have one node per PrivateModule.
+    """
+
+    target: FrozenTarget
+    kind: str
+    scope: Optional[Type[Scope]] = None
+    bound: bool = True
+    module_path: Tuple[str, ...] = ()
+
+    @property
+    def name(self) -> str:
+        return _get_target_name(self.target)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "type": get_class_full_name(self.target.type),
+            "named": self.target.named,
+            "kind": self.kind,
+            "scope": self.scope.__name__ if self.scope else None,
+            "module_path": list(self.module_path),
+        }
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class DependencyEdge:
+    """A dependency between two nodes, kind is parameter, bound_class, provider, item or wrapped."""
+
+    source: DependencyNode
+    target: DependencyNode
+    kind: str
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class DependencyGraph:
+    """Targets of an injector and their dependencies, computed from the providers without creating any instance.
+
+    Scopes are left out, as every scoped target depends on its scope.
+    Targets can be given as types, their nodes are then the ones of all their bindings, or as nodes.
+    """
+
+    nodes: List[DependencyNode]
+    edges: List[DependencyEdge]
+
+    @classmethod
+    def create(cls,
+               recorders: List["DependencyRecorder"],
+               excluded_types: Tuple[Type, ...] = ()) -> "DependencyGraph":
+        """Creates the graph of the targets recorded by the first recorder.
+
+        The other recorders are the ones of the parent injectors, only the targets used by the first one are kept.
+        """
+        excluded_types = excluded_types + (Scope,)
+        node_by_binding_id: Dict[int, DependencyNode] = {}
+        node_by_target: Dict[Hashable, DependencyNode] = {}
+        for recorder in recorders:
+            for recorded_target in recorder.get_recorded_targets():
+                if cls._is_excluded(recorded_target[0], excluded_types):
+                    continue
+                binding = recorder.get_binding(recorded_target)
+                if binding is None:
+                    node_by_target[recorded_target] = cls._create_node(recorded_target, binding)
+                    continue
+                # Several recorded targets share the same binding, e.g. the targets exposed by PrivateModules
+                binding_id = id(binding.raw_binding)
+                if binding_id not in node_by_binding_id:
+                    node_by_binding_id[binding_id] = cls._create_node(recorded_target, binding)
+                node_by_target[recorded_target] = node_by_binding_id[binding_id]
+        edges = cls._create_edges(recorders, node_by_target)
+        if len(recorders) == 1:
+            return cls(list(dict.fromkeys(node_by_target.values())), edges)
+        reachable_nodes = cls._get_reachable_nodes(
+            [node_by_target[target] for target in recorders[0].get_recorded_targets() if target in node_by_target],
+            edges,
+        )
+        return cls(list(reachable_nodes), [edge for edge in edges if edge.source in reachable_nodes])
+
+    def get_nodes(self, target_type: Type, named: Optional[str] = None) -> List[DependencyNode]:
+        """Returns the nodes of a target, one per binding."""
+        target = FrozenTarget.create(target_type, named)
+        return [node for node in self.nodes if node.target == target]
+
+    def get_node(self, target_type: Type, named: Optional[str] = None) -> DependencyNode:
+        """Returns the node of a target, raises a KeyError if it is not in the graph, a ValueError if it has several."""
+        nodes = self.get_nodes(target_type, named)
+        if not nodes:
+            raise KeyError(FrozenTarget.create(target_type, named))
+        if len(nodes) > 1:
+            raise ValueError(f"{_get_target_name(nodes[0].target)} has {len(nodes)} nodes, use get_nodes instead")
+        return nodes[0]
+
+    def get_dependencies(self,
+                         target: Union[Type, DependencyNode],
+                         named: Optional[str] = None) -> List[DependencyNode]:
+        nodes = self._get_target_nodes(target, named)
+        return [edge.target for edge in self.edges if edge.source in nodes]
+
+    def get_dependents(self,
+                       target: Union[Type, DependencyNode],
+                       named: Optional[str] = None) -> List[DependencyNode]:
+        nodes = self._get_target_nodes(target, named)
+        return [edge.source for edge in self.edges if edge.target in nodes]
+
+    def get_unreachable_nodes(self,
+                              entry_points: Iterable[Union[Type, FrozenTarget, DependencyNode]],
+                              ) -> List[DependencyNode]:
+        """Returns the bindings that are not used by any of the entry points, directly or not."""
+        entry_nodes = []
+        for entry_point in entry_points:
+            if isinstance(entry_point, FrozenTarget):
+                entry_nodes.extend(self.get_nodes(entry_point.type, entry_point.named))
+            else:
+                entry_nodes.extend(self._get_target_nodes(entry_point, None))
+        reachable_nodes = self._get_reachable_nodes(entry_nodes, self.edges)
+        return [node for node in self.nodes if node.bound and node not in reachable_nodes]
+
+    def get_fan_in_hotspots(self, count: int = 10) -> List[Tuple[DependencyNode, int]]:
+        """Returns the count nodes used by the most other nodes, with their number of dependents."""
+        dependents_count: Dict[DependencyNode, int] = {}
+        for edge in self.edges:
+            dependents_count[edge.target] = dependents_count.get(edge.target, 0) + 1
+        return sorted(dependents_count.items(), key=lambda item: (-item[1], item[0].name))[:count]
+
+    def get_scope_mismatches(self) -> List[Tuple[DependencyNode, DependencyNode]]:
+        """Returns the nodes depending on shorter-lived nodes, e.g. singletons on per lookup targets, with them.
+
+        The shorter-lived nodes are found through the unscoped nodes such as List or Optional, but not through
+        Provider, Pooled and Type nodes as they do not hold any instance.
+        """
+        dependencies_by_node = self._get_dependencies_by_node()
+        mismatches = []
+        for node in self.nodes:
+            lifetime = self._get_lifetime(node)
+            if lifetime is None:
+                continue
+            visited_nodes: Set[DependencyNode] = set()
+            nodes_to_visit: Deque[DependencyNode] = deque(dependencies_by_node.get(node, []))
+            while nodes_to_visit:
+                dependency = nodes_to_visit.popleft()
+                if dependency in visited_nodes or dependency.kind in ("Pooled", "Provider", "Type"):
+                    continue
+                visited_nodes.add(dependency)
+                if dependency.scope is None:
+                    nodes_to_visit.extend(dependencies_by_node.get(dependency, []))
+                    continue
+                dependency_lifetime = self._get_lifetime(dependency)
+                if dependency_lifetime is not None and dependency_lifetime < lifetime:
+                    mismatches.append((node, dependency))
+        return mismatches
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Nodes have an id, used by the edges."""
+        ids = {node: node_id for node_id, node in enumerate(self.nodes)}
+        return {
+            "nodes": [{"id": ids[node], **node.to_dict()} for node in self.nodes],
+            "edges": [
+                {"source": ids[edge.source], "target": ids[edge.target], "kind": edge.kind}
+                for edge in self.edges
+            ],
+        }
+
+    def to_json(self, indent: int = None) -> str:
+        return json.dumps(self.to_dict(), indent=indent)
+
+    def to_dot(self) -> str:
+        """Returns the graph in the DOT language used by Graphviz."""
+        ids = {node: f"n{node_id}" for node_id, node in enumerate(self.nodes)}
+        lines = ["digraph opyoid {"]
+        for node in self.nodes:
+            label = "\\n".join(
+                self._escape(line)
+                for line in (
+                    node.name,
+                    node.kind,
+                    node.scope.__name__ if node.scope else None,
+                    " > ".join(node.module_path),
+                )
+                if line
+            )
+            lines.append(f'    {ids[node]} [label="{label}"];')
+        for edge in self.edges:
+            lines.append(f'    {ids[edge.source]} -> {ids[edge.target]} [label="{edge.kind}"];')
+        lines.append("}")
+        return "\n".join(lines)
+
+    def _get_target_nodes(self, target: Union[Type, DependencyNode], named: Optional[str]) -> List[DependencyNode]:
+        if isinstance(target, DependencyNode):
+            return [target]
+        return self.get_nodes(target, named)
+
+    def _get_dependencies_by_node(self) -> Dict[DependencyNode, List[DependencyNode]]:
+        dependencies_by_node: Dict[DependencyNode, List[DependencyNode]] = {}
+        for edge in self.edges:
+            dependencies_by_node.setdefault(edge.source, []).append(edge.target)
+        return dependencies_by_node
+
+    @staticmethod
+    def _get_reachable_nodes(entry_nodes: List[DependencyNode],
+                             edges: List[DependencyEdge]) -> Dict[DependencyNode, None]:
+        dependencies_by_node: Dict[DependencyNode, List[DependencyNode]] = {}
+        for edge in edges:
+            dependencies_by_node.setdefault(edge.source, []).append(edge.target)
+        # Dicts keep the nodes in the order they are found
+        reachable_nodes: Dict[DependencyNode, None] = {}
+        nodes_to_visit = list(entry_nodes)
+        while nodes_to_visit:
+            node = nodes_to_visit.pop()
+            if node not in reachable_nodes:
+                reachable_nodes[node] = None
+                nodes_to_visit.extend(dependencies_by_node.get(node, []))
+        return reachable_nodes
+
+    @staticmethod
+    def _create_edges(recorders: List["DependencyRecorder"],
+                      node_by_target: Dict[Hashable, DependencyNode]) -> List[DependencyEdge]:
+        edges: Dict[DependencyEdge, None] = {}
+        # Nodes with the same name, such as MultiBinding items, are sorted in recording order
+        node_indexes = {node: index for index, node in enumerate(dict.fromkeys(node_by_target.values()))}
+        for recorder in recorders:
+            for recorded_target in recorder.get_recorded_targets():
+                node = node_by_target.get(recorded_target)
+                if node is None:
+                    continue
+                edge_kind = _EDGE_KIND_BY_NODE_KIND.get(node.kind, "wrapped")
+                dependency_nodes = [
+                    node_by_target[dependency]
+                    for dependency in recorder.get_dependencies(recorded_target)
+                    if dependency in node_by_target
+                ]
+                for dependency_node in sorted(dependency_nodes, key=lambda item: (item.name, node_indexes[item])):
+                    if dependency_node is not node:
+                        edges[DependencyEdge(node, dependency_node, edge_kind)] = None
+        return list(edges)
+
+    @staticmethod
+    def _get_lifetime(node: DependencyNode) -> Optional[ScopeLifetime]:
+        return node.scope.lifetime if node.scope else None
+
+    @staticmethod
+    def _escape(text: str) -> str:
+        return text.replace("\\", "\\\\").replace('"', '\\"')
+
+    @staticmethod
+    def _is_excluded(target: FrozenTarget, excluded_types: Tuple[Type, ...]) -> bool:
+        try:
+            return issubclass(target.type, excluded_types)
+        except TypeError:
+            # Not a class, e.g. a generic alias
+            return False
+
+    @classmethod
+    def _create_node(cls, recorded_target: "RecordedTarget", binding: Optional[RegisteredBinding]) -> DependencyNode:
+        target, state = recorded_target[0], recorded_target[1]
+        if binding:
+            binding_state = cls._get_binding_state(target, state, binding)
+            module_path = cls._get_module_path(binding_state) + tuple(
+                get_class_full_name(type(module)) for module in binding.source_path)
+            scope = getattr(binding.raw_binding, "scope", None)
+            return DependencyNode(target, type(binding.raw_binding).__name__, scope, True, module_path)
+        module_path = cls._get_module_path(state)
+        for kind, is_kind in (
+            ("List", TypeChecker.is_list),
+            ("Set", TypeChecker.is_set),
+            ("Tuple", TypeChecker.is_tuple),
+            ("Optional", TypeChecker.is_optional),
+            ("Lazy", TypeChecker.is_lazy),
+            ("Type", TypeChecker.is_type),
+            ("Provider", TypeChecker.is_provider),
+            ("Pooled", TypeChecker.is_pooled),
+        ):
+            if is_kind(target.type):
+                return DependencyNode(target, kind, None, False, module_path)
+        # Auto bindings are SelfBindings with the default scope
+        return DependencyNode(target, "AutoBinding", SingletonScope, False, module_path)
+
+    @staticmethod
+    def _get_binding_state(target: FrozenTarget,
+                           state: "InjectionState",
+                           binding: RegisteredBinding) -> "InjectionState":
+        """Returns the state whose bindings contain binding, MultiBinding items are found in the state of their list."""
+        binding_state = state
+        while binding_state:
+            if binding_state.binding_registry.get_binding(Target(target.type, target.named)) is binding:
+                return binding_state
+            binding_state = binding_state.parent_state
+        return state
+
+    @staticmethod
+    def _get_module_path(state: "InjectionState") -> Tuple[str, ...]:
+        module_path: Tuple[str, ...] = ()
+        while state.parent_state:
+            module = next((
+                module
+                for module, module_state in state.parent_state.state_by_module.items()
+                if module_state is state
+            ), None)
+            if module is None:
+                # Root state of a child injector
+                break
+            module_path = (get_class_full_name(type(module)),) + module_path
+            state = state.parent_state
+        return module_path
@@ -1,3 +1,6 @@
+from typing import List
+
+
 class InjectException(Exception):
     """Base class for all exceptions."""
     pass
@@ -26,3 +29,22 @@ class NamedError(InjectException):
 class CyclicDependencyError(InjectException):
     """Raised when a cyclic dependency is detected."""
     pass
+
+
+class ScopeMismatchError(InjectException):
+    """Raised when a longer-lived instance depends on a shorter-lived one with the STRICT scope_mismatch option."""
+    pass
+
+
+class PoolExhaustedError(InjectException):
+    """Raised when no pooled instance was released within the acquire_timeout of a PooledScope."""
+    pass
+
+
+class WarmUpError(InjectException):
+    """Raised when some providers or instances could not be created while warming up the injector."""
+
+    def __init__(self, errors: List[Exception]) -> None:
+        errors_string = "\n".join(f"- {error!r}" for error in errors)
+        InjectException.__init__(self, f"{len(errors)} error(s) while warming up the injector:\n{errors_string}")
+        self.errors = errors
@@ -1,16 +1,34 @@
-from typing import Generic, Optional, Type
+from typing import Any, Generic, Optional, Tuple, Type
+from weakref import WeakValueDictionary
 
 import attr
 
 from opyoid.utils import InjectedT, get_class_full_name
 
+_frozen_targets: "WeakValueDictionary[Tuple[Any, Optional[str]], FrozenTarget]" = WeakValueDictionary()
 
-@attr.s(auto_attribs=True, frozen=True, repr=False)
+
+@attr.s(auto_attribs=True, frozen=True, repr=False, slots=True, cache_hash=True)
 class FrozenTarget(Generic[InjectedT]):
-    """Identifies a class being injected, can be used as an index as it is read only."""
+    """Identifies a class being injected, can be used as an index as it is read only.
+
+    Use FrozenTarget.create to share a single instance between all equal targets, dictionary lookups then only compare
+    their identity.
+    """
 
     type: Type[InjectedT]
     named: Optional[str] = None
 
+    @classmethod
+    def create(cls, target_type: Type[InjectedT], named: Optional[str] = None) -> "FrozenTarget[InjectedT]":
+        frozen_target = _frozen_targets.get((target_type, named))
+        if frozen_target is None:
+            frozen_target = _frozen_targets.setdefault((target_type, named), cls(target_type, named))
+        return frozen_target
+
+    def __reduce__(self):
+        # Unpickled targets are shared too
+        return FrozenTarget.create, (self.type, self.named)
+
     def __repr__(self) -> str:
         return f"{get_class_full_name(self.type)}" + (f"#{self.named}" if self.named else "")
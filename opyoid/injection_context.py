@@ -1,9 +1,7 @@
-import logging
 from typing import Generic, List, Optional, TYPE_CHECKING
 
 import attr
 
-from .exceptions import CyclicDependencyError
 from .provider import Provider
 from .target import Target
 from .utils import InjectedT
@@ -13,28 +11,15 @@ if TYPE_CHECKING:
     from .injection_state import InjectionState
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class InjectionContext(Generic[InjectedT]):
-    logger = logging.getLogger(__name__)
-
     target: Target[InjectedT]
     injection_state: "InjectionState"
     parent_context: Optional["InjectionContext"] = attr.ib(default=None, eq=False)
 
-    def __attrs_post_init__(self):
-        context = self
-        while context.parent_context:
-            if self == context.parent_context:
-                dependency_chain = "\n".join(
-                    f"-> {target!r}"
-                    for target in self._dependency_chain
-                )
-                self.logger.error(f"Cyclic dependency detected, injection graph: \n{dependency_chain}")
-                raise CyclicDependencyError(f"Cyclic dependency detected, injection graph: \n{dependency_chain}")
-            context = context.parent_context
-
     @property
-    def _dependency_chain(self) -> List[Target]:
+    def dependency_chain(self) -> List[Target]:
+        """Returns the targets from this one to the root target."""
         context = self
         chain = [self.target]
         while context.parent_context:
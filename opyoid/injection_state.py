@@ -10,7 +10,7 @@ if TYPE_CHECKING:
     from .providers import ProviderCreator
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, eq=False)
 class InjectionState:
     provider_creator: "ProviderCreator"
     binding_registry: BindingRegistry
@@ -1,40 +1,236 @@
-from typing import List, Optional, Type
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Type, TypeVar
 
-from .bindings import Binding
+import attr
+
+from .bindings import Binding, RegisteredBinding
 from .bindings.abstract_module import AbstractModule
 from .bindings.root_module import RootModule
+from .dependency_graph import DependencyGraph
+from .exceptions import InjectException, WarmUpError
 from .injection_context import InjectionContext
 from .injection_state import InjectionState
 from .injector_options import InjectorOptions
-from .providers import ProviderCreator
+from .injector_snapshot import InjectorSnapshot, SnapshotModule
+from .instances_closer import InstancesCloser
+from .listeners import StartupProfiler, StartupReport
+from .provider import Provider
+from .providers import ProviderCreator, SingletonWarmer
+from .scopes import ImmediateScope, Scope
 from .target import Target
 from .utils import InjectedT
 
+ScopeT = TypeVar("ScopeT", bound=Scope)
+
 
 class Injector:
     """Injection entry point.
 
     Registers all modules and bindings, then prepares all providers.
+    If the lazy_providers option is set, only the providers of ImmediateScope bindings are prepared, the other ones are
+    created when their target is first injected.
+    If parent is set, the targets that are not bound in this injector are injected by the parent injector, see
+    create_child.
+    If the profile_startup option is set, the time spent creating the injector is available in startup_report.
+    If the record_dependencies option is set, the dependencies of the targets are available in get_dependency_graph.
     """
 
     def __init__(self,
                  modules: List[AbstractModule] = None,
                  bindings: List[Binding] = None,
                  options: InjectorOptions = None,
+                 parent: "Injector" = None,
                  ) -> None:
+        options = options or (parent._root_state.options if parent else InjectorOptions())
+        startup_profiler = None
+        if options.profile_startup:
+            startup_profiler = StartupProfiler()
+            options = attr.evolve(options, listeners=[startup_profiler] + [
+                listener
+                for listener in options.listeners
+                if not isinstance(listener, StartupProfiler)
+            ])
         root_module = RootModule(self, modules, bindings)
         root_module.configure_once()
-        self._provider_creator = ProviderCreator()
+        self._provider_creator = ProviderCreator(options.record_dependencies)
         self._root_state = InjectionState(
             self._provider_creator,
             root_module.binding_registry,
-            options or InjectorOptions(),
+            options,
+            parent._root_state if parent else None,
         )
+        self._getter_by_target: Dict[Tuple[Any, Optional[str]], Callable[[], Any]] = {}
+        self._async_getter_by_target: Dict[Tuple[Any, Optional[str]], Callable[[], Awaitable[Any]]] = {}
         # Prepare providers
-        for target in root_module.binding_registry.get_bindings_by_target():
-            injection_context = InjectionContext(Target(target.type, target.named), self._root_state)
-            injection_context.get_provider()
+        for target, binding in root_module.binding_registry.get_bindings_by_target().items():
+            if not self._root_state.options.lazy_providers or self._is_immediate(binding):
+                self._get_provider(target.type, target.named)
+        self._startup_report = None
+        if startup_profiler:
+            self._startup_report = startup_profiler.stop(root_module)
+            # The listening providers skip the notifications once there are no listeners left
+            options.listeners.remove(startup_profiler)
+
+    @property
+    def startup_report(self) -> Optional[StartupReport]:
+        """Time spent configuring the modules, creating the providers and the ImmediateScope instances.
+
+        Only available with the profile_startup option.
+        """
+        return self._startup_report
+
+    @classmethod
+    def from_snapshot(cls,
+                      path: str,
+                      modules_factory: Callable[[], List[AbstractModule]],
+                      options: InjectorOptions = None) -> "Injector":
+        """Creates an injector from the bindings saved in a snapshot file, skipping the modules configuration.
+
+        modules_factory is only called if the snapshot does not exist or is outdated, i.e. if one of the source files of
+        the modules or of the bound classes changed since it was saved, a new snapshot is then saved in path.
+        No snapshot is saved if instances or provider instances are bound, as their values could change between runs.
+        Snapshots are pickle files, they must only be loaded from trusted locations.
+        """
+        snapshot = InjectorSnapshot.load(path)
+        if snapshot is not None:
+            snapshot.restore_constructor_parameters()
+            return cls([SnapshotModule(binding_registry=snapshot.binding_registry)], options=options)
+        modules = modules_factory()
+        snapshot_module = SnapshotModule(modules)
+        injector = cls([snapshot_module], options=options)
+        InjectorSnapshot.create(snapshot_module).save(path, modules)
+        return injector
+
+    def create_child(self,
+                     modules: List[AbstractModule] = None,
+                     bindings: List[Binding] = None,
+                     options: InjectorOptions = None) -> "Injector":
+        """Creates an injector overriding some bindings of this one, only the overridden targets have new providers.
+
+        Targets bound in the child injector are injected by the child, the other ones are injected by this injector,
+        reusing its providers and singletons: they keep using the bindings of this injector for their own dependencies.
+        The child injector uses the options of this one unless options is set.
+        """
+        return Injector(modules, bindings, options, parent=self)
+
+    def validate(self) -> None:
+        """Prepares the providers of all bound targets, raises an exception if one of them cannot be injected.
+
+        Only useful with the lazy_providers option, as all providers are prepared in the constructor otherwise.
+        """
+        for target in self._root_state.binding_registry.get_bindings_by_target():
+            self._get_provider(target.type, target.named)
+
+    def get_dependency_graph(self) -> Optional[DependencyGraph]:
+        """Prepares the providers of all bound targets and returns their dependency graph, without creating instances.
+
+        Only available with the record_dependencies option. Scopes and the injector itself are left out.
+        The targets injected by the parent injectors are included if they also have the record_dependencies option.
+        """
+        if self._provider_creator.dependency_recorder is None:
+            return None
+        self.validate()
+        recorders = []
+        state = self._root_state
+        while state:
+            if state.provider_creator.dependency_recorder is not None:
+                recorders.append(state.provider_creator.dependency_recorder)
+            state = state.parent_state
+        return DependencyGraph.create(recorders, excluded_types=(Injector,))
+
+    def warm_up(self, max_workers: Optional[int] = None) -> None:
+        """Prepares all providers and instantiates all singletons, using a pool of max_workers threads.
+
+        Singletons are created concurrently as soon as all the singletons they depend on are created, these dependencies
+        are only known with the record_dependencies option: without it, the bound singletons are all created at once.
+        Raises a WarmUpError containing all the errors if some providers or singletons could not be created.
+        """
+        errors: List[Exception] = []
+        providers: List[Provider] = []
+        for target in self._root_state.binding_registry.get_bindings_by_target():
+            try:
+                providers.append(self._get_provider(target.type, target.named))
+            except InjectException as error:
+                errors.append(error)
+        errors.extend(SingletonWarmer(self._provider_creator.dependency_recorder).warm_up(providers, max_workers))
+        if errors:
+            raise WarmUpError(errors)
+
+    def compile(self) -> None:
+        """Flattens the providers of all bound targets into single callables, used by inject from now on.
+
+        Singletons that are already instantiated are replaced by their instance, call it after warming up the injector
+        to get the most out of it.
+        """
+        # Shared by all targets, so that each provider is compiled once
+        compiled_getters: Dict[Provider, Callable[[], Any]] = {}
+        for target in self._root_state.binding_registry.get_bindings_by_target():
+            provider = self._get_provider(target.type, target.named)
+            self._getter_by_target[(target.type, target.named)] = provider.compile(compiled_getters)
 
     def inject(self, target_type: Type[InjectedT], named: Optional[str] = None) -> InjectedT:
+        # Lock-free lookup, the providers are only created on the first injection of each target
+        getter = self._getter_by_target.get((target_type, named))
+        if getter is None:
+            getter = self._get_provider(target_type, named).get
+            self._getter_by_target[(target_type, named)] = getter
+        return getter()
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Closes the instances created by the scopes, such as singletons, in reverse creation order.
+
+        Instances are closed on the calling thread with their close method, or their __exit__ method if they are context
+        managers. If timeout is set, the instances left once closing took more than timeout seconds are not closed.
+        Errors are logged, not raised.
+        The injector must not be used once closed.
+        """
+        InstancesCloser(timeout).close(self._pop_created_instances())
+
+    async def aclose(self, timeout: Optional[float] = None) -> None:
+        """Same as close, but awaits the aclose or __aexit__ methods of the instances if they have one."""
+        await InstancesCloser(timeout).aclose(self._pop_created_instances())
+
+    def __enter__(self) -> "Injector":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "Injector":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+
+    def _pop_created_instances(self) -> List[Any]:
+        scopes_by_id: Dict[int, Scope] = {}
+        for target in self._root_state.binding_registry.get_bindings_by_target():
+            if isinstance(target.type, type) and issubclass(target.type, Scope):
+                scope = self.inject(target.type, target.named)
+                scopes_by_id[id(scope)] = scope
+        created_instances = [
+            created_instance
+            for scope in scopes_by_id.values()
+            for created_instance in scope.pop_created_instances()
+        ]
+        return [instance for _, instance in sorted(created_instances, key=lambda item: item[0], reverse=True)]
+
+    def scope(self, scope_type: Type[ScopeT]) -> ScopeT:
+        """Returns the instance bound to a scope class, e.g. `with injector.scope(RequestScope):`."""
+        return self.inject(scope_type)
+
+    async def inject_async(self, target_type: Type[InjectedT], named: Optional[str] = None) -> InjectedT:
+        """Injects a target asynchronously, awaiting AsyncProviders and getting dependencies concurrently."""
+        async_getter = self._async_getter_by_target.get((target_type, named))
+        if async_getter is None:
+            async_getter = self._get_provider(target_type, named).get_async
+            self._async_getter_by_target[(target_type, named)] = async_getter
+        return await async_getter()
+
+    def _get_provider(self, target_type: Type[InjectedT], named: Optional[str]) -> Provider[InjectedT]:
         injection_context = InjectionContext(Target(target_type, named), self._root_state)
-        return injection_context.get_provider().get()
+        return injection_context.get_provider()
+
+    @staticmethod
+    def _is_immediate(binding: RegisteredBinding) -> bool:
+        scope = getattr(binding.raw_binding, "scope", None)
+        return isinstance(scope, type) and issubclass(scope, ImmediateScope)
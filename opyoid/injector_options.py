@@ -1,6 +1,16 @@
+from typing import List
+
 import attr
 
+from .listeners.injection_listener import InjectionListener
+from .scope_mismatch_policy import ScopeMismatchPolicy
+
 
 @attr.s(auto_attribs=True)
 class InjectorOptions:
     auto_bindings: bool = False
+    lazy_providers: bool = False
+    listeners: List[InjectionListener] = attr.Factory(list)
+    profile_startup: bool = False
+    record_dependencies: bool = False
+    scope_mismatch: ScopeMismatchPolicy = ScopeMismatchPolicy.IGNORE
@@ -0,0 +1,200 @@
+import logging
+import os
+import pickle
+import sys
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+import attr
+
+from .bindings import AbstractModule, BindingRegistry, ClassBinding, InstanceBinding, ProviderBinding, \
+    RegisteredBinding, SelfBinding
+from .bindings.registered_multi_binding import RegisteredMultiBinding
+from .bindings.self_binding.constructor_parameters import ConstructorParameter, get_constructor_parameters, \
+    set_constructor_parameters
+from .provider import Provider
+
+# Increment when the pickled classes change
+SNAPSHOT_FORMAT_VERSION = 3
+
+
+class SnapshotModule(AbstractModule):
+    """Installs the modules to save in a snapshot, or contains the bindings of a loaded snapshot."""
+
+    def __init__(self,
+                 modules: Optional[List[AbstractModule]] = None,
+                 binding_registry: Optional[BindingRegistry] = None) -> None:
+        AbstractModule.__init__(self)
+        self._modules = modules or []
+        if binding_registry is not None:
+            self._binding_registry = binding_registry
+            self._is_configured = True
+
+    def configure(self) -> None:
+        for module in self._modules:
+            self.install(module)
+
+
+@attr.s(auto_attribs=True)
+class InjectorSnapshot:
+    """Bindings of the configured modules and parsed constructors, saved to skip the configuration on the next runs.
+
+    A snapshot is outdated as soon as one of the source files of its modules, bound classes or constructors changes.
+    Bound instances and provider instances are not saved, as they can depend on the environment (configuration, secrets,
+    files...) which would be frozen in the snapshot: modules binding them are configured on each run.
+    Snapshots are pickle files, they must only be loaded from trusted locations.
+    """
+
+    logger = logging.getLogger(__name__)
+
+    binding_registry: BindingRegistry
+    constructor_parameters: Dict[type, Tuple[Callable, Tuple[ConstructorParameter, ...]]] = attr.Factory(dict)
+
+    @classmethod
+    def create(cls, snapshot_module: SnapshotModule) -> "InjectorSnapshot":
+        constructor_parameters = {}
+        for bound_object in _get_bound_objects(snapshot_module.binding_registry, set()):
+            if isinstance(bound_object, type) and bound_object.__module__ != object.__module__:
+                try:
+                    constructor_parameters[bound_object] = (bound_object.__init__,
+                                                            get_constructor_parameters(bound_object))
+                except (TypeError, ValueError):
+                    # Not introspectable, parsed again when creating its provider
+                    pass
+        return cls(snapshot_module.binding_registry, constructor_parameters)
+
+    @classmethod
+    def load(cls, path: str) -> Optional["InjectorSnapshot"]:
+        """Returns the snapshot saved in path, or None if there is none or if it is outdated."""
+        try:
+            with open(path, "rb") as snapshot_file:
+                version, source_fingerprints = pickle.load(snapshot_file)
+                if version != _get_version() or source_fingerprints != _get_fingerprints(source_fingerprints):
+                    cls.logger.info(f"Injector snapshot {path} is outdated")
+                    return None
+                return pickle.load(snapshot_file)
+        except FileNotFoundError:
+            return None
+        except Exception as error:  # pylint: disable=broad-except
+            # The snapshot may reference classes that do not exist anymore
+            cls.logger.warning(f"Could not load injector snapshot {path}: {error!r}")
+            return None
+
+    def save(self, path: str, modules: List[AbstractModule]) -> None:
+        """Saves the snapshot in path, invalidated when the source files of modules or of the bindings change.
+
+        Nothing is saved if an instance or a provider instance is bound.
+        """
+        instance_binding = next(self._get_instance_bindings(), None)
+        if instance_binding is not None:
+            self.logger.warning(f"Could not save injector snapshot to {path}: {instance_binding.raw_binding!r} binds "
+                                f"an instance, it would be reused by the next runs")
+            return
+        source_files = {
+            source_file
+            for bound_object in self._get_fingerprinted_objects(modules)
+            for source_file in [_get_source_file(bound_object)]
+            if source_file
+        }
+        try:
+            snapshot_data = pickle.dumps(self)
+        except Exception as error:  # pylint: disable=broad-except
+            # Local classes and some instances cannot be pickled
+            self.logger.warning(f"Could not save injector snapshot to {path}: {error!r}")
+            return
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        with open(temporary_path, "wb") as snapshot_file:
+            pickle.dump((_get_version(), _get_fingerprints(source_files)), snapshot_file)
+            snapshot_file.write(snapshot_data)
+        # Atomic replacement, processes starting concurrently never load a partial snapshot
+        os.replace(temporary_path, path)
+
+    def restore_constructor_parameters(self) -> None:
+        for target_type, (constructor, parameters) in self.constructor_parameters.items():
+            set_constructor_parameters(target_type, constructor, parameters)
+
+    def _get_instance_bindings(self) -> Iterator[RegisteredBinding]:
+        for registered_binding in _get_registered_bindings(self.binding_registry, set()):
+            raw_binding = registered_binding.raw_binding
+            if isinstance(raw_binding, InstanceBinding) or \
+                    (isinstance(raw_binding, ProviderBinding) and isinstance(raw_binding.bound_provider, Provider)):
+                yield registered_binding
+
+    def _get_fingerprinted_objects(self, modules: List[AbstractModule]) -> Iterator[Any]:
+        yield from _get_module_types(modules)
+        yield from _get_bound_objects(self.binding_registry, set())
+        for target_type, (constructor, _) in self.constructor_parameters.items():
+            yield target_type
+            yield constructor
+
+
+def _get_module_types(modules: List[AbstractModule]) -> Iterator[type]:
+    for module in modules:
+        yield type(module)
+        yield from _get_module_types(module.installed_modules)
+
+
+def _get_bound_objects(binding_registry: BindingRegistry, visited_modules: Set[int]) -> Iterator[Any]:
+    for registered_binding in _get_registered_bindings(binding_registry, visited_modules):
+        yield from _get_registered_binding_objects(registered_binding)
+
+
+def _get_registered_bindings(binding_registry: BindingRegistry,
+                             visited_modules: Set[int]) -> Iterator[RegisteredBinding]:
+    """Returns the bindings of binding_registry, with their MultiBinding items and the bindings of their PrivateModules.
+    """
+    for registered_binding in binding_registry.get_bindings_by_target().values():
+        yield from _get_nested_bindings(registered_binding, visited_modules)
+
+
+def _get_nested_bindings(registered_binding: RegisteredBinding,
+                         visited_modules: Set[int]) -> Iterator[RegisteredBinding]:
+    yield registered_binding
+    if isinstance(registered_binding, RegisteredMultiBinding):
+        for item_binding in registered_binding.item_bindings:
+            yield from _get_nested_bindings(item_binding, visited_modules)
+    for private_module in registered_binding.source_path:
+        if id(private_module) not in visited_modules:
+            visited_modules.add(id(private_module))
+            yield from _get_registered_bindings(private_module.binding_registry, visited_modules)
+
+
+def _get_registered_binding_objects(registered_binding: RegisteredBinding) -> Iterator[Any]:
+    raw_binding = registered_binding.raw_binding
+    yield raw_binding.target.type
+    if isinstance(raw_binding, SelfBinding):
+        yield raw_binding.scope
+    elif isinstance(raw_binding, ClassBinding):
+        yield raw_binding.bound_type
+        yield raw_binding.scope
+    elif isinstance(raw_binding, ProviderBinding):
+        if isinstance(raw_binding.bound_provider, Provider):
+            yield type(raw_binding.bound_provider)
+        else:
+            yield raw_binding.bound_provider
+        yield raw_binding.scope
+    elif isinstance(raw_binding, InstanceBinding):
+        yield type(raw_binding.bound_instance)
+    if isinstance(registered_binding, RegisteredMultiBinding):
+        yield raw_binding.scope
+    for private_module in registered_binding.source_path:
+        yield type(private_module)
+
+
+def _get_source_file(bound_object: Any) -> Optional[str]:
+    module = sys.modules.get(getattr(bound_object, "__module__", None))
+    return getattr(module, "__file__", None)
+
+
+def _get_fingerprints(source_files) -> Dict[str, Optional[Tuple[int, int]]]:
+    fingerprints = {}
+    for source_file in source_files:
+        try:
+            file_stat = os.stat(source_file)
+            fingerprints[source_file] = (file_stat.st_mtime_ns, file_stat.st_size)
+        except OSError:
+            fingerprints[source_file] = None
+    return fingerprints
+
+
+def _get_version() -> Tuple[int, Tuple[int, ...]]:
+    return SNAPSHOT_FORMAT_VERSION, tuple(sys.version_info[:2])
@@ -0,0 +1,56 @@
+import asyncio
+import logging
+from time import monotonic
+from typing import Any, List, Optional
+
+from .scopes import close_instance, close_instance_async
+
+
+class InstancesCloser:
+    """Closes instances one after the other on the calling thread, within timeout seconds if set.
+
+    Once the timeout is exceeded, the instances left are not closed and are logged as errors. A synchronous close method
+    cannot be interrupted, an instance still closing when the timeout is exceeded is only reported.
+    """
+    logger = logging.getLogger(__name__)
+
+    def __init__(self, timeout: Optional[float] = None) -> None:
+        self._timeout = timeout
+
+    def close(self, instances: List[Any]) -> None:
+        deadline = self._get_deadline()
+        for index, instance in enumerate(instances):
+            if self._is_exceeded(deadline):
+                self._log_abandoned_instances(instances[index:])
+                return
+            try:
+                close_instance(instance)
+            except Exception as error:  # pylint: disable=broad-except
+                self.logger.error(f"Could not close {instance!r}: {error!r}")
+            if self._is_exceeded(deadline):
+                self.logger.error(f"Timed out closing {instance!r} after {self._timeout}s")
+
+    async def aclose(self, instances: List[Any]) -> None:
+        deadline = self._get_deadline()
+        for index, instance in enumerate(instances):
+            if self._is_exceeded(deadline):
+                self._log_abandoned_instances(instances[index:])
+                return
+            try:
+                timeout = None if deadline is None else deadline - monotonic()
+                await asyncio.wait_for(close_instance_async(instance), timeout)
+            except asyncio.TimeoutError:
+                self.logger.error(f"Timed out closing {instance!r} after {self._timeout}s")
+            except Exception as error:  # pylint: disable=broad-except
+                self.logger.error(f"Could not close {instance!r}: {error!r}")
+
+    def _get_deadline(self) -> Optional[float]:
+        return None if self._timeout is None else monotonic() + self._timeout
+
+    @staticmethod
+    def _is_exceeded(deadline: Optional[float]) -> bool:
+        return deadline is not None and monotonic() >= deadline
+
+    def _log_abandoned_instances(self, instances: List[Any]) -> None:
+        for instance in instances:
+            self.logger.error(f"Could not close {instance!r}: timed out after {self._timeout}s")
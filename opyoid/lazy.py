@@ -0,0 +1,39 @@
+from types import MethodType
+from typing import Any, Generic
+
+from .provider import Provider
+from .provider_proxy import ProviderProxy
+from .utils import EMPTY, InjectedT
+
+
+class Lazy(ProviderProxy, Generic[InjectedT]):
+    """Injected for Lazy[MyClass] targets, creates the MyClass instance on first use and forwards everything to it.
+
+    Once the instance is created, its methods are cached in the proxy and cost a plain attribute lookup.
+    The proxy is not an instance of MyClass.
+    """
+
+    def __init__(self, provider: Provider[InjectedT]) -> None:
+        ProviderProxy.__init__(self, provider)
+        object.__setattr__(self, "_opyoid_instance", EMPTY)
+
+    def _opyoid_get_instance(self) -> InjectedT:
+        instance = self._opyoid_instance
+        if instance is EMPTY:
+            instance = self._opyoid_provider.get()
+            object.__setattr__(self, "_opyoid_instance", instance)
+        return instance
+
+    def __getattr__(self, name: str) -> Any:
+        instance = self._opyoid_instance
+        if instance is EMPTY:
+            instance = self._opyoid_get_instance()
+        value = getattr(instance, name)
+        if type(value) is MethodType and value.__self__ is instance:  # pylint: disable=unidiomatic-typecheck
+            # Bound methods are found in the proxy dict from now on, without calling __getattr__
+            object.__setattr__(self, name, value)
+        return value
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        self.__dict__.pop(name, None)
+        setattr(self._opyoid_get_instance(), name, value)
@@ -0,0 +1,7 @@
+from .construction_listening_provider import ConstructionListeningProvider
+from .injection_event import InjectionEvent
+from .injection_listener import InjectionListener
+from .scope_listening_provider import ScopeListeningProvider
+from .scoped_provider_factory import create_scoped_provider
+from .startup_profiler import StartupProfiler
+from .startup_report import StartupReport, TimingNode
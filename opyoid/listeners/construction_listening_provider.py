@@ -0,0 +1,78 @@
+from contextvars import ContextVar, Token
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional
+
+from opyoid.provider import Provider
+from opyoid.target import Target
+from opyoid.utils import InjectedT
+from .injection_event import InjectionEvent
+from .injection_listener import InjectionListener
+
+
+class _CreationFlag:
+    """Mutable, so that the instances created by tasks started during the tracking are seen by the tracking context."""
+
+    __slots__ = ("created",)
+
+    def __init__(self) -> None:
+        self.created = False
+
+
+# Contexts hold their variables strongly, a single variable is shared by all providers. Nested trackings each set their
+# own flag, and restore the previous one when they stop.
+_creation_flag: "ContextVar[Optional[_CreationFlag]]" = ContextVar("opyoid_creation_flag", default=None)
+
+
+class ConstructionListeningProvider(Provider[InjectedT]):
+    """Notifies the listeners each time the inner provider creates an instance, if the listeners list is not empty."""
+
+    def __init__(self,
+                 inner_provider: Provider[InjectedT],
+                 target: Target,
+                 dependency_chain: List[Target],
+                 listeners: List[InjectionListener]) -> None:
+        self._inner_provider = inner_provider
+        self._target = target
+        self._dependency_chain = dependency_chain
+        self._listeners = listeners
+
+    def get(self) -> InjectedT:
+        if not self._listeners:
+            return self._inner_provider.get()
+        start_time = perf_counter()
+        instance = self._inner_provider.get()
+        self._notify(start_time)
+        return instance
+
+    async def get_async(self) -> InjectedT:
+        if not self._listeners:
+            return await self._inner_provider.get_async()
+        start_time = perf_counter()
+        instance = await self._inner_provider.get_async()
+        self._notify(start_time)
+        return instance
+
+    def _compile(self, compiled_getters: Dict[Provider, Callable[[], Any]]) -> Callable[[], InjectedT]:
+        if not self._listeners:
+            return self._inner_provider.compile(compiled_getters)
+        return self.get
+
+    @staticmethod
+    def track_creation() -> Token:
+        """Starts tracking the instance creations in the current context, returns the token to give to was_created."""
+        return _creation_flag.set(_CreationFlag())
+
+    @staticmethod
+    def was_created(token: Token) -> bool:
+        """Stops the tracking, returns True if an instance was created in the current context since track_creation."""
+        created = _creation_flag.get().created
+        _creation_flag.reset(token)
+        return created
+
+    def _notify(self, start_time: float) -> None:
+        creation_flag = _creation_flag.get()
+        if creation_flag is not None:
+            creation_flag.created = True
+        event = InjectionEvent(self._target, self._dependency_chain, perf_counter() - start_time, start_time)
+        for listener in self._listeners:
+            listener.on_instance_created(event)
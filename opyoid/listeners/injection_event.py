@@ -0,0 +1,19 @@
+from typing import List
+
+import attr
+
+from opyoid.target import Target
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class InjectionEvent:
+    """Sent to the listeners, duration is the wall-clock time in seconds, including the time spent on dependencies.
+
+    The dependency chain goes from the target to the injected root target, it is the one through which the provider of
+    the target was created. start_time is the time.perf_counter value when the event started.
+    """
+
+    target: Target
+    dependency_chain: List[Target]
+    duration: float
+    start_time: float = 0.
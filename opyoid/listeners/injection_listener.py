@@ -0,0 +1,20 @@
+from .injection_event import InjectionEvent
+
+
+class InjectionListener:
+    """Base class for injection listeners, override the methods of the events to listen to.
+
+    Listeners are called synchronously in the injecting thread, they should return quickly.
+    """
+
+    def on_provider_created(self, event: InjectionEvent) -> None:
+        """Called after creating the provider of a target."""
+
+    def on_instance_created(self, event: InjectionEvent) -> None:
+        """Called after creating an instance of a target, before its scope caches it."""
+
+    def on_scope_hit(self, event: InjectionEvent) -> None:
+        """Called when a scoped target is injected without creating a new instance."""
+
+    def on_scope_miss(self, event: InjectionEvent) -> None:
+        """Called when a scoped target is injected by creating a new instance."""
@@ -0,0 +1,71 @@
+from time import perf_counter
+from typing import Any, Callable, Dict, List
+
+from opyoid.provider import Provider
+from opyoid.target import Target
+from opyoid.utils import InjectedT
+from .construction_listening_provider import ConstructionListeningProvider
+from .injection_event import InjectionEvent
+from .injection_listener import InjectionListener
+
+
+class ScopeListeningProvider(Provider[InjectedT]):
+    """Notifies the listeners of the scope hits and misses of a scoped provider.
+
+    The listeners list can be emptied afterwards, e.g. once the startup is profiled, the scoped provider is then called
+    directly.
+    """
+
+    def __init__(self,
+                 scoped_provider: Provider[InjectedT],
+                 construction_provider: ConstructionListeningProvider[InjectedT],
+                 target: Target,
+                 dependency_chain: List[Target],
+                 listeners: List[InjectionListener]) -> None:
+        self._scoped_provider = scoped_provider
+        self._construction_provider = construction_provider
+        self._target = target
+        self._dependency_chain = dependency_chain
+        self._listeners = listeners
+
+    @property
+    def scoped_provider(self) -> Provider[InjectedT]:
+        return self._scoped_provider
+
+    def get(self) -> InjectedT:
+        if not self._listeners:
+            return self._scoped_provider.get()
+        token = self._construction_provider.track_creation()
+        start_time = perf_counter()
+        try:
+            instance = self._scoped_provider.get()
+        finally:
+            created = self._construction_provider.was_created(token)
+        self._notify(start_time, created)
+        return instance
+
+    async def get_async(self) -> InjectedT:
+        if not self._listeners:
+            return await self._scoped_provider.get_async()
+        token = self._construction_provider.track_creation()
+        start_time = perf_counter()
+        try:
+            instance = await self._scoped_provider.get_async()
+        finally:
+            created = self._construction_provider.was_created(token)
+        self._notify(start_time, created)
+        return instance
+
+    def _compile(self, compiled_getters: Dict[Provider, Callable[[], Any]]) -> Callable[[], InjectedT]:
+        if not self._listeners:
+            return self._scoped_provider.compile(compiled_getters)
+        return self.get
+
+    def _notify(self, start_time: float, created: bool) -> None:
+        event = InjectionEvent(self._target, self._dependency_chain, perf_counter() - start_time, start_time)
+        if created:
+            for listener in self._listeners:
+                listener.on_scope_miss(event)
+        else:
+            for listener in self._listeners:
+                listener.on_scope_hit(event)
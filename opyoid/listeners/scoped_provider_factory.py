@@ -0,0 +1,20 @@
+from opyoid.injection_context import InjectionContext
+from opyoid.provider import Provider
+from opyoid.scopes import Scope
+from opyoid.utils import InjectedT
+from .construction_listening_provider import ConstructionListeningProvider
+from .scope_listening_provider import ScopeListeningProvider
+
+
+def create_scoped_provider(scope: Scope,
+                           unscoped_provider: Provider[InjectedT],
+                           context: InjectionContext[InjectedT]) -> Provider[InjectedT]:
+    """Scopes a provider, notifying the injector listeners of its instance creations and scope hits if there are any."""
+    listeners = context.injection_state.options.listeners
+    if not listeners:
+        return scope.get_scoped_provider(unscoped_provider)
+    dependency_chain = context.dependency_chain
+    construction_provider = ConstructionListeningProvider(
+        unscoped_provider, context.target, dependency_chain, listeners)
+    scoped_provider = scope.get_scoped_provider(construction_provider)
+    return ScopeListeningProvider(scoped_provider, construction_provider, context.target, dependency_chain, listeners)
@@ -0,0 +1,62 @@
+import threading
+from time import perf_counter
+from typing import List, TYPE_CHECKING, Tuple
+
+from .injection_event import InjectionEvent
+from .injection_listener import InjectionListener
+from .startup_report import StartupReport, TimingNode
+
+if TYPE_CHECKING:
+    from opyoid.bindings import AbstractModule
+
+
+class StartupProfiler(InjectionListener):
+    """Records the provider and instance creations of the thread creating the injector, until it is stopped."""
+
+    def __init__(self) -> None:
+        self._thread_id = threading.get_ident()
+        self._start_time = perf_counter()
+        self._is_recording = True
+        self._provider_events: List[InjectionEvent] = []
+        self._instance_events: List[InjectionEvent] = []
+
+    def on_provider_created(self, event: InjectionEvent) -> None:
+        if self._is_recording and threading.get_ident() == self._thread_id:
+            self._provider_events.append(event)
+
+    def on_instance_created(self, event: InjectionEvent) -> None:
+        if self._is_recording and threading.get_ident() == self._thread_id:
+            self._instance_events.append(event)
+
+    def stop(self, root_module: "AbstractModule") -> StartupReport:
+        self._is_recording = False
+        return StartupReport(
+            perf_counter() - self._start_time,
+            [self._get_module_node(root_module)],
+            self._get_event_nodes(self._provider_events),
+            self._get_event_nodes(self._instance_events),
+        )
+
+    def _get_module_node(self, module: "AbstractModule") -> TimingNode:
+        return TimingNode(
+            repr(module),
+            module.configure_duration,
+            [self._get_module_node(installed_module) for installed_module in module.installed_modules],
+        )
+
+    @staticmethod
+    def _get_event_nodes(events: List[InjectionEvent]) -> List[TimingNode]:
+        """Nests the events in the events containing them, as they are all recorded in the same thread."""
+        root_nodes: List[TimingNode] = []
+        # Nodes being built with their end time, each one containing the next one
+        stack: List[Tuple[float, TimingNode]] = []
+        for event in sorted(events, key=lambda item: (item.start_time, -item.duration)):
+            while stack and stack[-1][0] <= event.start_time:
+                stack.pop()
+            node = TimingNode(repr(event.target), event.duration)
+            if stack:
+                stack[-1][1].children.append(node)
+            else:
+                root_nodes.append(node)
+            stack.append((event.start_time + event.duration, node))
+        return root_nodes
@@ -0,0 +1,77 @@
+import json
+from typing import Any, Dict, List
+
+import attr
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class TimingNode:
+    """Duration of a step in seconds, including the duration of its children steps."""
+
+    name: str
+    duration: float
+    children: List["TimingNode"] = attr.Factory(list)
+
+    @property
+    def self_duration(self) -> float:
+        return max(self.duration - sum(child.duration for child in self.children), 0.)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "duration": self.duration,
+            "children": [child.to_dict() for child in self.children],
+        }
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class StartupReport:
+    """Time spent creating an injector, in seconds.
+
+    modules contains the configuration of the root module and of all the installed modules, providers the creation of
+    the providers of each target and instances the creation of the ImmediateScope instances and their dependencies.
+    critical_path is the longest chain of instances by cumulative creation time, from the root instance.
+    """
+
+    total_duration: float
+    modules: List[TimingNode]
+    providers: List[TimingNode]
+    instances: List[TimingNode]
+
+    @property
+    def critical_path(self) -> List[TimingNode]:
+        path = []
+        nodes = self.instances
+        while nodes:
+            slowest_node = max(nodes, key=lambda node: node.duration)
+            path.append(slowest_node)
+            nodes = slowest_node.children
+        return path
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "total_duration": self.total_duration,
+            "modules": [node.to_dict() for node in self.modules],
+            "providers": [node.to_dict() for node in self.providers],
+            "instances": [node.to_dict() for node in self.instances],
+            "critical_path": [{"name": node.name, "duration": node.duration} for node in self.critical_path],
+        }
+
+    def to_json(self, indent: int = None) -> str:
+        return json.dumps(self.to_dict(), indent=indent)
+
+    def to_collapsed_stacks(self) -> str:
+        """Returns the self durations in microseconds in the collapsed stacks format used by flame graph tools."""
+        lines: List[str] = []
+        sections = (("configure", self.modules), ("providers", self.providers), ("instances", self.instances))
+        for section, nodes in sections:
+            for node in nodes:
+                self._add_collapsed_stacks(section, node, lines)
+        return "\n".join(lines)
+
+    def _add_collapsed_stacks(self, stack: str, node: TimingNode, lines: List[str]) -> None:
+        # Frames are separated by semicolons and end with a space, they cannot be in the names
+        stack = f"{stack};{node.name.replace(';', ',').replace(' ', '_')}"
+        lines.append(f"{stack} {round(node.self_duration * 1e6)}")
+        for child in node.children:
+            self._add_collapsed_stacks(stack, child, lines)
@@ -1,6 +1,7 @@
 from inspect import Parameter, Signature, signature
 from typing import Callable, Generic, Mapping, Type, TypeVar, cast
 
+from opyoid.constructor_parameters_cache import invalidate_constructor_parameters
 from opyoid.exceptions import NamedError
 
 WrappedT = TypeVar("WrappedT")
@@ -43,6 +44,7 @@ def named_arg(arg_name: str, name: str) -> Callable[[Callable], Callable]:
             new_parameter if parameter.name == arg_name else parameter
             for parameter in parameters.values()
         ])
+        invalidate_constructor_parameters(init)
         return init
 
     return wrapped_init
@@ -0,0 +1,54 @@
+from typing import Any, Generic, TYPE_CHECKING
+
+from .utils import InjectedT
+
+if TYPE_CHECKING:
+    from .scopes import PooledScopedProvider
+
+
+class PooledCheckout(Generic[InjectedT]):
+    """Context manager acquiring an instance from a pool on enter and releasing it on exit, also usable with async."""
+
+    __slots__ = ("_pool", "_instance")
+
+    def __init__(self, pool: "PooledScopedProvider[InjectedT]") -> None:
+        self._pool = pool
+        self._instance = None
+
+    def __enter__(self) -> InjectedT:
+        self._instance = self._pool.acquire()
+        return self._instance
+
+    def __exit__(self, *exc_info: Any) -> None:
+        instance, self._instance = self._instance, None
+        self._pool.release(instance)
+
+    async def __aenter__(self) -> InjectedT:
+        self._instance = await self._pool.acquire_async()
+        return self._instance
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self.__exit__(*exc_info)
+
+
+class Pooled(Generic[InjectedT]):
+    """Injected for Pooled[MyClass] targets, lends MyClass instances from the pool of a PooledScope binding."""
+
+    __slots__ = ("_pool",)
+
+    def __init__(self, pool: "PooledScopedProvider[InjectedT]") -> None:
+        self._pool = pool
+
+    def checkout(self) -> PooledCheckout[InjectedT]:
+        """Returns a context manager lending an instance for the duration of a with block."""
+        return PooledCheckout(self._pool)
+
+    def acquire(self) -> InjectedT:
+        """Takes an instance from the pool, it must be given back with release."""
+        return self._pool.acquire()
+
+    async def acquire_async(self) -> InjectedT:
+        return await self._pool.acquire_async()
+
+    def release(self, instance: InjectedT) -> None:
+        self._pool.release(instance)
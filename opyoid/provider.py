@@ -1,4 +1,4 @@
-from typing import Generic
+from typing import Any, Callable, Dict, Generic, Optional
 
 from opyoid.utils import InjectedT
 
@@ -8,3 +8,27 @@ class Provider(Generic[InjectedT]):
 
     def get(self) -> InjectedT:
         raise NotImplementedError
+
+    async def get_async(self) -> InjectedT:
+        """Asynchronous version of get, used by Injector.inject_async."""
+        return self.get()
+
+    def compile(self,
+                compiled_getters: Optional[Dict["Provider", Callable[[], Any]]] = None) -> Callable[[], InjectedT]:
+        """Returns a callable equivalent to get, flattening the nested providers calls when possible.
+
+        compiled_getters holds the callables already compiled, pass it when compiling several providers so that the
+        providers they share are compiled once.
+        """
+        if compiled_getters is None:
+            compiled_getters = {}
+        getter = compiled_getters.get(self)
+        if getter is None:
+            getter = self._compile(compiled_getters)
+            compiled_getters[self] = getter
+        return getter
+
+    def _compile(self, compiled_getters: Dict["Provider", Callable[[], Any]]) -> Callable[[], InjectedT]:
+        """Compiles this provider, its dependencies must be compiled with compiled_getters."""
+        # pylint: disable=unused-argument
+        return self.get
@@ -0,0 +1,70 @@
+from typing import Any
+
+from .provider import Provider
+
+
+class ProviderProxy:
+    """Forwards each attribute access and call to the instance returned by its provider at that time.
+
+    Comparisons, hashing, iteration, container methods and context managers are forwarded too, other special methods
+    such as operators are not.
+    """
+
+    __slots__ = ("_opyoid_provider",)
+
+    def __init__(self, provider: Provider) -> None:
+        object.__setattr__(self, "_opyoid_provider", provider)
+
+    def _opyoid_get_instance(self) -> Any:
+        return self._opyoid_provider.get()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._opyoid_get_instance(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._opyoid_get_instance(), name, value)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self._opyoid_get_instance()(*args, **kwargs)
+
+    def __iter__(self) -> Any:
+        return iter(self._opyoid_get_instance())
+
+    def __len__(self) -> int:
+        return len(self._opyoid_get_instance())
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._opyoid_get_instance()[key]
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self._opyoid_get_instance()
+
+    def __bool__(self) -> bool:
+        return bool(self._opyoid_get_instance())
+
+    def __eq__(self, other: Any) -> bool:
+        return self._opyoid_get_instance() == other
+
+    def __ne__(self, other: Any) -> bool:
+        return self._opyoid_get_instance() != other
+
+    def __hash__(self) -> int:
+        return hash(self._opyoid_get_instance())
+
+    def __enter__(self) -> Any:
+        return self._opyoid_get_instance().__enter__()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> Any:
+        return self._opyoid_get_instance().__exit__(exc_type, exc_val, exc_tb)
+
+    async def __aenter__(self) -> Any:
+        return await self._opyoid_get_instance().__aenter__()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> Any:
+        return await self._opyoid_get_instance().__aexit__(exc_type, exc_val, exc_tb)
+
+    def __str__(self) -> str:
+        return str(self._opyoid_get_instance())
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._opyoid_provider!r})"
@@ -1,38 +1,44 @@
-from typing import Dict
+from typing import Dict, Optional
 
-from .exceptions import NonInjectableTypeError
 from .frozen_target import FrozenTarget
 from .provider import Provider
+from .scopes import ScopeLifetime
 from .target import Target
+from .type_name_index import TypeNameIndex
 from .utils import InjectedT
 
 
 class ProviderRegistry:
-    """Stores Providers for each Target to create a cache."""
+    """Stores Providers for each Target to create a cache, with the lifetime of the instances they return."""
 
     def __init__(self):
         self._provider_by_target: Dict[FrozenTarget, Provider] = {}
+        # Only the known lifetimes are saved
+        self._lifetime_by_target: Dict[FrozenTarget, ScopeLifetime] = {}
+        self._type_name_index = TypeNameIndex()
 
     def __contains__(self, item: Target[InjectedT]) -> bool:
         return self.get_provider(item) is not None
 
-    def set_provider(self, target: Target[InjectedT], provider: Provider[InjectedT]) -> None:
-        frozen_target = FrozenTarget(target.type, target.named)
+    def set_provider(self,
+                     target: Target[InjectedT],
+                     provider: Provider[InjectedT],
+                     lifetime: Optional[ScopeLifetime] = None) -> None:
+        frozen_target = FrozenTarget.create(target.type, target.named)
         self._provider_by_target[frozen_target] = provider
+        if lifetime is not None:
+            self._lifetime_by_target[frozen_target] = lifetime
+        self._type_name_index.add(target.type)
 
     def get_provider(self, target: Target[InjectedT]) -> Provider[InjectedT]:
-        frozen_target = FrozenTarget(target.type, target.named)
-        if isinstance(target.type, str):
-            possible_target_types = list(set(
-                available_target.type
-                for available_target in self._provider_by_target
-                if isinstance(available_target.type, type)
-                and available_target.type.__name__ == target.type
-            ))
-            if len(possible_target_types) == 1:
-                # noinspection PyTypeChecker
-                frozen_target = FrozenTarget(possible_target_types[0], target.named)
-            elif possible_target_types:
-                raise NonInjectableTypeError(
-                    f"Could not find provider for '{target.type}': multiple types with this name found")
-        return self._provider_by_target.get(frozen_target)
+        return self._provider_by_target.get(self._get_frozen_target(target))
+
+    def get_lifetime(self, target: Target[InjectedT]) -> Optional[ScopeLifetime]:
+        """Returns the lifetime of the instances returned by the provider of a target, None if it is unknown."""
+        return self._lifetime_by_target.get(self._get_frozen_target(target))
+
+    def _get_frozen_target(self, target: Target[InjectedT]) -> FrozenTarget[InjectedT]:
+        target_type = target.type
+        if isinstance(target_type, str):
+            target_type = self._type_name_index.get_type(target_type) or target_type
+        return FrozenTarget.create(target_type, target.named)
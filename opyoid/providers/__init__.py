@@ -1 +1,2 @@
 from .provider_creator import ProviderCreator
+from .singleton_warmer import SingletonWarmer
@@ -0,0 +1,52 @@
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from opyoid.bindings import RegisteredBinding
+
+# Target and InjectionState of a provider, MultiBinding items also have the id of their binding as they are not cached
+RecordedTarget = Tuple
+
+
+class DependencyRecorder:
+    """Records the targets used by each target whose provider is created, to build the dependency graph.
+
+    Targets are recorded with their InjectionState, as the same target can be bound differently in each PrivateModule.
+    """
+
+    def __init__(self) -> None:
+        # Targets used by each target being created
+        self._dependencies_stack: List[Set[RecordedTarget]] = []
+        # Tuples take less memory than sets, only targets with dependencies are saved
+        self._dependencies_by_target: Dict[RecordedTarget, Tuple[RecordedTarget, ...]] = {}
+        self._binding_by_target: Dict[RecordedTarget, Optional[RegisteredBinding]] = {}
+
+    def start(self) -> None:
+        """Called before creating a provider, the targets used to create it are recorded until stop is called."""
+        self._dependencies_stack.append(set())
+
+    def stop(self) -> Set[RecordedTarget]:
+        """Returns the targets used since the last call to start."""
+        return self._dependencies_stack.pop()
+
+    def record(self,
+               target: RecordedTarget,
+               binding: Optional[RegisteredBinding],
+               dependencies: Set[RecordedTarget]) -> None:
+        """Saves a target whose provider was created, with its binding and the targets returned by stop."""
+        dependencies.discard(target)
+        if dependencies:
+            dependencies.update(self._dependencies_by_target.get(target, ()))
+            self._dependencies_by_target[target] = tuple(dependencies)
+        if self._binding_by_target.get(target) is None:
+            self._binding_by_target[target] = binding
+        if self._dependencies_stack:
+            self._dependencies_stack[-1].add(target)
+
+    def get_recorded_targets(self) -> Iterable[RecordedTarget]:
+        return self._binding_by_target.keys()
+
+    def get_binding(self, target: RecordedTarget) -> Optional[RegisteredBinding]:
+        """Returns the binding used to create the provider of a target, None if it was not created from a binding."""
+        return self._binding_by_target.get(target)
+
+    def get_dependencies(self, target: RecordedTarget) -> Tuple[RecordedTarget, ...]:
+        return self._dependencies_by_target.get(target, ())
@@ -1,13 +1,22 @@
 import logging
+from time import perf_counter
 from threading import RLock
-from typing import List
+from typing import Callable, List, Optional, Set, Tuple
 
-from opyoid.exceptions import NoBindingFound
+from opyoid.bindings import RegisteredBinding
+from opyoid.exceptions import CyclicDependencyError, NoBindingFound
+from opyoid.frozen_target import FrozenTarget
 from opyoid.injection_context import InjectionContext
+from opyoid.injection_state import InjectionState
+from opyoid.listeners import InjectionEvent
 from opyoid.provider import Provider
+from opyoid.scopes import ScopeLifetime, SingletonScope
+from opyoid.type_checker import TypeChecker
 from opyoid.utils import InjectedT
-from .providers_factories import FromBindingProviderFactory, FromCacheProviderFactory, OptionalProviderFactory, \
-    ProviderFactory, ProviderProviderFactory, SetProviderFactory, TupleProviderFactory, TypeProviderFactory
+from .dependency_recorder import DependencyRecorder
+from .providers_factories import FromBindingProviderFactory, FromCacheProviderFactory, LazyProviderFactory, \
+    OptionalProviderFactory, PooledProviderFactory, ProviderFactory, ProviderProviderFactory, SetProviderFactory, \
+    TupleProviderFactory, TypeProviderFactory
 from .providers_factories.jit_provider_factory import JitProviderFactory
 from .providers_factories.list_provider_factory import ListProviderFactory
 
@@ -17,7 +26,7 @@ class ProviderCreator:
 
     logger = logging.getLogger(__name__)
 
-    def __init__(self) -> None:
+    def __init__(self, record_dependencies: bool = False) -> None:
         self._provider_factories: List[ProviderFactory] = [
             FromCacheProviderFactory(),
             FromBindingProviderFactory(),
@@ -27,18 +36,134 @@ class ProviderCreator:
             OptionalProviderFactory(),
             TypeProviderFactory(),
             ProviderProviderFactory(),
+            LazyProviderFactory(),
+            PooledProviderFactory(),
             JitProviderFactory(),
         ]
         self._lock = RLock()
+        # Targets whose providers are being created, as the lock is held during the whole creation they all belong to
+        # the same dependency chain
+        self._targets_being_created: Set[Tuple[FrozenTarget, InjectionState]] = set()
+        # Lifetimes of the providers used by each target being created, unscoped targets take the shortest one
+        self._lifetimes_stack: List[List[Optional[ScopeLifetime]]] = []
+        self._dependency_recorder = DependencyRecorder() if record_dependencies else None
+
+    @property
+    def dependency_recorder(self) -> Optional[DependencyRecorder]:
+        """Records the dependency graph of the created providers, only set if record_dependencies is set."""
+        return self._dependency_recorder
 
     def get_provider(self, context: InjectionContext[InjectedT]) -> Provider[InjectedT]:
         with self._lock:
-            provider = self._get_provider(context)
-            context.injection_state.provider_registry.set_provider(context.target, provider)
+            target_key = (FrozenTarget.create(context.target.type, context.target.named), context.injection_state)
+            if target_key in self._targets_being_created:
+                self._raise_cyclic_dependency_error(context)
+            self._targets_being_created.add(target_key)
+            self._lifetimes_stack.append([])
+            recorder = self._dependency_recorder
+            if recorder:
+                recorder.start()
+            provider_registry = context.injection_state.provider_registry
+            is_cached = context.target in provider_registry
+            is_created = context.injection_state.options.listeners and not is_cached
+            start_time = perf_counter()
+            try:
+                provider = self._get_provider(context)
+            finally:
+                self._targets_being_created.remove(target_key)
+                dependency_lifetimes = self._lifetimes_stack.pop()
+                recorded_dependencies = recorder.stop() if recorder else None
+            if is_created:
+                self._notify_provider_created(context, start_time)
+            if is_cached:
+                # Its binding was recorded when the provider was created
+                binding = None
+                lifetime = provider_registry.get_lifetime(context.target)
+            else:
+                binding = self._get_binding(context)
+                lifetime = self._get_lifetime(context, binding, dependency_lifetimes)
+                provider_registry.set_provider(context.target, provider, lifetime)
+            if self._lifetimes_stack:
+                self._lifetimes_stack[-1].append(lifetime)
+            if recorder:
+                recorder.record(target_key, binding, recorded_dependencies)
+            return provider
+
+    def create_item_provider(self,
+                             context: InjectionContext[InjectedT],
+                             binding: RegisteredBinding,
+                             create_provider: Callable[[], Provider[InjectedT]]) -> Provider[InjectedT]:
+        """Creates the provider of a MultiBinding item, recording its dependencies if record_dependencies is set.
+
+        Item providers are not cached, and several items can share the same target, so there is no cycle detection here.
+        """
+        with self._lock:
+            recorder = self._dependency_recorder
+            if not recorder:
+                return create_provider()
+            recorder.start()
+            try:
+                provider = create_provider()
+            finally:
+                recorded_dependencies = recorder.stop()
+            recorded_target = (
+                FrozenTarget.create(context.target.type, context.target.named),
+                context.injection_state,
+                id(binding.raw_binding),
+            )
+            recorder.record(recorded_target, binding, recorded_dependencies)
             return provider
 
+    @staticmethod
+    def _notify_provider_created(context: InjectionContext[InjectedT], start_time: float) -> None:
+        duration = perf_counter() - start_time
+        event = InjectionEvent(context.target, context.dependency_chain, duration, start_time)
+        for listener in context.injection_state.options.listeners:
+            listener.on_provider_created(event)
+
     def _get_provider(self, context: InjectionContext[InjectedT]) -> Provider[InjectedT]:
         for provider_factory in self._provider_factories:
             if provider_factory.accept(context):
                 return provider_factory.create(context)
         raise NoBindingFound(f"Could not find any bindings for {context.target!r}")
+
+    @staticmethod
+    def _get_lifetime(context: InjectionContext[InjectedT],
+                      binding: Optional[RegisteredBinding],
+                      dependency_lifetimes: List[Optional[ScopeLifetime]]) -> Optional[ScopeLifetime]:
+        """Returns the lifetime of the instances of a target, None if it is unknown.
+
+        Unscoped targets such as Optional or Lazy live as long as their shortest-lived dependency, Provider, Pooled and
+        Type targets do not hold any instance.
+        """
+        if binding:
+            scope = getattr(binding.raw_binding, "scope", None)
+            return scope.lifetime if scope else None
+        target_type = context.target.type
+        if TypeChecker.is_provider(target_type) or TypeChecker.is_pooled(target_type) \
+                or TypeChecker.is_type(target_type):
+            return None
+        if not (TypeChecker.is_list(target_type) or TypeChecker.is_set(target_type)
+                or TypeChecker.is_tuple(target_type) or TypeChecker.is_optional(target_type)
+                or TypeChecker.is_lazy(target_type)):
+            # Auto bindings are SelfBindings with the default scope
+            return SingletonScope.lifetime
+        return min((lifetime for lifetime in dependency_lifetimes if lifetime is not None), default=None)
+
+    @staticmethod
+    def _get_binding(context: InjectionContext[InjectedT]) -> Optional[RegisteredBinding]:
+        state = context.injection_state
+        while state:
+            binding = state.binding_registry.get_binding(context.target)
+            if binding:
+                return binding
+            state = state.parent_state
+        return None
+
+    def _raise_cyclic_dependency_error(self, context: InjectionContext[InjectedT]) -> None:
+        dependency_chain = "\n".join(
+            f"-> {target!r}"
+            for target in context.dependency_chain
+        )
+        self.logger.error(f"Cyclic dependency detected, injection graph: \n{dependency_chain}")
+        raise CyclicDependencyError(f"Cyclic dependency detected, injection graph: \n{dependency_chain}")
@@ -1,6 +1,9 @@
 from .from_binding_provider_factory import FromBindingProviderFactory
 from .from_cache_provider_factory import FromCacheProviderFactory
+from .lazy_provider import LazyProvider
+from .lazy_provider_factory import LazyProviderFactory
 from .optional_provider_factory import OptionalProviderFactory
+from .pooled_provider_factory import PooledProviderFactory
 from .provider_factory import ProviderFactory
 from .provider_provider_factory import ProviderProviderFactory
 from .set_provider_factory import SetProviderFactory
@@ -0,0 +1,19 @@
+from typing import Any, Callable, Dict
+
+from opyoid.lazy import Lazy
+from opyoid.provider import Provider
+from opyoid.utils import InjectedT
+
+
+class LazyProvider(Provider[Lazy[InjectedT]]):
+    """Provides a new Lazy proxy each time, so that each dependent gets the instance it would have without proxy."""
+
+    def __init__(self, provider: Provider[InjectedT]) -> None:
+        self._provider = provider
+
+    def get(self) -> Lazy[InjectedT]:
+        return Lazy(self._provider)
+
+    def _compile(self, compiled_getters: Dict[Provider, Callable[[], Any]]) -> Callable[[], Lazy[InjectedT]]:
+        provider = self._provider
+        return lambda: Lazy(provider)
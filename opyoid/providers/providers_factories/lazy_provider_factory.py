@@ -0,0 +1,20 @@
+from opyoid.injection_context import InjectionContext
+from opyoid.lazy import Lazy
+from opyoid.provider import Provider
+from opyoid.target import Target
+from opyoid.type_checker import TypeChecker
+from opyoid.utils import InjectedT
+from .lazy_provider import LazyProvider
+from .provider_factory import ProviderFactory
+
+
+class LazyProviderFactory(ProviderFactory):
+    """Returns the provider for a lazy target, creating proxies around the provider of the proxied type."""
+
+    def accept(self, context: InjectionContext[InjectedT]) -> bool:
+        return TypeChecker.is_lazy(context.target.type)
+
+    def create(self, context: InjectionContext[Lazy[InjectedT]]) -> Provider[Lazy[InjectedT]]:
+        new_target = Target(context.target.type.__args__[0], context.target.named)
+        new_context = context.get_child_context(new_target)
+        return LazyProvider(new_context.get_provider())
@@ -0,0 +1,29 @@
+from opyoid.bindings import FromInstanceProvider
+from opyoid.exceptions import NonInjectableTypeError
+from opyoid.injection_context import InjectionContext
+from opyoid.listeners import ScopeListeningProvider
+from opyoid.pooled import Pooled
+from opyoid.provider import Provider
+from opyoid.scopes import PooledScopedProvider
+from opyoid.target import Target
+from opyoid.type_checker import TypeChecker
+from opyoid.utils import InjectedT
+from .provider_factory import ProviderFactory
+
+
+class PooledProviderFactory(ProviderFactory):
+    """Returns the provider for a pooled target, lending instances from the pool of the pooled type."""
+
+    def accept(self, context: InjectionContext[InjectedT]) -> bool:
+        return TypeChecker.is_pooled(context.target.type)
+
+    def create(self, context: InjectionContext[Pooled[InjectedT]]) -> Provider[Pooled[InjectedT]]:
+        new_target = Target(context.target.type.__args__[0], context.target.named)
+        new_context = context.get_child_context(new_target)
+        provider = new_context.get_provider()
+        if isinstance(provider, ScopeListeningProvider):
+            provider = provider.scoped_provider
+        if not isinstance(provider, PooledScopedProvider):
+            raise NonInjectableTypeError(f"Could not inject {context.target!r}: {new_target!r} is not bound in a "
+                                         f"PooledScope")
+        return FromInstanceProvider(Pooled(provider))
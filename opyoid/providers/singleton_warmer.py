@@ -0,0 +1,143 @@
+import logging
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, List, Optional, Set
+
+from opyoid.listeners import ScopeListeningProvider
+from opyoid.provider import Provider
+from opyoid.scopes import SingletonScopedProvider
+from .dependency_recorder import DependencyRecorder, RecordedTarget
+
+
+class SingletonWarmer:
+    """Instantiates singletons on a thread pool, each singleton being created once all its dependencies are created.
+
+    The dependencies of the singletons are known from the dependency recorder, without it only the given singletons are
+    created, concurrently, each one creating the singletons it depends on.
+    """
+
+    logger = logging.getLogger(__name__)
+
+    def __init__(self, dependency_recorder: Optional[DependencyRecorder]) -> None:
+        self._dependency_recorder = dependency_recorder
+
+    def warm_up(self, providers: List[Provider], max_workers: Optional[int] = None) -> List[Exception]:
+        """Instantiates all singletons used by these providers, returns the errors raised by their constructors.
+
+        Singletons depending on a singleton that could not be created are skipped.
+        """
+        dependencies_by_provider = self._get_dependencies_by_provider()
+        singleton_dependencies: Dict[int, Set[int]] = {}
+        singletons_by_id: Dict[int, Provider] = {}
+        for provider in providers:
+            self._find_singletons(provider, dependencies_by_provider, singleton_dependencies, singletons_by_id, {})
+        with ThreadPoolExecutor(max_workers) as executor:
+            return self._create_singletons(executor, singletons_by_id, singleton_dependencies)
+
+    def _get_dependencies_by_provider(self) -> Dict[Provider, List[Provider]]:
+        """Returns the providers used by each provider, from the targets saved by the dependency recorder."""
+        recorder = self._dependency_recorder
+        if recorder is None:
+            return {}
+        dependencies_by_provider: Dict[Provider, List[Provider]] = {}
+        for recorded_target in recorder.get_recorded_targets():
+            provider = self._get_recorded_provider(recorded_target)
+            if provider is None:
+                continue
+            dependencies = [
+                dependency
+                for dependency in self._get_recorded_dependencies(recorded_target)
+                # Bindings to other targets (e.g. ClassBindings) reuse the provider of this other target
+                if dependency is not provider
+            ]
+            if dependencies:
+                dependencies_by_provider.setdefault(provider, []).extend(dependencies)
+        return dependencies_by_provider
+
+    def _get_recorded_dependencies(self, recorded_target: RecordedTarget) -> List[Provider]:
+        """Returns the providers used by a recorded target, MultiBinding items are replaced by their dependencies."""
+        providers = []
+        for dependency_target in self._dependency_recorder.get_dependencies(recorded_target):
+            provider = self._get_recorded_provider(dependency_target)
+            if provider is None:
+                providers.extend(self._get_recorded_dependencies(dependency_target))
+            else:
+                providers.append(provider)
+        return providers
+
+    @staticmethod
+    def _get_recorded_provider(recorded_target: RecordedTarget) -> Optional[Provider]:
+        """Returns the cached provider of a recorded target, None for MultiBinding items as they are not cached."""
+        if len(recorded_target) != 2:
+            return None
+        target, injection_state = recorded_target
+        return injection_state.provider_registry.get_provider(target)
+
+    def _create_singletons(self,
+                           executor: ThreadPoolExecutor,
+                           singletons_by_id: Dict[int, Provider],
+                           singleton_dependencies: Dict[int, Set[int]]) -> List[Exception]:
+        """Submits each singleton to the executor once all its dependencies are created, returns the errors."""
+        dependents = self._get_dependents(singleton_dependencies)
+        missing_dependencies_count = {
+            singleton_id: len(dependency_ids)
+            for singleton_id, dependency_ids in singleton_dependencies.items()
+        }
+        errors: List[Exception] = []
+        singleton_ids_by_future: Dict[Future, int] = {
+            executor.submit(singletons_by_id[singleton_id].get): singleton_id
+            for singleton_id, count in missing_dependencies_count.items()
+            if count == 0
+        }
+        while singleton_ids_by_future:
+            done_futures, _ = wait(singleton_ids_by_future, return_when=FIRST_COMPLETED)
+            for future in done_futures:
+                singleton_id = singleton_ids_by_future.pop(future)
+                error = future.exception()
+                if error:
+                    self.logger.error(f"Could not create {singletons_by_id[singleton_id]!r}: {error!r}")
+                    errors.append(error)
+                    continue
+                for dependent_id in dependents[singleton_id]:
+                    missing_dependencies_count[dependent_id] -= 1
+                    if missing_dependencies_count[dependent_id] == 0:
+                        singleton_ids_by_future[executor.submit(singletons_by_id[dependent_id].get)] = dependent_id
+        return errors
+
+    @staticmethod
+    def _get_dependents(singleton_dependencies: Dict[int, Set[int]]) -> Dict[int, List[int]]:
+        dependents: Dict[int, List[int]] = {singleton_id: [] for singleton_id in singleton_dependencies}
+        for singleton_id, dependency_ids in singleton_dependencies.items():
+            for dependency_id in dependency_ids:
+                dependents[dependency_id].append(singleton_id)
+        return dependents
+
+    def _find_singletons(self,
+                         provider: Provider,
+                         dependencies_by_provider: Dict[Provider, List[Provider]],
+                         singleton_dependencies: Dict[int, Set[int]],
+                         singletons_by_id: Dict[int, Provider],
+                         nearest_singletons_by_id: Dict[int, Set[int]]) -> Set[int]:
+        """Returns the nearest singletons of the provider dependency graph, the provider itself if it is a singleton.
+
+        The dependencies of each singleton are saved in singleton_dependencies.
+        """
+        provider_id = id(provider)
+        if provider_id in nearest_singletons_by_id:
+            return nearest_singletons_by_id[provider_id]
+        nearest_dependencies: Set[int] = set()
+        for dependency in dependencies_by_provider.get(provider, []):
+            nearest_dependencies |= self._find_singletons(
+                dependency,
+                dependencies_by_provider,
+                singleton_dependencies,
+                singletons_by_id,
+                nearest_singletons_by_id,
+            )
+        scoped_provider = provider.scoped_provider if isinstance(provider, ScopeListeningProvider) else provider
+        if isinstance(scoped_provider, SingletonScopedProvider):
+            singletons_by_id[provider_id] = provider
+            singleton_dependencies[provider_id] = nearest_dependencies
+            nearest_singletons_by_id[provider_id] = {provider_id}
+        else:
+            nearest_singletons_by_id[provider_id] = nearest_dependencies
+        return nearest_singletons_by_id[provider_id]
@@ -0,0 +1,15 @@
+from enum import Enum
+
+
+class ScopeMismatchPolicy(Enum):
+    """What to do when a longer-lived instance depends on a shorter-lived one, e.g. a singleton on a per lookup class.
+
+    IGNORE injects the dependency as is, WARN does the same but logs a warning, STRICT raises a ScopeMismatchError and
+    AUTO_PROXY injects a proxy getting the dependency instance of the current thread, context or request from its
+    provider on each attribute access, it raises a ScopeMismatchError for per lookup and pooled dependencies.
+    """
+
+    IGNORE = "ignore"
+    WARN = "warn"
+    STRICT = "strict"
+    AUTO_PROXY = "auto_proxy"
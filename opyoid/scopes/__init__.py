@@ -1,6 +1,16 @@
+from .async_singleton_scope import AsyncSingletonScope
+from .async_singleton_scoped_provider import AsyncSingletonScopedProvider
+from .close_instance import close_instance, close_instance_async
+from .context_scope import ContextScope
+from .context_scoped_provider import ContextScopedProvider
 from .immediate_scope import ImmediateScope
 from .per_lookup_scope import PerLookupScope
+from .pooled_scope import PooledScope
+from .pooled_scoped_provider import PooledScopedProvider
+from .request_scope import RequestScope
+from .request_scoped_provider import RequestScopedProvider
 from .scope import Scope
+from .scope_lifetime import ScopeLifetime
 from .singleton_scope import SingletonScope
 from .singleton_scoped_provider import SingletonScopedProvider
 from .thread_scope import ThreadScope
@@ -0,0 +1,26 @@
+from typing import Any, List, Tuple
+
+from opyoid.provider import Provider
+from opyoid.utils import InjectedT
+from .async_singleton_scoped_provider import AsyncSingletonScopedProvider
+from .created_instances import CreatedInstances
+from .scope import Scope
+from .scope_lifetime import ScopeLifetime
+
+
+class AsyncSingletonScope(Scope):
+    """Always provides the same instance, created once even if multiple tasks inject it concurrently.
+
+    The created instances are disposed of when the injector is closed.
+    """
+
+    lifetime = ScopeLifetime.SINGLETON
+
+    def __init__(self) -> None:
+        self._created_instances = CreatedInstances()
+
+    def get_scoped_provider(self, inner_provider: Provider[InjectedT]) -> Provider[InjectedT]:
+        return AsyncSingletonScopedProvider(inner_provider, self._created_instances.add)
+
+    def pop_created_instances(self) -> List[Tuple[int, Any]]:
+        return self._created_instances.pop_all()
@@ -0,0 +1,46 @@
+import asyncio
+from typing import Callable, Optional, Union
+
+from opyoid.exceptions import NonInjectableTypeError
+from opyoid.provider import Provider
+from opyoid.utils import EMPTY, InjectedT
+
+
+class AsyncSingletonScopedProvider(Provider[InjectedT]):
+    """Always provides the same instance, created only once even when concurrent tasks inject it.
+
+    The instance must be injected asynchronously first, it can then be injected synchronously.
+    If set, on_created is called with the instance once it is cached.
+    """
+
+    def __init__(self,
+                 inner_provider: Provider[InjectedT],
+                 on_created: Optional[Callable[[InjectedT], None]] = None) -> None:
+        self._inner_provider = inner_provider
+        self._on_created = on_created
+        self._cached_instance: Union[InjectedT, object] = EMPTY
+        self._creation_task: Optional[asyncio.Future] = None
+
+    def get(self) -> InjectedT:
+        if self._cached_instance is EMPTY:
+            raise NonInjectableTypeError(f"{self._inner_provider!r} has not been created yet, use "
+                                         f"Injector.inject_async to inject it")
+        return self._cached_instance
+
+    async def get_async(self) -> InjectedT:
+        if self._cached_instance is not EMPTY:
+            return self._cached_instance
+        if self._creation_task is None:
+            self._creation_task = asyncio.ensure_future(self._create_instance())
+        # A cancelled task awaiting the instance must not cancel its creation for the other ones
+        return await asyncio.shield(self._creation_task)
+
+    async def _create_instance(self) -> InjectedT:
+        try:
+            self._cached_instance = await self._inner_provider.get_async()
+            if self._on_created:
+                self._on_created(self._cached_instance)
+        finally:
+            # Allows retrying if the creation failed
+            self._creation_task = None
+        return self._cached_instance
@@ -0,0 +1,21 @@
+from typing import Any
+
+
+def close_instance(instance: Any) -> None:
+    """Closes an instance with its close method if it has one, or its __exit__ method if it is a context manager."""
+    close = getattr(instance, "close", None)
+    if callable(close):
+        close()
+    elif hasattr(instance, "__exit__"):
+        instance.__exit__(None, None, None)
+
+
+async def close_instance_async(instance: Any) -> None:
+    """Closes an instance with its aclose method or its __aexit__ method if it has one, falls back to close_instance."""
+    aclose = getattr(instance, "aclose", None)
+    if callable(aclose):
+        await aclose()
+    elif hasattr(instance, "__aexit__"):
+        await instance.__aexit__(None, None, None)
+    else:
+        close_instance(instance)
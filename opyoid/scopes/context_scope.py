@@ -0,0 +1,14 @@
+from opyoid.provider import Provider
+from opyoid.utils import InjectedT
+from .context_scoped_provider import ContextScopedProvider
+from .scope import Scope
+from .scope_lifetime import ScopeLifetime
+
+
+class ContextScope(Scope):
+    """Always provides the same instance if called in the same context (e.g. asyncio task), creates a new one if not."""
+
+    lifetime = ScopeLifetime.CONTEXT
+
+    def get_scoped_provider(self, inner_provider: Provider[InjectedT]) -> Provider[InjectedT]:
+        return ContextScopedProvider(inner_provider)
@@ -0,0 +1,42 @@
+from contextvars import ContextVar
+from typing import Any
+from weakref import WeakKeyDictionary
+
+from opyoid.provider import Provider
+from opyoid.utils import EMPTY, InjectedT
+
+# Context variables are never garbage collected once set in a context, a single one is shared by all providers.
+# The mapping is copied when modified, so that the contexts copied beforehand keep their own instances.
+_instances_by_provider: "ContextVar[WeakKeyDictionary[Provider, Any]]" = ContextVar(
+    "opyoid_context_instances",
+    default=WeakKeyDictionary(),
+)
+
+
+class ContextScopedProvider(Provider[InjectedT]):
+    """Always provides the same instance if called in the same context (e.g. asyncio task), creates a new one if not.
+
+    A context copy, such as the one of a new asyncio task, shares the instances created before the copy and keeps the
+    ones it creates afterwards.
+    """
+
+    def __init__(self, inner_provider: Provider[InjectedT]) -> None:
+        self._inner_provider = inner_provider
+
+    def get(self) -> InjectedT:
+        cached_instance = _instances_by_provider.get().get(self, EMPTY)
+        if cached_instance is not EMPTY:
+            return cached_instance
+        return self._cache_instance(self._inner_provider.get())
+
+    async def get_async(self) -> InjectedT:
+        cached_instance = _instances_by_provider.get().get(self, EMPTY)
+        if cached_instance is not EMPTY:
+            return cached_instance
+        return self._cache_instance(await self._inner_provider.get_async())
+
+    def _cache_instance(self, injected_instance: InjectedT) -> InjectedT:
+        instances_by_provider = WeakKeyDictionary(_instances_by_provider.get())
+        instances_by_provider[self] = injected_instance
+        _instances_by_provider.set(instances_by_provider)
+        return injected_instance
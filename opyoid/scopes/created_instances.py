@@ -0,0 +1,18 @@
+import itertools
+from typing import Any, List, Tuple
+
+
+class CreatedInstances:
+    """Records instances with a creation sequence number shared by all recorders, to dispose of them in order."""
+
+    _sequence = itertools.count()
+
+    def __init__(self) -> None:
+        self._instances: List[Tuple[int, Any]] = []
+
+    def add(self, instance: Any) -> None:
+        self._instances.append((next(self._sequence), instance))
+
+    def pop_all(self) -> List[Tuple[int, Any]]:
+        instances, self._instances = self._instances, []
+        return instances
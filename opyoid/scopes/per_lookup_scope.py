@@ -1,10 +1,13 @@
 from opyoid.provider import Provider
 from opyoid.utils import InjectedT
 from .scope import Scope
+from .scope_lifetime import ScopeLifetime
 
 
 class PerLookupScope(Scope):
     """Provides a new instance every time."""
 
+    lifetime = ScopeLifetime.PER_LOOKUP
+
     def get_scoped_provider(self, inner_provider: Provider[InjectedT]) -> Provider[InjectedT]:
         return inner_provider
@@ -0,0 +1,56 @@
+from typing import Any, Callable, List, Optional, Tuple
+
+from opyoid.provider import Provider
+from opyoid.utils import InjectedT
+from .close_instance import close_instance
+from .created_instances import CreatedInstances
+from .pooled_scoped_provider import PooledScopedProvider
+from .scope import Scope
+from .scope_lifetime import ScopeLifetime
+
+
+class PooledScope(Scope):
+    """Lends instances from a pool per binding, for objects that are expensive to create and can be reused.
+
+    Inject Pooled[MyClass] and use `with pooled.checkout() as instance:` to return the instance to the pool after use,
+    injecting MyClass directly raises a NonInjectableTypeError. Up to max_size instances exist per binding, idle or
+    lent: once they are all lent, a checkout waits up to acquire_timeout seconds for one to be returned, then raises a
+    PoolExhaustedError. Instances idle for more than max_idle_time seconds are evicted. reset is called with each
+    returned instance, dispose with each evicted or discarded instance. Idle instances are disposed of when the
+    injector is closed.
+    """
+
+    lifetime = ScopeLifetime.PER_LOOKUP
+
+    def __init__(self,
+                 max_size: int = 8,
+                 max_idle_time: Optional[float] = None,
+                 reset: Optional[Callable[[Any], None]] = None,
+                 dispose: Optional[Callable[[Any], None]] = close_instance,
+                 acquire_timeout: Optional[float] = 30.) -> None:
+        self._max_size = max_size
+        self._max_idle_time = max_idle_time
+        self._reset = reset
+        self._dispose = dispose
+        self._acquire_timeout = acquire_timeout
+        self._scoped_providers: List[PooledScopedProvider] = []
+
+    def get_scoped_provider(self, inner_provider: Provider[InjectedT]) -> Provider[InjectedT]:
+        scoped_provider = PooledScopedProvider(
+            inner_provider,
+            self._max_size,
+            self._max_idle_time,
+            self._reset,
+            self._dispose,
+            self._acquire_timeout,
+        )
+        self._scoped_providers.append(scoped_provider)
+        return scoped_provider
+
+    def pop_created_instances(self) -> List[Tuple[int, Any]]:
+        # Pooled instances can only depend on instances created before them, they are closed first
+        idle_instances = CreatedInstances()
+        for scoped_provider in self._scoped_providers:
+            for instance in scoped_provider.pop_idle_instances():
+                idle_instances.add(instance)
+        return idle_instances.pop_all()
@@ -0,0 +1,192 @@
+import asyncio
+import logging
+from collections import deque
+from threading import Condition
+from time import monotonic
+from typing import Callable, Deque, List, Optional, Tuple
+
+from opyoid.exceptions import NonInjectableTypeError, PoolExhaustedError
+from opyoid.provider import Provider
+from opyoid.utils import EMPTY, InjectedT
+
+
+class PooledScopedProvider(Provider[InjectedT]):  # pylint: disable=too-many-instance-attributes
+    """Lends instances from a pool, creating new ones when no instance is idle.
+
+    Up to max_size instances exist at once, idle or lent: once max_size instances are lent, acquiring an instance waits
+    up to acquire_timeout seconds for one to be released, then raises a PoolExhaustedError. Instances idle for more
+    than max_idle_time seconds are evicted. reset is called with each released instance, dispose with each instance
+    leaving the pool.
+    """
+
+    logger = logging.getLogger(__name__)
+
+    def __init__(self,  # pylint: disable=too-many-arguments
+                 inner_provider: Provider[InjectedT],
+                 max_size: int,
+                 max_idle_time: Optional[float] = None,
+                 reset: Optional[Callable[[InjectedT], None]] = None,
+                 dispose: Optional[Callable[[InjectedT], None]] = None,
+                 acquire_timeout: Optional[float] = None) -> None:
+        self._inner_provider = inner_provider
+        self._max_size = max_size
+        self._max_idle_time = max_idle_time
+        self._reset = reset
+        self._dispose = dispose
+        self._acquire_timeout = acquire_timeout
+        self._condition = Condition()
+        # Release time and instance, the most recently released instances are on the right
+        self._idle_instances: Deque[Tuple[float, InjectedT]] = deque()
+        self._lent_count = 0
+        # Futures of the coroutines waiting for an instance to be released, with their event loop
+        self._async_waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+
+    def get(self) -> InjectedT:
+        """Pooled instances cannot be injected directly as they would never be released."""
+        raise NonInjectableTypeError(f"{self._inner_provider!r} is pooled and cannot be injected directly, inject "
+                                     f"Pooled[...] and check an instance out instead")
+
+    async def get_async(self) -> InjectedT:
+        return self.get()
+
+    def acquire(self) -> InjectedT:
+        deadline = self._get_deadline()
+        with self._condition:
+            while self._is_exhausted():
+                if not self._condition.wait(self._get_remaining_time(deadline)):
+                    raise self._create_exhausted_error()
+            evicted_instances = self._evict_idle_instances()
+            instance = self._lend_instance()
+        self._dispose_instances(evicted_instances)
+        if instance is not EMPTY:
+            return instance
+        try:
+            return self._inner_provider.get()
+        except Exception:
+            self._discard_lent_instance()
+            raise
+
+    async def acquire_async(self) -> InjectedT:
+        deadline = self._get_deadline()
+        loop = asyncio.get_event_loop()
+        while True:
+            with self._condition:
+                if not self._is_exhausted():
+                    evicted_instances = self._evict_idle_instances()
+                    instance = self._lend_instance()
+                    break
+                waiter = loop.create_future()
+                self._async_waiters.append((loop, waiter))
+            try:
+                await asyncio.wait_for(waiter, self._get_remaining_time(deadline))
+            except asyncio.TimeoutError:
+                raise self._create_exhausted_error()
+            finally:
+                with self._condition:
+                    if (loop, waiter) in self._async_waiters:
+                        self._async_waiters.remove((loop, waiter))
+        self._dispose_instances(evicted_instances)
+        if instance is not EMPTY:
+            return instance
+        try:
+            return await self._inner_provider.get_async()
+        except Exception:
+            self._discard_lent_instance()
+            raise
+
+    def release(self, instance: InjectedT) -> None:
+        """Gives an instance back to the pool, releasing an instance that is already idle does nothing."""
+        with self._condition:
+            is_idle = self._is_idle(instance)
+        if is_idle:
+            self._warn_released_twice(instance)
+            return
+        if self._reset:
+            try:
+                self._reset(instance)
+            except Exception as error:  # pylint: disable=broad-except
+                self.logger.error(f"Could not reset {instance!r}, it is discarded: {error!r}")
+                self._discard_lent_instance()
+                self._dispose_instances([instance])
+                return
+        with self._condition:
+            evicted_instances = self._evict_idle_instances()
+            # Checked again in the same critical section as the append, as the instance may have been released
+            # concurrently while it was reset
+            is_idle = self._is_idle(instance)
+            if not is_idle:
+                self._lent_count = max(self._lent_count - 1, 0)
+                # Instances that were not lent by this pool are only kept if there is room for them
+                if self._lent_count + len(self._idle_instances) < self._max_size:
+                    self._idle_instances.append((monotonic(), instance))
+                else:
+                    evicted_instances.append(instance)
+                self._notify_waiters()
+        if is_idle:
+            self._warn_released_twice(instance)
+        self._dispose_instances(evicted_instances)
+
+    def pop_idle_instances(self) -> List[InjectedT]:
+        with self._condition:
+            idle_instances = [instance for _, instance in self._idle_instances]
+            self._idle_instances.clear()
+        return idle_instances
+
+    def _get_deadline(self) -> Optional[float]:
+        return None if self._acquire_timeout is None else monotonic() + self._acquire_timeout
+
+    @staticmethod
+    def _get_remaining_time(deadline: Optional[float]) -> Optional[float]:
+        return None if deadline is None else max(deadline - monotonic(), 0)
+
+    def _create_exhausted_error(self) -> PoolExhaustedError:
+        return PoolExhaustedError(f"All {self._max_size} pooled instances are in use, none was released within "
+                                  f"{self._acquire_timeout}s")
+
+    def _is_exhausted(self) -> bool:
+        return not self._idle_instances and self._lent_count >= self._max_size
+
+    def _lend_instance(self) -> InjectedT:
+        """Returns the most recently released instance, EMPTY if no instance is idle and a new one must be created."""
+        self._lent_count += 1
+        return self._idle_instances.pop()[1] if self._idle_instances else EMPTY
+
+    def _discard_lent_instance(self) -> None:
+        with self._condition:
+            self._lent_count -= 1
+            self._notify_waiters()
+
+    def _notify_waiters(self) -> None:
+        self._condition.notify_all()
+        for loop, waiter in self._async_waiters:
+            loop.call_soon_threadsafe(_set_done, waiter)
+        self._async_waiters.clear()
+
+    def _warn_released_twice(self, instance: InjectedT) -> None:
+        self.logger.warning(f"{instance!r} was released twice, it is already in the pool")
+
+    def _is_idle(self, instance: InjectedT) -> bool:
+        # The pool is small, and instances may not be hashable
+        return any(idle_instance is instance for _, idle_instance in self._idle_instances)
+
+    def _evict_idle_instances(self) -> List[InjectedT]:
+        evicted_instances = []
+        if self._max_idle_time is not None:
+            min_release_time = monotonic() - self._max_idle_time
+            while self._idle_instances and self._idle_instances[0][0] < min_release_time:
+                evicted_instances.append(self._idle_instances.popleft()[1])
+        return evicted_instances
+
+    def _dispose_instances(self, instances: List[InjectedT]) -> None:
+        if not self._dispose:
+            return
+        for instance in instances:
+            try:
+                self._dispose(instance)
+            except Exception as error:  # pylint: disable=broad-except
+                self.logger.error(f"Could not dispose of {instance!r}: {error!r}")
+
+
+def _set_done(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
@@ -0,0 +1,43 @@
+import logging
+from contextvars import ContextVar
+from typing import Any, Callable, Optional
+
+from opyoid.provider import Provider
+from opyoid.utils import InjectedT
+from .request_scoped_provider import RequestCache, RequestScopedProvider
+from .scope import Scope
+from .scope_lifetime import ScopeLifetime
+
+
+class RequestScope(Scope):
+    """Always provides the same instance inside a `with request_scope:` block, creates a new one in each block.
+
+    Instances are released when the block exits, dispose is then called with each of them if set, in reverse creation
+    order. Blocks can be nested, asyncio tasks started inside a block share its instances.
+    """
+
+    lifetime = ScopeLifetime.REQUEST
+    logger = logging.getLogger(__name__)
+
+    def __init__(self, dispose: Optional[Callable[[Any], None]] = None) -> None:
+        self._dispose = dispose
+        self._current_request: ContextVar = ContextVar("current_request", default=None)
+
+    def get_scoped_provider(self, inner_provider: Provider[InjectedT]) -> Provider[InjectedT]:
+        return RequestScopedProvider(inner_provider, self._current_request)
+
+    def __enter__(self) -> "RequestScope":
+        request_cache = RequestCache()
+        request_cache.token = self._current_request.set(request_cache)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        request_cache: RequestCache = self._current_request.get()
+        self._current_request.reset(request_cache.token)
+        if self._dispose is None:
+            return
+        for instance in reversed(list(request_cache.instances.values())):
+            try:
+                self._dispose(instance)
+            except Exception as error:  # pylint: disable=broad-except
+                self.logger.error(f"Could not dispose of {instance!r}: {error!r}")
@@ -0,0 +1,49 @@
+from contextvars import ContextVar, Token
+from typing import Any, Dict, Optional
+
+import attr
+
+from opyoid.exceptions import NonInjectableTypeError
+from opyoid.provider import Provider
+from opyoid.utils import InjectedT
+
+
+@attr.s(auto_attribs=True)
+class RequestCache:
+    """Instances created in a RequestScope block, in creation order."""
+
+    token: Optional[Token] = None
+    instances: Dict[Provider, Any] = attr.Factory(dict)
+
+
+class RequestScopedProvider(Provider[InjectedT]):
+    """Always provides the same instance in the current RequestScope block, creates a new one in each block."""
+
+    def __init__(self, inner_provider: Provider[InjectedT], current_request: ContextVar) -> None:
+        self._inner_provider = inner_provider
+        self._current_request = current_request
+
+    def get(self) -> InjectedT:
+        request_cache = self._get_request_cache()
+        try:
+            return request_cache.instances[self]
+        except KeyError:
+            pass
+        injected_instance = self._inner_provider.get()
+        return request_cache.instances.setdefault(self, injected_instance)
+
+    async def get_async(self) -> InjectedT:
+        request_cache = self._get_request_cache()
+        try:
+            return request_cache.instances[self]
+        except KeyError:
+            pass
+        injected_instance = await self._inner_provider.get_async()
+        return request_cache.instances.setdefault(self, injected_instance)
+
+    def _get_request_cache(self) -> RequestCache:
+        request_cache = self._current_request.get()
+        if request_cache is None:
+            raise NonInjectableTypeError(f"{self._inner_provider!r} is request scoped and cannot be injected outside "
+                                         f"of a RequestScope block")
+        return request_cache
@@ -1,7 +1,20 @@
+from typing import Any, List, Optional, Tuple
+
 from opyoid.provider import Provider
 from opyoid.utils import InjectedT
+from .scope_lifetime import ScopeLifetime
 
 
 class Scope:
+    # Scopes without lifetime are not checked for scope mismatches
+    lifetime: Optional[ScopeLifetime] = None
+
     def get_scoped_provider(self, inner_provider: Provider[InjectedT]) -> Provider[InjectedT]:
         raise NotImplementedError
+
+    def pop_created_instances(self) -> List[Tuple[int, Any]]:
+        """Returns the instances to dispose of when closing the injector with their creation sequence number.
+
+        The returned instances are forgotten by the scope.
+        """
+        return []
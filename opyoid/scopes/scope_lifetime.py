@@ -0,0 +1,12 @@
+from enum import IntEnum
+
+
+class ScopeLifetime(IntEnum):
+    """How long the instances of a scope live, used to detect longer-lived instances depending on shorter-lived ones."""
+
+    PER_LOOKUP = 0
+    REQUEST = 1
+    # A context (e.g. an asyncio task) lives at most as long as the thread running it
+    CONTEXT = 2
+    THREAD = 3
+    SINGLETON = 4
@@ -1,11 +1,30 @@
+from threading import Lock
+from typing import Any, Callable, ContextManager, List, Tuple
+
 from opyoid.provider import Provider
 from opyoid.utils import InjectedT
+from .created_instances import CreatedInstances
 from .scope import Scope
+from .scope_lifetime import ScopeLifetime
 from .singleton_scoped_provider import SingletonScopedProvider
 
 
 class SingletonScope(Scope):
-    """Always provides the same instance."""
+    """Always provides the same instance.
+
+    lock_factory is called once per scoped provider to create the lock guarding the instance creation, by default each
+    provider has its own lock. Use a factory returning the same RLock to share a single lock in the whole scope.
+    The created instances are disposed of when the injector is closed.
+    """
+
+    lifetime = ScopeLifetime.SINGLETON
+
+    def __init__(self, lock_factory: Callable[[], ContextManager] = Lock) -> None:
+        self._lock_factory = lock_factory
+        self._created_instances = CreatedInstances()
 
     def get_scoped_provider(self, inner_provider: Provider[InjectedT]) -> Provider[InjectedT]:
-        return SingletonScopedProvider(inner_provider)
+        return SingletonScopedProvider(inner_provider, self._lock_factory(), self._created_instances.add)
+
+    def pop_created_instances(self) -> List[Tuple[int, Any]]:
+        return self._created_instances.pop_all()
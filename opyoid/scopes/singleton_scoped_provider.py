@@ -1,21 +1,71 @@
+import asyncio
 from threading import Lock
-from typing import Union
+from typing import Any, Callable, ContextManager, Dict, Optional, Union
 
 from opyoid.provider import Provider
 from opyoid.utils import EMPTY, InjectedT
 
 
 class SingletonScopedProvider(Provider[InjectedT]):
-    """Always provides the same instance."""
+    """Always provides the same instance.
 
-    def __init__(self, inner_provider: Provider[InjectedT]) -> None:
+    The lock is only used to create the instance, it is not acquired once the instance is cached.
+    When injected asynchronously, concurrent tasks of an event loop await the same creation, but tasks of different
+    event loops may create multiple instances, only the first one being kept.
+    If set, on_created is called with the instance once it is cached.
+    """
+
+    def __init__(self,
+                 inner_provider: Provider[InjectedT],
+                 lock: Optional[ContextManager] = None,
+                 on_created: Optional[Callable[[InjectedT], None]] = None) -> None:
         self._inner_provider = inner_provider
         self._cached_instance: Union[InjectedT, object] = EMPTY
-        self._lock = Lock()
+        self._lock = lock if lock is not None else Lock()
+        self._on_created = on_created
+        self._creation_tasks: Dict[asyncio.AbstractEventLoop, asyncio.Future] = {}
 
     def get(self) -> InjectedT:
+        cached_instance = self._cached_instance
+        if cached_instance is not EMPTY:
+            return cached_instance
         with self._lock:
             if self._cached_instance is EMPTY:
-                injected_instance = self._inner_provider.get()
-                self._cached_instance = injected_instance
+                self._cache_instance(self._inner_provider.get())
         return self._cached_instance
+
+    async def get_async(self) -> InjectedT:
+        cached_instance = self._cached_instance
+        if cached_instance is not EMPTY:
+            return cached_instance
+        loop = asyncio.get_event_loop()
+        with self._lock:
+            creation_task = self._creation_tasks.get(loop)
+            if creation_task is None:
+                creation_task = asyncio.ensure_future(self._create_instance_async(loop))
+                self._creation_tasks[loop] = creation_task
+        # A cancelled task awaiting the instance must not cancel its creation for the other ones
+        return await asyncio.shield(creation_task)
+
+    async def _create_instance_async(self, loop: asyncio.AbstractEventLoop) -> InjectedT:
+        try:
+            injected_instance = await self._inner_provider.get_async()
+        finally:
+            # Allows retrying if the creation failed
+            with self._lock:
+                del self._creation_tasks[loop]
+        with self._lock:
+            if self._cached_instance is EMPTY:
+                self._cache_instance(injected_instance)
+        return self._cached_instance
+
+    def _cache_instance(self, injected_instance: InjectedT) -> None:
+        self._cached_instance = injected_instance
+        if self._on_created:
+            self._on_created(injected_instance)
+
+    def _compile(self, compiled_getters: Dict[Provider, Callable[[], Any]]) -> Callable[[], InjectedT]:
+        if self._cached_instance is EMPTY:
+            return self.get
+        cached_instance = self._cached_instance
+        return lambda: cached_instance
@@ -1,11 +1,22 @@
+from typing import Any, Callable, Optional
+
 from opyoid.provider import Provider
 from opyoid.utils import InjectedT
 from .scope import Scope
+from .scope_lifetime import ScopeLifetime
 from .thread_scoped_provider import ThreadScopedProvider
 
 
 class ThreadScope(Scope):
-    """Always provides the same instance if called in the same thread, creates a new one if not."""
+    """Always provides the same instance if called in the same thread, creates a new one if not.
+
+    If set, dispose is called with each instance when its thread exits.
+    """
+
+    lifetime = ScopeLifetime.THREAD
+
+    def __init__(self, dispose: Optional[Callable[[Any], None]] = None) -> None:
+        self._dispose = dispose
 
     def get_scoped_provider(self, inner_provider: Provider[InjectedT]) -> Provider[InjectedT]:
-        return ThreadScopedProvider(inner_provider)
+        return ThreadScopedProvider(inner_provider, self._dispose)
@@ -1,21 +1,47 @@
 import threading
+import weakref
+from typing import Callable, Optional
 
 from opyoid.provider import Provider
 from opyoid.utils import InjectedT
 
 
+class _ThreadExitMarker:
+    """Stored in the thread local storage, garbage collected when the thread exits."""
+    pass
+
+
 class ThreadScopedProvider(Provider[InjectedT]):
-    """Always provides the same instance if called in the same thread, creates a new one if not."""
+    """Always provides the same instance if called in the same thread, creates a new one if not.
+
+    Instances are released when their thread exits, dispose is then called with each of them if set.
+    """
 
-    def __init__(self, inner_provider: Provider[InjectedT]) -> None:
+    def __init__(self,
+                 inner_provider: Provider[InjectedT],
+                 dispose: Optional[Callable[[InjectedT], None]] = None) -> None:
         self._inner_provider = inner_provider
-        self._lock = threading.Lock()
+        self._dispose = dispose
         self._local = threading.local()
 
     def get(self) -> InjectedT:
-        with self._lock:
-            try:
-                return self._local.cached_instance
-            except AttributeError:
-                self._local.cached_instance = self._inner_provider.get()
-        return self._local.cached_instance
+        try:
+            return self._local.cached_instance
+        except AttributeError:
+            pass
+        return self._cache_instance(self._inner_provider.get())
+
+    async def get_async(self) -> InjectedT:
+        try:
+            return self._local.cached_instance
+        except AttributeError:
+            pass
+        return self._cache_instance(await self._inner_provider.get_async())
+
+    def _cache_instance(self, injected_instance: InjectedT) -> InjectedT:
+        self._local.cached_instance = injected_instance
+        if self._dispose:
+            exit_marker = _ThreadExitMarker()
+            weakref.finalize(exit_marker, self._dispose, injected_instance)
+            self._local.exit_marker = exit_marker
+        return injected_instance
@@ -5,7 +5,7 @@ import attr
 from opyoid.utils import EMPTY, InjectedT, get_class_full_name
 
 
-@attr.s(auto_attribs=True, repr=False)
+@attr.s(auto_attribs=True, repr=False, slots=True)
 class Target(Generic[InjectedT]):
     """Identifies a class being injected."""
 
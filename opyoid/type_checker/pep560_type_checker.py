@@ -2,7 +2,9 @@
 # noinspection PyUnresolvedReferences,PyProtectedMember
 from typing import Type, Union, _GenericAlias
 
+from opyoid.lazy import Lazy
 from opyoid.named import Named
+from opyoid.pooled import Pooled
 from opyoid.provider import Provider
 
 
@@ -30,6 +32,16 @@ class Pep560TypeChecker:
         """Returns True if target_type is Provider[<Any>]"""
         return isinstance(target_type, _GenericAlias) and target_type.__origin__ == Provider
 
+    @staticmethod
+    def is_lazy(target_type: Type) -> bool:
+        """Returns True if target_type is Lazy[<Any>]"""
+        return isinstance(target_type, _GenericAlias) and target_type.__origin__ == Lazy
+
+    @staticmethod
+    def is_pooled(target_type: Type) -> bool:
+        """Returns True if target_type is Pooled[<Any>]"""
+        return isinstance(target_type, _GenericAlias) and target_type.__origin__ == Pooled
+
     @staticmethod
     def is_named(target_type: Type) -> bool:
         """Returns True if target_type is Named[<Any>]"""
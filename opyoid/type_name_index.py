@@ -0,0 +1,23 @@
+from typing import Dict, Optional, Set
+
+from .exceptions import NonInjectableTypeError
+
+
+class TypeNameIndex:
+    """Indexes types by name and qualified name, used to find the types from string annotations."""
+
+    def __init__(self) -> None:
+        self._types_by_name: Dict[str, Set[type]] = {}
+
+    def add(self, target_type: object) -> None:
+        if isinstance(target_type, type):
+            self._types_by_name.setdefault(target_type.__name__, set()).add(target_type)
+            self._types_by_name.setdefault(target_type.__qualname__, set()).add(target_type)
+
+    def get_type(self, type_name: str) -> Optional[type]:
+        """Returns the type with this name, None if there is none, raises a NonInjectableTypeError if there are several.
+        """
+        possible_types = self._types_by_name.get(type_name, ())
+        if len(possible_types) > 1:
+            raise NonInjectableTypeError(f"Could not find '{type_name}': multiple types with this name found")
+        return next(iter(possible_types), None)
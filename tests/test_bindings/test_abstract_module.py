@@ -55,6 +55,7 @@ class TestAbstractModule(unittest.TestCase):
             },
             self.module.binding_registry.get_bindings_by_target()
         )
+        self.assertEqual([module], self.module.installed_modules)
 
     def test_bind_class_to_itself(self):
         self.module.bind(MyType)
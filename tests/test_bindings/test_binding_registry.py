@@ -16,7 +16,8 @@ class MyType:
 
 
 class OtherType:
-    pass
+    class NestedType:
+        pass
 
 
 class TestBindingRegistry(unittest.TestCase):
@@ -110,6 +111,14 @@ class TestBindingRegistry(unittest.TestCase):
 
         self.assertEqual(self.my_type_named_binding, binding)
 
+    def test_get_binding_from_qualified_name_string(self):
+        nested_binding = create_autospec(Binding, spec_set=True)
+        nested_binding.target = FrozenTarget(OtherType.NestedType)
+        self.binding_registry.register(RegisteredBinding(nested_binding))
+        binding = self.binding_registry.get_binding(Target("OtherType.NestedType"))
+
+        self.assertEqual(RegisteredBinding(nested_binding), binding)
+
     def test_get_binding_from_unknown_string(self):
         binding = self.binding_registry.get_binding(Target("MyUnknownType"))
         self.assertIsNone(binding)
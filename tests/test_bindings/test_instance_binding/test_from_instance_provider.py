@@ -11,3 +11,7 @@ class TestFromInstanceProvider(unittest.TestCase):
     def test_get(self):
         provided_instance = self.provider.get()
         self.assertIs(self.instance, provided_instance)
+
+    def test_compile(self):
+        provided_instance = self.provider.compile()()
+        self.assertIs(self.instance, provided_instance)
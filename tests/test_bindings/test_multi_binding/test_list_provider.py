@@ -0,0 +1,24 @@
+import asyncio
+import unittest
+
+from opyoid.bindings import FromInstanceProvider, ListProvider
+
+
+class TestListProvider(unittest.TestCase):
+    def setUp(self):
+        self.provider = ListProvider([FromInstanceProvider("value_1"), FromInstanceProvider("value_2")])
+
+    def test_get(self):
+        self.assertEqual(["value_1", "value_2"], self.provider.get())
+
+    def test_compile(self):
+        compiled_provider = self.provider.compile()
+
+        self.assertEqual(["value_1", "value_2"], compiled_provider())
+        self.assertIsNot(compiled_provider(), compiled_provider())
+
+    def test_get_async(self):
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+
+        self.assertEqual(["value_1", "value_2"], loop.run_until_complete(self.provider.get_async()))
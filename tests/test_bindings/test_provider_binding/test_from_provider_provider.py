@@ -1,7 +1,7 @@
 import unittest
 from unittest.mock import create_autospec
 
-from opyoid.bindings import FromProviderProvider
+from opyoid.bindings import FromInstanceProvider, FromProviderProvider
 from opyoid.provider import Provider
 
 
@@ -11,3 +11,8 @@ class TestFromProviderProvider(unittest.TestCase):
         provider = FromProviderProvider(provider_provider)
         instance = provider.get()
         self.assertIs(instance, provider_provider.get.return_value.get.return_value)
+
+    def test_compile(self):
+        instance = object()
+        provider = FromProviderProvider(FromInstanceProvider(FromInstanceProvider(instance)))
+        self.assertIs(instance, provider.compile()())
@@ -0,0 +1,201 @@
+import unittest
+from threading import Thread
+from typing import List, Optional
+from unittest.mock import patch
+
+from opyoid import ContextScope, Injector, InjectorOptions, Module, PerLookupScope, PrivateModule, Provider, \
+    RequestScope, ScopeMismatchError, ScopeMismatchPolicy, SingletonScope, ThreadScope
+from opyoid.bindings.scope_mismatch_checker import ScopeMismatchChecker
+from opyoid.provider_proxy import ProviderProxy
+
+
+class MySession:
+    def get_self(self) -> "MySession":
+        return self
+
+
+class MyRepository:
+    def __init__(self, my_session: MySession) -> None:
+        self.my_session = my_session
+
+
+class MyOptionalRepository:
+    def __init__(self, my_session: Optional[MySession]) -> None:
+        self.my_session = my_session
+
+
+class MyProviderRepository:
+    def __init__(self, my_session_provider: Provider[MySession]) -> None:
+        self.my_session_provider = my_session_provider
+
+
+class MyConfig:
+    pass
+
+
+class MyConfigService:
+    def __init__(self, my_config: MyConfig) -> None:
+        self.my_config = my_config
+
+
+class MyOtherConfigService:
+    def __init__(self, my_config: MyConfig) -> None:
+        self.my_config = my_config
+
+
+class TestScopeMismatchChecker(unittest.TestCase):
+    def create_injector(self, policy: ScopeMismatchPolicy, *types: type) -> Injector:
+        class MyModule(Module):
+            def configure(self) -> None:
+                self.bind(MySession, scope=ThreadScope)
+                for my_type in types:
+                    self.bind(my_type)
+
+        return Injector([MyModule()], options=InjectorOptions(scope_mismatch=policy))
+
+    def test_strict_raises_error(self):
+        with self.assertRaises(ScopeMismatchError):
+            self.create_injector(ScopeMismatchPolicy.STRICT, MyRepository)
+
+    def test_strict_detects_mismatch_through_unscoped_targets(self):
+        with self.assertRaises(ScopeMismatchError):
+            self.create_injector(ScopeMismatchPolicy.STRICT, MyOptionalRepository)
+
+    def create_private_modules_injector(self, service_scope: type, reverse_order: bool) -> Injector:
+        class MySingletonConfigModule(PrivateModule):
+            def configure(self) -> None:
+                self.bind(MyConfig, scope=SingletonScope)
+                self.expose(self.bind(MyConfigService))
+
+        class MyPerLookupConfigModule(PrivateModule):
+            def configure(self) -> None:
+                self.bind(MyConfig, scope=PerLookupScope)
+                self.expose(self.bind(MyOtherConfigService, scope=service_scope))
+
+        modules = [MySingletonConfigModule(), MyPerLookupConfigModule()]
+        if reverse_order:
+            modules.reverse()
+        return Injector(modules, options=InjectorOptions(scope_mismatch=ScopeMismatchPolicy.STRICT))
+
+    def test_strict_checks_private_modules_bindings_separately(self):
+        for reverse_order in (False, True):
+            with self.subTest(reverse_order=reverse_order):
+                injector = self.create_private_modules_injector(PerLookupScope, reverse_order)
+
+                self.assertIsInstance(injector.inject(MyConfigService).my_config, MyConfig)
+
+    def test_strict_detects_mismatch_in_private_module(self):
+        for reverse_order in (False, True):
+            with self.subTest(reverse_order=reverse_order):
+                with self.assertRaises(ScopeMismatchError) as error:
+                    self.create_private_modules_injector(SingletonScope, reverse_order)
+
+                self.assertIn("MyOtherConfigService", str(error.exception))
+
+    def test_strict_detects_thread_scoped_instance_depending_on_context_scoped_one(self):
+        class MyModule(Module):
+            def configure(self) -> None:
+                self.bind(MySession, scope=ContextScope)
+                self.bind(MyRepository, scope=ThreadScope)
+
+        with self.assertRaises(ScopeMismatchError):
+            Injector([MyModule()], options=InjectorOptions(scope_mismatch=ScopeMismatchPolicy.STRICT))
+
+    def test_strict_accepts_context_scoped_instance_depending_on_thread_scoped_one(self):
+        class MyModule(Module):
+            def configure(self) -> None:
+                self.bind(MySession, scope=ThreadScope)
+                self.bind(MyRepository, scope=ContextScope)
+
+        injector = Injector([MyModule()], options=InjectorOptions(scope_mismatch=ScopeMismatchPolicy.STRICT))
+
+        self.assertIs(injector.inject(MySession), injector.inject(MyRepository).my_session)
+
+    def test_strict_accepts_providers(self):
+        injector = self.create_injector(ScopeMismatchPolicy.STRICT, MyProviderRepository)
+
+        self.assertIsInstance(injector.inject(MyProviderRepository).my_session_provider.get(), MySession)
+
+    def test_warn_logs_warning(self):
+        with self.assertLogs("opyoid", "WARNING") as logs:
+            injector = self.create_injector(ScopeMismatchPolicy.WARN, MyRepository)
+
+        self.assertIn("MyRepository is SingletonScope scoped and depends on", logs.output[0])
+        self.assertIsInstance(injector.inject(MyRepository).my_session, MySession)
+
+    def test_ignore_injects_dependency(self):
+        injector = self.create_injector(ScopeMismatchPolicy.IGNORE, MyRepository)
+
+        self.assertIsInstance(injector.inject(MyRepository).my_session, MySession)
+
+    def test_mismatches_are_ignored_by_default(self):
+        class MyModule(Module):
+            def configure(self) -> None:
+                self.bind(MySession, scope=ThreadScope)
+                self.bind(MyRepository)
+
+        with patch.object(ScopeMismatchChecker.logger, "warning") as warning_mock:
+            injector = Injector([MyModule()])
+
+        warning_mock.assert_not_called()
+        self.assertIsInstance(injector.inject(MyRepository).my_session, MySession)
+
+    def test_auto_proxy_injects_current_thread_instance(self):
+        injector = self.create_injector(ScopeMismatchPolicy.AUTO_PROXY, MyRepository)
+        repository = injector.inject(MyRepository)
+        thread_sessions = []
+        thread = Thread(target=lambda: thread_sessions.extend(
+            [repository.my_session.get_self(), injector.inject(MySession)]))
+        thread.start()
+        thread.join()
+
+        self.assertIsInstance(repository.my_session, ProviderProxy)
+        self.assertIs(injector.inject(MySession), repository.my_session.get_self())
+        self.assertIs(thread_sessions[1], thread_sessions[0])
+        self.assertIsNot(injector.inject(MySession), thread_sessions[0])
+
+    def test_auto_proxy_raises_error_for_per_lookup_dependencies(self):
+        class MyModule(Module):
+            def configure(self) -> None:
+                self.bind(MySession, scope=PerLookupScope)
+                self.bind(MyRepository)
+
+        with self.assertRaises(ScopeMismatchError):
+            Injector([MyModule()], options=InjectorOptions(scope_mismatch=ScopeMismatchPolicy.AUTO_PROXY))
+
+    def test_auto_proxy_injects_current_request_instance(self):
+        class MyModule(Module):
+            def configure(self) -> None:
+                self.bind(MySession, scope=RequestScope)
+                self.bind(MyRepository)
+
+        injector = Injector([MyModule()], options=InjectorOptions(scope_mismatch=ScopeMismatchPolicy.AUTO_PROXY))
+        repository = injector.inject(MyRepository)
+        with injector.scope(RequestScope):
+            first_session = repository.my_session.get_self()
+            self.assertIs(first_session, repository.my_session.get_self())
+        with injector.scope(RequestScope):
+            self.assertIsNot(first_session, repository.my_session.get_self())
+
+    def test_merged_multi_binding_items_are_checked(self):
+        class MyModule(Module):
+            def configure(self) -> None:
+                self.multi_bind(MySession, [self.bind_item(to_class=MySession)])
+                self.multi_bind(MySession, [self.bind_item(to_class=MySession)], scope=PerLookupScope,
+                                override_bindings=False)
+
+        with self.assertRaises(ScopeMismatchError):
+            Injector([MyModule()], options=InjectorOptions(scope_mismatch=ScopeMismatchPolicy.STRICT))
+
+    def test_auto_proxy_multi_binding_items(self):
+        class MyModule(Module):
+            def configure(self) -> None:
+                self.multi_bind(MySession, [self.bind_item(to_class=MySession)])
+                self.multi_bind(MySession, [self.bind_item(to_class=MySession)], scope=ThreadScope,
+                                override_bindings=False)
+
+        injector = Injector([MyModule()], options=InjectorOptions(scope_mismatch=ScopeMismatchPolicy.AUTO_PROXY))
+        my_sessions = injector.inject(List[MySession])
+
+        self.assertIsInstance(my_sessions[0], MySession)
+        self.assertIsInstance(my_sessions[1], ProviderProxy)
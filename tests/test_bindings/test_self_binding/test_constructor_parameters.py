@@ -0,0 +1,84 @@
+import gc
+import unittest
+from inspect import Parameter
+from weakref import ref
+
+from opyoid import named_arg
+from opyoid.bindings.self_binding.constructor_parameters import ConstructorParameter, get_constructor_parameters
+
+
+class MyType:
+    pass
+
+
+class MyParentType:
+    @named_arg("my_named_param", "my_name")
+    def __init__(self, my_param: "MyType", my_named_param: MyType, *args: int, my_kwarg: str = "default", **kwargs):
+        self.my_param = my_param
+        self.my_named_param = my_named_param
+        self.args = args
+        self.my_kwarg = my_kwarg
+        self.kwargs = kwargs
+
+
+class TestConstructorParameters(unittest.TestCase):
+    def test_get_constructor_parameters(self):
+        parameters = get_constructor_parameters(MyParentType)
+
+        self.assertEqual((
+            ConstructorParameter("my_param", Parameter.POSITIONAL_OR_KEYWORD, MyType),
+            ConstructorParameter("my_named_param", Parameter.POSITIONAL_OR_KEYWORD, MyType, "my_name"),
+            ConstructorParameter("args", Parameter.VAR_POSITIONAL, int),
+            ConstructorParameter("my_kwarg", Parameter.KEYWORD_ONLY, str, default="default"),
+        ), parameters)
+
+    def test_parameters_are_cached(self):
+        parameters_1 = get_constructor_parameters(MyParentType)
+        parameters_2 = get_constructor_parameters(MyParentType)
+
+        self.assertIs(parameters_1, parameters_2)
+
+    def test_default_constructor_has_no_parameters(self):
+        class MyOtherType:
+            pass
+
+        self.assertEqual((ConstructorParameter("args", Parameter.VAR_POSITIONAL),),
+                         get_constructor_parameters(MyOtherType))
+
+    def test_named_arg_invalidates_cached_parameters(self):
+        class MyOtherType:
+            def __init__(self, my_param: MyType):
+                self.my_param = my_param
+
+        get_constructor_parameters(MyOtherType)
+        named_arg("my_param", "my_name")(MyOtherType.__init__)
+
+        self.assertEqual((ConstructorParameter("my_param", Parameter.POSITIONAL_OR_KEYWORD, MyType, "my_name"),),
+                         get_constructor_parameters(MyOtherType))
+
+    def test_replaced_constructor_is_parsed_again(self):
+        class MyOtherType:
+            def __init__(self, my_param: MyType):
+                self.my_param = my_param
+
+        def new_init(self, my_other_param: str):
+            self.my_other_param = my_other_param
+
+        get_constructor_parameters(MyOtherType)
+        MyOtherType.__init__ = new_init
+
+        self.assertEqual((ConstructorParameter("my_other_param", Parameter.POSITIONAL_OR_KEYWORD, str),),
+                         get_constructor_parameters(MyOtherType))
+
+    def test_cached_parameters_do_not_keep_class_alive(self):
+        class MyOtherType(MyType):
+            def __init__(self, my_param: str):
+                super().__init__()
+                self.my_param = my_param
+
+        get_constructor_parameters(MyOtherType)
+        class_reference = ref(MyOtherType)
+        del MyOtherType
+        gc.collect()
+
+        self.assertIsNone(class_reference())
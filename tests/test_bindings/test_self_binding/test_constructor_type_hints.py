@@ -0,0 +1,56 @@
+import unittest
+from typing import List
+
+from opyoid.bindings.self_binding.constructor_type_hints import get_constructor_type_hints
+
+
+class MyType:
+    pass
+
+
+class MyParentType:
+    def __init__(self, my_param: "MyType", my_list_param: "List[MyType]", my_int_param: int):
+        self.my_param = my_param
+        self.my_list_param = my_list_param
+        self.my_int_param = my_int_param
+
+
+class TestConstructorTypeHints(unittest.TestCase):
+    def test_string_annotations_are_resolved(self):
+        type_hints = get_constructor_type_hints(MyParentType.__init__)
+
+        self.assertEqual({
+            "my_param": MyType,
+            "my_list_param": List[MyType],
+            "my_int_param": int,
+        }, type_hints)
+
+    def test_type_hints_are_cached(self):
+        type_hints_1 = get_constructor_type_hints(MyParentType.__init__)
+        type_hints_2 = get_constructor_type_hints(MyParentType.__init__)
+
+        self.assertIs(type_hints_1, type_hints_2)
+
+    def test_unresolvable_annotations_are_ignored(self):
+        class MyLocalType:
+            pass
+
+        class MyOtherType:
+            def __init__(self, my_param: "MyLocalType", my_other_param: "MyType", my_int_param: int):
+                self.my_param = my_param
+                self.my_other_param = my_other_param
+                self.my_int_param = my_int_param
+
+        type_hints = get_constructor_type_hints(MyOtherType.__init__)
+
+        self.assertEqual({"my_other_param": MyType, "my_int_param": int}, type_hints)
+        self.assertIsNotNone(MyLocalType)
+
+    def test_none_default_does_not_make_annotation_optional(self):
+        class MyOtherType:
+            def __init__(self, my_param: "MyType" = None):
+                self.my_param = my_param
+
+        type_hints = get_constructor_type_hints(MyOtherType.__init__)
+
+        self.assertEqual({"my_param": MyType}, type_hints)
@@ -1,7 +1,8 @@
+import asyncio
 import unittest
 from unittest.mock import create_autospec
 
-from opyoid.bindings import FromClassProvider
+from opyoid.bindings import FromClassProvider, FromInstanceProvider
 from opyoid.provider import Provider
 
 
@@ -42,3 +43,91 @@ class TestFromClassProvider(unittest.TestCase):
         self.assertIsInstance(instance, MyType)
         self.assertEqual(("value_1", "value_2", "value_3.1", "value_3.2"), instance.args)
         self.assertEqual({"kwarg_1": "value_4", "kwarg_2": "value_5"}, instance.kwargs)
+
+    def test_compile_with_args(self):
+        class MyType:
+            def __init__(self, *args, **kwargs):
+                self.args = args
+                self.kwargs = kwargs
+
+        provider = FromClassProvider(
+            MyType,
+            [FromInstanceProvider("value_1"), FromInstanceProvider("value_2")],
+            FromInstanceProvider(["value_3.1", "value_3.2"]),
+            {"kwarg_1": FromInstanceProvider("value_4"), "kwarg_2": FromInstanceProvider("value_5")}
+        )
+        instance = provider.compile()()
+        self.assertIsInstance(instance, MyType)
+        self.assertEqual(("value_1", "value_2", "value_3.1", "value_3.2"), instance.args)
+        self.assertEqual({"kwarg_1": "value_4", "kwarg_2": "value_5"}, instance.kwargs)
+
+    def test_get_async_with_args(self):
+        class MyType:
+            def __init__(self, *args, **kwargs):
+                self.args = args
+                self.kwargs = kwargs
+
+        provider = FromClassProvider(
+            MyType,
+            [FromInstanceProvider("value_1"), FromInstanceProvider("value_2")],
+            FromInstanceProvider(["value_3.1", "value_3.2"]),
+            {"kwarg_1": FromInstanceProvider("value_4"), "kwarg_2": FromInstanceProvider("value_5")}
+        )
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+
+        instance = loop.run_until_complete(provider.get_async())
+        self.assertIsInstance(instance, MyType)
+        self.assertEqual(("value_1", "value_2", "value_3.1", "value_3.2"), instance.args)
+        self.assertEqual({"kwarg_1": "value_4", "kwarg_2": "value_5"}, instance.kwargs)
+
+    def test_compile_compiles_shared_dependencies_once(self):
+        class MyType:
+            def __init__(self, arg_1, arg_2):
+                self.values = (arg_1, arg_2)
+
+        dependency_provider = FromClassProvider(MyType, [FromInstanceProvider(1)], None,
+                                                {"arg_2": FromInstanceProvider(2)})
+        provider = FromClassProvider(MyType, [dependency_provider], None, {"arg_2": dependency_provider})
+        compiled_getters = {}
+
+        instance = provider.compile(compiled_getters)()
+
+        self.assertEqual((1, 2), instance.values[0].values)
+        self.assertIsNot(instance.values[0], instance.values[1])
+        self.assertEqual({provider, dependency_provider}, {
+            compiled_provider
+            for compiled_provider in compiled_getters
+            if isinstance(compiled_provider, FromClassProvider)
+        })
+        self.assertIs(compiled_getters[dependency_provider], dependency_provider.compile(compiled_getters))
+
+    def test_constructor_code_is_shared_by_classes_with_same_parameters(self):
+        class MyType:
+            def __init__(self, arg_1, *args, kwarg_1):
+                self.values = (arg_1, args, kwarg_1)
+
+        class MyOtherType(MyType):
+            pass
+
+        provider = FromClassProvider(MyType, [FromInstanceProvider(1)], FromInstanceProvider([2, 3]),
+                                     {"kwarg_1": FromInstanceProvider(4)})
+        other_provider = FromClassProvider(MyOtherType, [FromInstanceProvider(5)], FromInstanceProvider([]),
+                                           {"kwarg_1": FromInstanceProvider(6)})
+
+        self.assertEqual((1, (2, 3), 4), provider.get().values)
+        self.assertEqual((5, (), 6), other_provider.get().values)
+        self.assertIs(provider.compile().__code__, other_provider.compile().__code__)
+
+    def test_constructor_code_depends_on_parameters(self):
+        class MyType:
+            def __init__(self, arg_1, kwarg_1=None):
+                self.values = (arg_1, kwarg_1)
+
+        provider = FromClassProvider(MyType, [FromInstanceProvider(1)], None, {})
+        other_provider = FromClassProvider(MyType, [FromInstanceProvider(2)], None,
+                                           {"kwarg_1": FromInstanceProvider(3)})
+
+        self.assertEqual((1, None), provider.compile()().values)
+        self.assertEqual((2, 3), other_provider.compile()().values)
+        self.assertIsNot(provider.compile().__code__, other_provider.compile().__code__)
@@ -19,6 +19,13 @@ class MyType:
         pass
 
 
+class MyForwardReferenceType:
+    @named_arg("my_named_param", "my_name")
+    def __init__(self, my_param: "List[MyType]", my_named_param: "MyType"):
+        self.my_param = my_param
+        self.my_named_param = my_named_param
+
+
 class TestSelfBindingToProviderAdapter(unittest.TestCase):
     def setUp(self):
         self.adapter = SelfBindingToProviderAdapter()
@@ -169,6 +176,28 @@ class TestSelfBindingToProviderAdapter(unittest.TestCase):
             call(self.context.get_child_context(Target(SingletonScope))),
         ], self.state.provider_creator.get_provider.call_args_list)
 
+    def test_create_provider_with_string_annotations(self):
+        mock_provider_1 = create_autospec(Provider)
+        mock_provider_1.get.return_value = ["my_arg_1"]
+        mock_provider_2 = create_autospec(Provider)
+        mock_provider_2.get.return_value = "my_arg_2"
+
+        self.state.provider_creator.get_provider.side_effect = [
+            mock_provider_1,
+            mock_provider_2,
+            self.mock_scope_provider,
+        ]
+
+        provider = self.adapter.create(RegisteredBinding(SelfBinding(MyForwardReferenceType)), self.context)
+        instance = provider.get()
+        self.assertEqual(["my_arg_1"], instance.my_param)
+        self.assertEqual("my_arg_2", instance.my_named_param)
+        self.assertEqual([
+            call(self.context.get_child_context(Target(List[MyType], "my_param"))),
+            call(self.context.get_child_context(Target(MyType, "my_name"))),
+            call(self.context.get_child_context(Target(SingletonScope))),
+        ], self.state.provider_creator.get_provider.call_args_list)
+
     def test_create_provider_with_named_args(self):
         class MyOtherType:
             @named_arg("arg", "my_name")
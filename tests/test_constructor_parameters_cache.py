@@ -0,0 +1,40 @@
+import unittest
+
+from opyoid.constructor_parameters_cache import cache_parameters, get_cached_parameters, \
+    invalidate_constructor_parameters
+
+
+class MyType:
+    def __init__(self, my_param: str):
+        self.my_param = my_param
+
+
+class MyOtherType(MyType):
+    pass
+
+
+class TestConstructorParametersCache(unittest.TestCase):
+    def tearDown(self) -> None:
+        invalidate_constructor_parameters(MyType.__init__)
+
+    def test_get_missing_parameters_returns_none(self):
+        self.assertIsNone(get_cached_parameters(MyType))
+
+    def test_get_cached_parameters(self):
+        cache_parameters(MyType, MyType.__init__, ("my_param",))
+
+        self.assertEqual(("my_param",), get_cached_parameters(MyType))
+
+    def test_parameters_of_another_constructor_are_ignored(self):
+        cache_parameters(MyType, object.__init__, ())
+
+        self.assertIsNone(get_cached_parameters(MyType))
+
+    def test_invalidate_removes_parameters_of_all_classes_using_constructor(self):
+        cache_parameters(MyType, MyType.__init__, ("my_param",))
+        cache_parameters(MyOtherType, MyType.__init__, ("my_param",))
+
+        invalidate_constructor_parameters(MyType.__init__)
+
+        self.assertIsNone(get_cached_parameters(MyType))
+        self.assertIsNone(get_cached_parameters(MyOtherType))
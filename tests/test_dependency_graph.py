@@ -0,0 +1,233 @@
+import json
+import unittest
+from typing import List, Optional
+
+from opyoid import DependencyEdge, Injector, InjectorOptions, Module, PerLookupScope, PrivateModule, Provider, \
+    SelfBinding, SingletonScope, ThreadScope
+from opyoid.frozen_target import FrozenTarget
+
+
+class MyType:
+    pass
+
+
+class MyOtherType:
+    pass
+
+
+class MyParentType:
+    def __init__(self, my_type: MyType, my_other_type: Optional[MyOtherType]) -> None:
+        self.my_type = my_type
+        self.my_other_type = my_other_type
+
+
+class MyRootType:
+    def __init__(self, my_parent_type: MyParentType, my_types: List[MyType]) -> None:
+        self.my_parent_type = my_parent_type
+        self.my_types = my_types
+
+
+class MyUnusedType:
+    def __init__(self, my_type_provider: Provider[MyType]) -> None:
+        self.my_type_provider = my_type_provider
+
+
+class MyConfig:
+    pass
+
+
+class MyConfigService:
+    def __init__(self, my_config: MyConfig) -> None:
+        self.my_config = my_config
+
+
+class MyOtherConfigService:
+    def __init__(self, my_config: MyConfig) -> None:
+        self.my_config = my_config
+
+
+class MySingletonConfigModule(PrivateModule):
+    def configure(self) -> None:
+        self.bind(MyConfig)
+        self.expose(self.bind(MyConfigService))
+
+
+class MyPerLookupConfigModule(PrivateModule):
+    def configure(self) -> None:
+        self.bind(MyConfig, scope=PerLookupScope)
+        self.expose(self.bind(MyOtherConfigService))
+
+
+class TestDependencyGraph(unittest.TestCase):
+    def setUp(self) -> None:
+        class MyModule(Module):
+            def configure(self) -> None:
+                self.bind(MyType, scope=PerLookupScope)
+                self.bind(MyOtherType, scope=ThreadScope)
+                self.bind(MyParentType)
+                self.bind(MyRootType)
+                self.bind(MyUnusedType)
+                self.multi_bind(MyType, [self.bind_item(to_class=MyType), self.bind_item(to_instance=MyType())])
+
+        self.options = InjectorOptions(lazy_providers=True, record_dependencies=True)
+        self.injector = Injector([MyModule()], options=self.options)
+        self.graph = self.injector.get_dependency_graph()
+        self.my_type_node = next(node for node in self.graph.get_nodes(MyType) if node.scope is PerLookupScope)
+
+    def test_nodes_contain_binding_kind_and_scope(self):
+        list_node = self.graph.get_node(List[MyType])
+        optional_node = self.graph.get_node(Optional[MyOtherType])
+
+        self.assertEqual(("SelfBinding", PerLookupScope, True),
+                         (self.my_type_node.kind, self.my_type_node.scope, self.my_type_node.bound))
+        self.assertEqual(("MultiBinding", SingletonScope), (list_node.kind, list_node.scope))
+        self.assertEqual(("Optional", None, False), (optional_node.kind, optional_node.scope, optional_node.bound))
+
+    def test_multi_binding_items_have_their_own_nodes(self):
+        item_nodes = self.graph.get_dependencies(List[MyType])
+
+        self.assertEqual([("SelfBinding", SingletonScope), ("InstanceBinding", None)],
+                         [(node.kind, node.scope) for node in item_nodes])
+        self.assertEqual(3, len(self.graph.get_nodes(MyType)))
+        with self.assertRaises(ValueError):
+            self.graph.get_node(MyType)
+
+    def test_edges_come_from_parameters_items_and_wrapped_types(self):
+        node = self.graph.get_node
+
+        self.assertIn(DependencyEdge(node(MyRootType), node(MyParentType), "parameter"), self.graph.edges)
+        self.assertIn(DependencyEdge(node(Optional[MyOtherType]), node(MyOtherType), "wrapped"), self.graph.edges)
+        self.assertEqual({"item"}, {edge.kind for edge in self.graph.edges if edge.source is node(List[MyType])})
+        self.assertEqual([self.my_type_node, node(Optional[MyOtherType])], self.graph.get_dependencies(MyParentType))
+        self.assertEqual([node(MyRootType)], self.graph.get_dependents(node(MyParentType)))
+
+    def test_scopes_and_injector_are_left_out(self):
+        self.assertEqual([], self.graph.get_nodes(SingletonScope))
+        self.assertEqual([], self.graph.get_nodes(Injector))
+        with self.assertRaises(KeyError):
+            self.graph.get_node(Injector)
+
+    def test_no_graph_without_record_dependencies_option(self):
+        self.assertIsNone(Injector().get_dependency_graph())
+
+    def test_private_modules_bindings_have_their_own_nodes(self):
+        injector = Injector([MySingletonConfigModule(), MyPerLookupConfigModule()], options=self.options)
+        graph = injector.get_dependency_graph()
+        singleton_config_node, per_lookup_config_node = graph.get_nodes(MyConfig)
+
+        self.assertEqual((SingletonScope, (f"{__name__}.MySingletonConfigModule",)),
+                         (singleton_config_node.scope, singleton_config_node.module_path))
+        self.assertEqual((PerLookupScope, (f"{__name__}.MyPerLookupConfigModule",)),
+                         (per_lookup_config_node.scope, per_lookup_config_node.module_path))
+        self.assertEqual([singleton_config_node], graph.get_dependencies(MyConfigService))
+        self.assertEqual([per_lookup_config_node], graph.get_dependencies(MyOtherConfigService))
+        self.assertEqual([(graph.get_node(MyOtherConfigService), per_lookup_config_node)],
+                         graph.get_scope_mismatches())
+
+    def test_child_injector_graph_contains_parent_targets(self):
+        class MyChildModule(Module):
+            def configure(self) -> None:
+                self.bind(MyRootType, scope=PerLookupScope)
+
+        child_injector = self.injector.create_child([MyChildModule()])
+        graph = child_injector.get_dependency_graph()
+
+        self.assertEqual([MyParentType, List[MyType]],
+                         [node.target.type for node in graph.get_dependencies(MyRootType)])
+        self.assertEqual([(MyType, PerLookupScope), (Optional[MyOtherType], None)],
+                         [(node.target.type, node.scope) for node in graph.get_dependencies(MyParentType)])
+        self.assertEqual([], graph.get_nodes(MyUnusedType))
+
+    def test_child_injector_graph_without_parent_dependencies(self):
+        parent_injector = Injector(bindings=[SelfBinding(MyType), SelfBinding(MyOtherType), SelfBinding(MyParentType)])
+        child_injector = parent_injector.create_child(bindings=[SelfBinding(MyRootType)], options=self.options)
+        graph = child_injector.get_dependency_graph()
+
+        self.assertEqual([MyParentType, List[MyType]],
+                         [node.target.type for node in graph.get_dependencies(MyRootType)])
+        self.assertEqual([], graph.get_dependencies(MyParentType))
+
+    def test_nothing_is_instantiated(self):
+        created_types = []
+
+        class MyTrackedType:
+            def __init__(self) -> None:
+                created_types.append(MyTrackedType)
+
+        class MyModule(Module):
+            def configure(self) -> None:
+                self.bind(MyTrackedType)
+
+        graph = Injector([MyModule()], options=self.options).get_dependency_graph()
+
+        self.assertEqual("SelfBinding", graph.get_node(MyTrackedType).kind)
+        self.assertEqual([], created_types)
+
+    def test_get_unreachable_nodes(self):
+        self.assertEqual([MyUnusedType],
+                         [node.target.type for node in self.graph.get_unreachable_nodes([MyRootType])])
+        self.assertEqual([], self.graph.get_unreachable_nodes([
+            self.graph.get_node(MyRootType),
+            FrozenTarget.create(MyUnusedType),
+        ]))
+
+    def test_auto_bound_targets(self):
+        injector = Injector(
+            bindings=[SelfBinding(MyParentType)],
+            options=InjectorOptions(auto_bindings=True, record_dependencies=True),
+        )
+        my_type_node = injector.get_dependency_graph().get_node(MyType, "my_type")
+
+        self.assertEqual(("AutoBinding", SingletonScope, False),
+                         (my_type_node.kind, my_type_node.scope, my_type_node.bound))
+
+    def test_get_fan_in_hotspots(self):
+        hotspots = self.graph.get_fan_in_hotspots(1)
+
+        self.assertEqual([(self.my_type_node, 2)], hotspots)
+
+    def test_get_scope_mismatches_ignores_providers(self):
+        mismatches = {
+            (node.target.type, dependency.target.type)
+            for node, dependency in self.graph.get_scope_mismatches()
+        }
+
+        self.assertEqual({
+            (MyParentType, MyType),
+            (MyParentType, MyOtherType),
+        }, mismatches)
+
+    def test_to_json(self):
+        graph_dict = json.loads(self.graph.to_json())
+        my_type_id = self.graph.nodes.index(self.my_type_node)
+        my_parent_type_id = self.graph.nodes.index(self.graph.get_node(MyParentType))
+
+        self.assertEqual({
+            "id": my_type_id,
+            "name": f"{__name__}.MyType",
+            "type": f"{__name__}.MyType",
+            "named": None,
+            "kind": "SelfBinding",
+            "scope": "PerLookupScope",
+            "module_path": [],
+        }, graph_dict["nodes"][my_type_id])
+        self.assertIn({
+            "source": my_parent_type_id,
+            "target": my_type_id,
+            "kind": "parameter",
+        }, graph_dict["edges"])
+
+    def test_to_dot(self):
+        dot = self.graph.to_dot()
+        my_type_id = self.graph.nodes.index(self.my_type_node)
+        my_parent_type_id = self.graph.nodes.index(self.graph.get_node(MyParentType))
+
+        self.assertTrue(dot.startswith("digraph opyoid {"))
+        self.assertIn(f'    n{my_type_id} [label="{__name__}.MyType\\nSelfBinding\\nPerLookupScope"];', dot)
+        self.assertIn(f'    n{my_parent_type_id} -> n{my_type_id} [label="parameter"];', dot)
+
+    def test_to_dot_shows_module_path(self):
+        graph = Injector([MySingletonConfigModule()], options=self.options).get_dependency_graph()
+
+        self.assertIn(f'    n0 [label="{__name__}.MyConfig\\nSelfBinding\\nSingletonScope\\n'
+                      f'{__name__}.MySingletonConfigModule"];', graph.to_dot())
@@ -0,0 +1,25 @@
+import pickle
+import unittest
+
+from opyoid.frozen_target import FrozenTarget
+
+
+class MyType:
+    pass
+
+
+class TestFrozenTarget(unittest.TestCase):
+    def test_create_returns_shared_instance(self):
+        frozen_target = FrozenTarget.create(MyType, "my_name")
+
+        self.assertIs(frozen_target, FrozenTarget.create(MyType, "my_name"))
+        self.assertIsNot(frozen_target, FrozenTarget.create(MyType))
+        self.assertEqual(FrozenTarget(MyType, "my_name"), frozen_target)
+
+    def test_unpickled_target_is_shared(self):
+        frozen_target = FrozenTarget.create(MyType)
+
+        self.assertIs(frozen_target, pickle.loads(pickle.dumps(frozen_target)))
+
+    def test_equal_targets_have_same_hash(self):
+        self.assertEqual(hash(FrozenTarget(MyType, "my_name")), hash(FrozenTarget.create(MyType, "my_name")))
@@ -1,13 +1,42 @@
+import asyncio
 import unittest
+from unittest.mock import create_autospec, patch
 
-from opyoid import Module, Injector
-from opyoid.bindings import InstanceBinding
+from opyoid import AsyncProvider, AsyncSingletonScope, ImmediateScope, Module, Injector, InjectorOptions, \
+    PerLookupScope, ProviderBinding, RequestScope, SelfBinding, Target
+from opyoid.bindings import FromClassProvider, InstanceBinding
+from opyoid.listeners import InjectionListener
+from opyoid.exceptions import NoBindingFound, NonInjectableTypeError, WarmUpError
+from opyoid.providers import ProviderCreator
 
 
 class MyType:
     pass
 
 
+class MyParentType:
+    def __init__(self, my_param: MyType):
+        self.my_param = my_param
+
+
+class MyAsyncProvider(AsyncProvider[MyType]):
+    async def get_async(self) -> MyType:
+        await asyncio.sleep(0)
+        return MyType()
+
+
+class MyResource:
+    closed_instances = []
+
+    def close(self):
+        MyResource.closed_instances.append(self)
+
+
+class MyParentResource(MyResource):
+    def __init__(self, resource: MyResource):
+        self.resource = resource
+
+
 class TestInjector(unittest.TestCase):
     def test_inject_from_binding(self):
         my_instance = MyType()
@@ -34,3 +63,343 @@ class TestInjector(unittest.TestCase):
             InstanceBinding(MyType, my_instance_2),
         ])
         self.assertIs(my_instance_2, injector.inject(MyType))
+
+    def test_inject_twice_does_not_use_provider_creator(self):
+        injector = Injector(bindings=[
+            SelfBinding(MyType),
+        ])
+        instance_1 = injector.inject(MyType)
+
+        with patch.object(ProviderCreator, "get_provider") as get_provider_mock:
+            instance_2 = injector.inject(MyType)
+
+        get_provider_mock.assert_not_called()
+        self.assertIs(instance_1, instance_2)
+
+    def test_inject_unbound_named_target_is_not_cached_on_error(self):
+        injector = Injector(bindings=[
+            SelfBinding(MyType),
+        ])
+
+        with self.assertRaises(NoBindingFound):
+            injector.inject(MyType, "my_name")
+        with self.assertRaises(NoBindingFound):
+            injector.inject(MyType, "my_name")
+
+    def test_lazy_providers_are_created_on_injection(self):
+        injector = Injector(bindings=[
+            SelfBinding(MyParentType),
+        ], options=InjectorOptions(lazy_providers=True))
+
+        with self.assertRaises(NonInjectableTypeError):
+            injector.inject(MyParentType)
+
+    def test_lazy_providers_keep_immediate_scope(self):
+        created_instances = []
+
+        class MyImmediateType:
+            def __init__(self):
+                created_instances.append(self)
+
+        injector = Injector(bindings=[
+            SelfBinding(MyImmediateType, scope=ImmediateScope),
+        ], options=InjectorOptions(lazy_providers=True))
+
+        self.assertEqual(1, len(created_instances))
+        self.assertIs(created_instances[0], injector.inject(MyImmediateType))
+
+    def test_validate_raises_exception_on_missing_binding(self):
+        injector = Injector(bindings=[
+            SelfBinding(MyParentType),
+        ], options=InjectorOptions(lazy_providers=True))
+
+        with self.assertRaises(NonInjectableTypeError):
+            injector.validate()
+
+    def test_warm_up_creates_singletons(self):
+        created_instances = []
+
+        class MyCountedType:
+            def __init__(self):
+                created_instances.append(self)
+
+        injector = Injector(bindings=[
+            SelfBinding(MyCountedType),
+        ], options=InjectorOptions(lazy_providers=True))
+        injector.warm_up()
+
+        self.assertEqual(1, len(created_instances))
+        self.assertIs(created_instances[0], injector.inject(MyCountedType))
+
+    def test_warm_up_reports_all_errors(self):
+        class MyFailingType:
+            def __init__(self):
+                raise ValueError("error")
+
+        injector = Injector(bindings=[
+            SelfBinding(MyParentType),
+            SelfBinding(MyFailingType),
+        ], options=InjectorOptions(lazy_providers=True))
+
+        with self.assertRaises(WarmUpError) as context_manager:
+            injector.warm_up()
+        self.assertEqual(2, len(context_manager.exception.errors))
+
+    def test_compile_keeps_singletons(self):
+        injector = Injector(bindings=[
+            SelfBinding(MyType),
+            SelfBinding(MyParentType),
+        ])
+        parent_instance = injector.inject(MyParentType)
+
+        injector.compile()
+
+        self.assertIs(parent_instance, injector.inject(MyParentType))
+        self.assertIs(parent_instance.my_param, injector.inject(MyType))
+
+    def test_compile_creates_per_lookup_instances(self):
+        injector = Injector(bindings=[
+            SelfBinding(MyType),
+            SelfBinding(MyParentType, scope=PerLookupScope),
+        ])
+        injector.compile()
+
+        parent_instance_1 = injector.inject(MyParentType)
+        parent_instance_2 = injector.inject(MyParentType)
+
+        self.assertIsInstance(parent_instance_1, MyParentType)
+        self.assertIsNot(parent_instance_1, parent_instance_2)
+        self.assertIs(parent_instance_1.my_param, parent_instance_2.my_param)
+
+    def test_compile_compiles_shared_per_lookup_dependencies_once(self):
+        class MySharedType:
+            pass
+
+        class MyFirstParentType:
+            def __init__(self, shared_1: MySharedType, shared_2: MySharedType):
+                self.shared_1 = shared_1
+                self.shared_2 = shared_2
+
+        class MySecondParentType:
+            def __init__(self, shared: MySharedType):
+                self.shared = shared
+
+        injector = Injector(bindings=[
+            SelfBinding(MySharedType, scope=PerLookupScope),
+            SelfBinding(MyFirstParentType, scope=PerLookupScope),
+            SelfBinding(MySecondParentType, scope=PerLookupScope),
+        ])
+
+        # pylint: disable=protected-access
+        with patch.object(FromClassProvider, "_compile", autospec=True,
+                          side_effect=FromClassProvider._compile) as compile_mock:
+            injector.compile()
+
+        compiled_types = [call_args[0][0]._injected_type for call_args in compile_mock.call_args_list]
+        self.assertCountEqual([MySharedType, MyFirstParentType, MySecondParentType], compiled_types)
+        first_parent = injector.inject(MyFirstParentType)
+        self.assertIsInstance(first_parent.shared_1, MySharedType)
+        self.assertIsNot(first_parent.shared_1, first_parent.shared_2)
+        self.assertIsNot(first_parent.shared_1, injector.inject(MySecondParentType).shared)
+
+    def test_inject_async_awaits_async_providers(self):
+        injector = Injector(bindings=[
+            ProviderBinding(MyType, MyAsyncProvider, scope=AsyncSingletonScope),
+            SelfBinding(MyParentType),
+        ])
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+
+        parent_instance = loop.run_until_complete(injector.inject_async(MyParentType))
+
+        self.assertIsInstance(parent_instance, MyParentType)
+        self.assertIs(parent_instance.my_param, loop.run_until_complete(injector.inject_async(MyType)))
+        self.assertIs(parent_instance, injector.inject(MyParentType))
+
+    def test_inject_async_provider_synchronously_raises_non_injectable_type_error(self):
+        injector = Injector(bindings=[
+            ProviderBinding(MyType, MyAsyncProvider()),
+        ])
+
+        with self.assertRaises(NonInjectableTypeError):
+            injector.inject(MyType)
+
+    def test_scope_returns_bound_scope_instance(self):
+        injector = Injector(bindings=[
+            SelfBinding(MyType, scope=RequestScope),
+        ])
+
+        with injector.scope(RequestScope):
+            instance_1 = injector.inject(MyType)
+            self.assertIs(instance_1, injector.inject(MyType))
+        with injector.scope(RequestScope):
+            instance_2 = injector.inject(MyType)
+
+        self.assertIsInstance(instance_1, MyType)
+        self.assertIsNot(instance_1, instance_2)
+
+    def test_close_closes_singletons_in_reverse_creation_order(self):
+        MyResource.closed_instances = []
+        injector = Injector(bindings=[
+            SelfBinding(MyResource),
+            SelfBinding(MyParentResource),
+        ])
+        parent_instance = injector.inject(MyParentResource)
+
+        injector.close()
+        injector.close()
+
+        self.assertEqual([parent_instance, parent_instance.resource], MyResource.closed_instances)
+
+    def test_exiting_injector_closes_singletons(self):
+        MyResource.closed_instances = []
+        with Injector(bindings=[SelfBinding(MyResource, scope=ImmediateScope)]) as injector:
+            instance = injector.inject(MyResource)
+
+        self.assertEqual([instance], MyResource.closed_instances)
+
+    def test_close_ignores_per_lookup_instances(self):
+        MyResource.closed_instances = []
+        injector = Injector(bindings=[SelfBinding(MyResource, scope=PerLookupScope)])
+        injector.inject(MyResource)
+
+        injector.close()
+
+        self.assertEqual([], MyResource.closed_instances)
+
+    def test_aclose_closes_singletons(self):
+        MyResource.closed_instances = []
+        injector = Injector(bindings=[SelfBinding(MyResource)])
+        instance = injector.inject(MyResource)
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+
+        loop.run_until_complete(injector.aclose())
+
+        self.assertEqual([instance], MyResource.closed_instances)
+
+    def test_child_injector_overrides_bindings(self):
+        parent_injector = Injector(bindings=[
+            InstanceBinding(str, "parent"),
+            InstanceBinding(int, 1),
+        ])
+
+        child_injector = parent_injector.create_child(bindings=[InstanceBinding(str, "child")])
+
+        self.assertEqual("child", child_injector.inject(str))
+        self.assertEqual(1, child_injector.inject(int))
+        self.assertEqual("parent", parent_injector.inject(str))
+
+    def test_child_injector_reuses_parent_providers_and_singletons(self):
+        parent_injector = Injector(bindings=[
+            SelfBinding(MyType),
+            SelfBinding(MyParentType),
+        ])
+        parent_instance = parent_injector.inject(MyParentType)
+
+        child_injector = parent_injector.create_child(bindings=[InstanceBinding(str, "child")])
+        child_parent_instance = child_injector.inject(MyParentType)
+
+        self.assertIs(parent_instance, child_parent_instance)
+        self.assertIs(parent_instance.my_param, child_injector.inject(MyType))
+
+    def test_child_injector_uses_parent_providers(self):
+        listener = create_autospec(InjectionListener, spec_set=True)
+        parent_injector = Injector(bindings=[
+            SelfBinding(MyType),
+            SelfBinding(MyParentType, scope=PerLookupScope),
+        ], options=InjectorOptions(listeners=[listener]))
+
+        child_injector = parent_injector.create_child(bindings=[InstanceBinding(str, "child")],
+                                                      options=InjectorOptions())
+        child_injector.inject(MyParentType)
+
+        # The instance is created by the provider of the parent, notifying the parent listeners
+        created_targets = [call_args[0][0].target.type for call_args in listener.on_instance_created.call_args_list]
+        self.assertIn(MyParentType, created_targets)
+
+    def test_child_injector_creates_overridden_targets_with_parent_dependencies(self):
+        parent_injector = Injector(bindings=[
+            SelfBinding(MyType),
+            SelfBinding(MyParentType),
+        ])
+
+        child_injector = parent_injector.create_child(bindings=[SelfBinding(MyParentType)])
+        child_parent_instance = child_injector.inject(MyParentType)
+
+        self.assertIsNot(parent_injector.inject(MyParentType), child_parent_instance)
+        self.assertIs(parent_injector.inject(MyType), child_parent_instance.my_param)
+
+    def test_child_injector_injects_itself(self):
+        parent_injector = Injector()
+
+        child_injector = parent_injector.create_child()
+
+        self.assertIs(child_injector, child_injector.inject(Injector))
+        self.assertIs(parent_injector, parent_injector.inject(Injector))
+
+    def test_child_injector_closes_its_own_singletons(self):
+        MyResource.closed_instances = []
+        parent_injector = Injector(bindings=[SelfBinding(MyResource)])
+        child_injector = parent_injector.create_child(bindings=[SelfBinding(MyParentResource)])
+        child_instance = child_injector.inject(MyParentResource)
+
+        child_injector.close()
+
+        self.assertEqual([child_instance], MyResource.closed_instances)
+
+    def test_listeners_are_notified(self):
+        listener = create_autospec(InjectionListener, spec_set=True)
+        injector = Injector(bindings=[
+            SelfBinding(MyParentType),
+            SelfBinding(MyType),
+        ], options=InjectorOptions(listeners=[listener]))
+
+        injector.inject(MyParentType)
+
+        created_targets = [call_args[0][0].target for call_args in listener.on_provider_created.call_args_list]
+        self.assertIn(Target(MyParentType), created_targets)
+        instance_events = [call_args[0][0] for call_args in listener.on_instance_created.call_args_list]
+        self.assertEqual([Target(MyType), Target(MyParentType)], instance_events[0].dependency_chain)
+        self.assertEqual([Target(MyParentType)], instance_events[1].dependency_chain)
+        self.assertEqual(2, listener.on_scope_miss.call_count)
+
+    def test_warm_up_with_listeners_creates_singletons(self):
+        listener = create_autospec(InjectionListener, spec_set=True)
+        injector = Injector(bindings=[
+            SelfBinding(MyType),
+            SelfBinding(MyParentType),
+        ], options=InjectorOptions(lazy_providers=True, listeners=[listener]))
+
+        injector.warm_up()
+
+        self.assertEqual(2, listener.on_instance_created.call_count)
+
+    def test_startup_report(self):
+        injector = Injector(bindings=[
+            SelfBinding(MyType),
+            SelfBinding(MyParentType, scope=ImmediateScope),
+        ], options=InjectorOptions(profile_startup=True))
+
+        report = injector.startup_report
+
+        self.assertEqual(1, len(report.modules))
+        self.assertIn(repr(Target(MyParentType)), [node.name for node in report.providers])
+        self.assertEqual([repr(Target(MyParentType)), repr(Target(MyType))],
+                         [node.name for node in report.critical_path])
+        self.assertGreater(report.total_duration, 0)
+
+    def test_startup_profiler_is_removed_once_stopped(self):
+        listener = create_autospec(InjectionListener, spec_set=True)
+        options = InjectorOptions(profile_startup=True, listeners=[listener])
+        injector = Injector(bindings=[SelfBinding(MyType, scope=PerLookupScope)], options=options)
+        startup_report = injector.startup_report
+
+        injector.inject(MyType)
+
+        self.assertEqual([], startup_report.instances)
+        self.assertEqual([listener], options.listeners)
+        listener.on_instance_created.assert_called_once()
+
+    def test_no_startup_report_by_default(self):
+        self.assertIsNone(Injector().startup_report)
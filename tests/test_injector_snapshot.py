@@ -0,0 +1,254 @@
+import importlib
+import os
+import sys
+import tempfile
+import unittest
+from types import ModuleType
+from typing import Callable, List
+from unittest.mock import MagicMock
+
+from opyoid import Injector, Module, PrivateModule, Provider
+from opyoid.bindings import AbstractModule
+from opyoid.injector_snapshot import InjectorSnapshot, SnapshotModule
+
+SOURCE_MODULE_CONTENT = """
+from opyoid import Provider
+
+
+class MySourceType:
+    pass
+
+
+class MySourceProvider(Provider):
+    def get(self):
+        return MySourceType()
+"""
+
+
+class MyType:
+    pass
+
+
+class MyParentType:
+    def __init__(self, my_param: MyType, my_name: str):
+        self.my_param = my_param
+        self.my_name = my_name
+
+
+class MyNameProvider(Provider[str]):
+    def get(self) -> str:
+        return "my_name"
+
+
+class MyPrivateModule(PrivateModule):
+    def configure(self) -> None:
+        self.bind(MyType)
+        self.expose(self.bind(MyParentType))
+
+
+class MyModule(Module):
+    def configure(self) -> None:
+        self.bind(str, to_provider=MyNameProvider)
+        self.install(MyPrivateModule())
+
+
+class MyNotIntrospectableType:
+    # Builtin functions such as min have no signature
+    __init__ = min
+
+
+class MyNotIntrospectableProvider(Provider[MyNotIntrospectableType]):
+    def get(self) -> MyNotIntrospectableType:
+        return object.__new__(MyNotIntrospectableType)
+
+
+class MyConfiguredModule(Module):
+    def __init__(self, configure_function: Callable[[Module], None]) -> None:
+        super().__init__()
+        self._configure_function = configure_function
+
+    def configure(self) -> None:
+        self._configure_function(self)
+
+
+class MyConfiguredPrivateModule(PrivateModule):
+    def __init__(self, private_type: type) -> None:
+        super().__init__()
+        self._private_type = private_type
+
+    def configure(self) -> None:
+        self.bind(self._private_type)
+        self.expose(self.bind(MyType))
+
+
+class MyInstancePrivateModule(PrivateModule):
+    def configure(self) -> None:
+        self.expose(self.bind(MyType, to_instance=MyType()))
+
+
+class TestInjectorSnapshot(unittest.TestCase):
+    def setUp(self) -> None:
+        temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+        self.path = os.path.join(temporary_directory.name, "injector.snapshot")
+        self.modules_factory = MagicMock(side_effect=lambda: [MyModule()])
+        self.source_directory = temporary_directory.name
+        sys.path.insert(0, self.source_directory)
+        self.addCleanup(sys.path.remove, self.source_directory)
+
+    def test_from_snapshot_saves_snapshot(self):
+        injector = Injector.from_snapshot(self.path, self.modules_factory)
+
+        self.modules_factory.assert_called_once_with()
+        self.assertTrue(os.path.exists(self.path))
+        self.assertEqual("my_name", injector.inject(MyParentType).my_name)
+
+    def test_from_snapshot_skips_modules_configuration(self):
+        Injector.from_snapshot(self.path, self.modules_factory)
+
+        injector = Injector.from_snapshot(self.path, self.modules_factory)
+
+        self.modules_factory.assert_called_once_with()
+        parent_instance = injector.inject(MyParentType)
+        self.assertIsInstance(parent_instance.my_param, MyType)
+        self.assertEqual("my_name", parent_instance.my_name)
+        self.assertIs(injector, injector.inject(Injector))
+
+    def test_snapshot_contains_constructor_parameters(self):
+        Injector.from_snapshot(self.path, self.modules_factory)
+
+        snapshot = InjectorSnapshot.load(self.path)
+
+        constructor, parameters = snapshot.constructor_parameters[MyParentType]
+        self.assertIs(MyParentType.__init__, constructor)
+        self.assertEqual(["my_param", "my_name"], [parameter.name for parameter in parameters])
+
+    def test_modified_source_file_invalidates_snapshot(self):
+        Injector.from_snapshot(self.path, self.modules_factory)
+        file_stat = os.stat(__file__)
+        self.addCleanup(os.utime, __file__, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns))
+        os.utime(__file__, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 1000))
+
+        self.assertIsNone(InjectorSnapshot.load(self.path))
+        Injector.from_snapshot(self.path, self.modules_factory)
+
+        self.assertEqual(2, self.modules_factory.call_count)
+
+    def test_invalid_snapshot_is_ignored(self):
+        with open(self.path, "wb") as snapshot_file:
+            snapshot_file.write(b"invalid")
+
+        with self.assertLogs("opyoid.injector_snapshot", "WARNING"):
+            injector = Injector.from_snapshot(self.path, self.modules_factory)
+
+        self.modules_factory.assert_called_once_with()
+        self.assertIsInstance(injector.inject(MyParentType), MyParentType)
+
+    def test_unpicklable_bindings_are_not_saved(self):
+        class MyLocalType:
+            pass
+
+        class MyLocalModule(Module):
+            def configure(self) -> None:
+                self.bind(MyLocalType)
+
+        with self.assertLogs("opyoid.injector_snapshot", "WARNING"):
+            injector = Injector.from_snapshot(self.path, lambda: [MyLocalModule()])
+
+        self.assertFalse(os.path.exists(self.path))
+        self.assertIsInstance(injector.inject(MyLocalType), MyLocalType)
+
+    def test_snapshot_module_uses_loaded_bindings(self):
+        snapshot_module = SnapshotModule([MyModule()])
+        snapshot_module.configure_once()
+
+        loaded_module = SnapshotModule(binding_registry=snapshot_module.binding_registry)
+        loaded_module.configure_once()
+
+        self.assertIs(snapshot_module.binding_registry, loaded_module.binding_registry)
+
+    def test_modified_bound_class_source_file_invalidates_snapshot(self):
+        source_module = self._create_source_module()
+
+        self._assert_source_change_invalidates_snapshot(source_module, lambda: [MyConfiguredModule(
+            lambda module: module.bind(MyType, to_class=source_module.MySourceType))])
+
+    def test_modified_provider_class_source_file_invalidates_snapshot(self):
+        source_module = self._create_source_module()
+
+        self._assert_source_change_invalidates_snapshot(source_module, lambda: [MyConfiguredModule(
+            lambda module: module.bind(MyType, to_provider=source_module.MySourceProvider))])
+
+    def test_bound_instances_are_not_saved(self):
+        for configure_function in [
+            lambda module: module.bind(MyType, to_instance=MyType()),
+            lambda module: module.bind(MyType, to_provider=MyNameProvider()),
+            lambda module: module.multi_bind(MyType, [module.bind_item(to_instance=MyType())]),
+            lambda module: module.install(MyInstancePrivateModule()),
+        ]:
+            with self.subTest(configure_function=configure_function):
+                with self.assertLogs("opyoid.injector_snapshot", "WARNING") as logs:
+                    Injector.from_snapshot(self.path, lambda: [MyConfiguredModule(configure_function)])
+
+                self.assertIn("binds an instance", logs.output[0])
+                self.assertFalse(os.path.exists(self.path))
+
+    def test_bound_instances_are_configured_on_each_run(self):
+        for my_name in ["my_name", "my_new_name"]:
+            with self.assertLogs("opyoid.injector_snapshot", "WARNING"):
+                injector = Injector.from_snapshot(self.path, lambda: [MyConfiguredModule(
+                    lambda module: module.bind(str, to_instance=my_name))])  # pylint: disable=cell-var-from-loop
+
+            self.assertEqual(my_name, injector.inject(str))
+
+    def test_modified_multi_binding_item_source_file_invalidates_snapshot(self):
+        source_module = self._create_source_module()
+
+        self._assert_source_change_invalidates_snapshot(source_module, lambda: [MyConfiguredModule(
+            lambda module: module.multi_bind(MyType, [module.bind_item(to_class=source_module.MySourceType)]))])
+
+    def test_modified_private_module_binding_source_file_invalidates_snapshot(self):
+        source_module = self._create_source_module()
+
+        self._assert_source_change_invalidates_snapshot(source_module, lambda: [MyConfiguredModule(
+            lambda module: module.install(MyConfiguredPrivateModule(source_module.MySourceType)))])
+
+    def test_deleted_source_file_invalidates_snapshot(self):
+        source_module = self._create_source_module()
+        Injector.from_snapshot(self.path, lambda: [MyConfiguredModule(
+            lambda module: module.bind(MyType, to_class=source_module.MySourceType))])
+
+        os.remove(source_module.__file__)
+
+        self.assertIsNone(InjectorSnapshot.load(self.path))
+
+    def test_not_introspectable_classes_are_saved_without_parameters(self):
+        Injector.from_snapshot(self.path, lambda: [MyConfiguredModule(
+            lambda module: module.bind(MyNotIntrospectableType, to_provider=MyNotIntrospectableProvider))])
+
+        snapshot = InjectorSnapshot.load(self.path)
+
+        self.assertNotIn(MyNotIntrospectableType, snapshot.constructor_parameters)
+        self.assertIsInstance(Injector.from_snapshot(self.path, self.modules_factory).inject(MyNotIntrospectableType),
+                              MyNotIntrospectableType)
+        self.modules_factory.assert_not_called()
+
+    def _create_source_module(self) -> ModuleType:
+        """Creates a module in its own source file, to modify only the sources of the classes it defines."""
+        module_name = f"my_source_module_{self._testMethodName}"
+        with open(os.path.join(self.source_directory, f"{module_name}.py"), "w", encoding="utf-8") as source_file:
+            source_file.write(SOURCE_MODULE_CONTENT)
+        importlib.invalidate_caches()
+        self.addCleanup(sys.modules.pop, module_name, None)
+        return importlib.import_module(module_name)
+
+    def _assert_source_change_invalidates_snapshot(self,
+                                                   source_module: ModuleType,
+                                                   modules_factory: Callable[[], List[AbstractModule]]) -> None:
+        Injector.from_snapshot(self.path, modules_factory)
+        self.assertIsNotNone(InjectorSnapshot.load(self.path))
+        file_stat = os.stat(source_module.__file__)
+
+        os.utime(source_module.__file__, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 1000))
+
+        self.assertIsNone(InjectorSnapshot.load(self.path))
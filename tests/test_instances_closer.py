@@ -0,0 +1,84 @@
+import asyncio
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from opyoid.instances_closer import InstancesCloser
+
+
+class MySlowResource:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        time.sleep(0.05)
+        self.closed = True
+
+
+class MySlowAsyncResource:
+    async def aclose(self):
+        await asyncio.sleep(1)
+
+
+class TestInstancesCloser(unittest.TestCase):
+    def setUp(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        self.addCleanup(self.loop.close)
+
+    def test_close_closes_all_instances_despite_errors(self):
+        instance_1 = MagicMock(spec=["close"])
+        instance_1.close.side_effect = ValueError()
+        instance_2 = MagicMock(spec=["close"])
+
+        with self.assertLogs("opyoid.instances_closer", "ERROR"):
+            InstancesCloser().close([instance_1, instance_2])
+
+        instance_1.close.assert_called_once_with()
+        instance_2.close.assert_called_once_with()
+
+    def test_close_closes_instances_on_calling_thread(self):
+        closing_threads = []
+        instance = MagicMock(spec=["close"])
+        instance.close.side_effect = lambda: closing_threads.append(threading.current_thread())
+
+        InstancesCloser(1).close([instance])
+
+        self.assertEqual([threading.current_thread()], closing_threads)
+
+    def test_close_reports_instances_left_after_timeout(self):
+        slow_instance = MySlowResource()
+        instance = MagicMock(spec=["close"])
+
+        with self.assertLogs("opyoid.instances_closer", "ERROR") as logs:
+            InstancesCloser(0.01).close([slow_instance, instance])
+
+        self.assertTrue(slow_instance.closed)
+        instance.close.assert_not_called()
+        self.assertEqual(2, len(logs.records))
+
+    def test_aclose_closes_all_instances_despite_errors(self):
+        instance_1 = MagicMock(spec=["close"])
+        instance_1.close.side_effect = ValueError()
+        instance_2 = MagicMock(spec=["close"])
+
+        with self.assertLogs("opyoid.instances_closer", "ERROR"):
+            self.loop.run_until_complete(InstancesCloser().aclose([instance_1, instance_2]))
+
+        instance_2.close.assert_called_once_with()
+
+    def test_aclose_abandons_instances_after_timeout(self):
+        instance = MagicMock(spec=["close"])
+
+        with self.assertLogs("opyoid.instances_closer", "ERROR") as logs:
+            self.loop.run_until_complete(InstancesCloser(0.01).aclose([MySlowAsyncResource(), instance]))
+
+        instance.close.assert_not_called()
+        self.assertEqual(2, len(logs.records))
+
+    def test_aclose_with_timeout_closes_fast_instances(self):
+        instance = MagicMock(spec=["close"])
+
+        self.loop.run_until_complete(InstancesCloser(1).aclose([instance]))
+
+        instance.close.assert_called_once_with()
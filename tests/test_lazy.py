@@ -0,0 +1,77 @@
+import unittest
+from unittest.mock import create_autospec
+
+from opyoid import Injector, Lazy, PerLookupScope, SelfBinding
+from opyoid.provider import Provider
+
+
+class MyType:
+    def __init__(self) -> None:
+        self.my_attribute = "value"
+
+    def my_method(self) -> str:
+        return self.my_attribute
+
+
+class TestLazy(unittest.TestCase):
+    def setUp(self) -> None:
+        self.provider = create_autospec(Provider, spec_set=True)
+        self.instance = MyType()
+        self.provider.get.return_value = self.instance
+        self.lazy = Lazy(self.provider)
+
+    def test_instance_is_created_on_first_access_only(self):
+        self.provider.get.assert_not_called()
+
+        self.assertEqual("value", self.lazy.my_attribute)
+        self.assertEqual("value", self.lazy.my_method())
+        self.provider.get.assert_called_once_with()
+
+    def test_methods_are_cached(self):
+        my_method = self.lazy.my_method
+
+        self.assertIs(my_method, self.lazy.my_method)
+        self.assertIn("my_method", self.lazy.__dict__)
+
+    def test_attributes_are_not_cached(self):
+        self.assertEqual("value", self.lazy.my_attribute)
+        self.instance.my_attribute = "new value"
+
+        self.assertEqual("new value", self.lazy.my_attribute)
+
+    def test_set_attribute_is_forwarded(self):
+        self.lazy.my_attribute = "new value"
+
+        self.assertEqual("new value", self.instance.my_attribute)
+
+    def test_lazy_dependency_is_not_created_with_dependent(self):
+        created_types = []
+
+        class MyExpensiveType:
+            def __init__(self) -> None:
+                created_types.append(MyExpensiveType)
+
+            def get_self(self) -> "MyExpensiveType":
+                return self
+
+        class MyParentType:
+            def __init__(self, my_expensive_type: Lazy[MyExpensiveType]) -> None:
+                self.my_expensive_type = my_expensive_type
+
+        injector = Injector(bindings=[SelfBinding(MyExpensiveType), SelfBinding(MyParentType)])
+        parent = injector.inject(MyParentType)
+        self.assertEqual([], created_types)
+
+        self.assertIs(injector.inject(MyExpensiveType), parent.my_expensive_type.get_self())
+        self.assertEqual([MyExpensiveType], created_types)
+
+    def test_each_dependent_gets_its_per_lookup_instance(self):
+        class MyParentType:
+            def __init__(self, my_type: Lazy[MyType]) -> None:
+                self.my_type = my_type
+
+        injector = Injector(bindings=[SelfBinding(MyType, scope=PerLookupScope),
+                                      SelfBinding(MyParentType, scope=PerLookupScope)])
+
+        self.assertIsNot(injector.inject(MyParentType).my_type.my_method.__self__,
+                         injector.inject(MyParentType).my_type.my_method.__self__)
@@ -0,0 +1,75 @@
+import asyncio
+import unittest
+from unittest.mock import create_autospec
+
+from opyoid import InjectionListener, Target
+from opyoid.bindings import FromInstanceProvider
+from opyoid.listeners import ConstructionListeningProvider
+
+
+class TestConstructionListeningProvider(unittest.TestCase):
+    def setUp(self) -> None:
+        self.listener = create_autospec(InjectionListener, spec_set=True)
+        self.target = Target(str)
+        self.listeners = [self.listener]
+        self.provider = ConstructionListeningProvider(
+            FromInstanceProvider("instance"),
+            self.target,
+            [self.target],
+            self.listeners,
+        )
+
+    def test_get_notifies_listeners(self):
+        instance = self.provider.get()
+
+        self.assertEqual("instance", instance)
+        self.listener.on_instance_created.assert_called_once()
+        event = self.listener.on_instance_created.call_args[0][0]
+        self.assertEqual(self.target, event.target)
+        self.assertEqual([self.target], event.dependency_chain)
+        self.assertGreaterEqual(event.duration, 0)
+
+    def test_get_async_notifies_listeners(self):
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+
+        instance = loop.run_until_complete(self.provider.get_async())
+
+        self.assertEqual("instance", instance)
+        self.listener.on_instance_created.assert_called_once()
+
+    def test_was_created(self):
+        token = self.provider.track_creation()
+        self.assertFalse(self.provider.was_created(token))
+
+        token = self.provider.track_creation()
+        self.provider.get()
+        self.assertTrue(self.provider.was_created(token))
+
+    def test_nested_trackings_are_independent(self):
+        outer_token = self.provider.track_creation()
+        inner_token = self.provider.track_creation()
+        self.assertFalse(self.provider.was_created(inner_token))
+
+        self.provider.get()
+
+        self.assertTrue(self.provider.was_created(outer_token))
+
+    def test_get_without_tracking(self):
+        self.assertEqual("instance", self.provider.get())
+
+    def test_listeners_are_skipped_once_removed(self):
+        self.listeners.clear()
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+
+        self.assertEqual("instance", self.provider.get())
+        self.assertEqual("instance", loop.run_until_complete(self.provider.get_async()))
+        self.assertEqual("instance", self.provider.compile()())
+
+        self.listener.on_instance_created.assert_not_called()
+
+    def test_compile_notifies_listeners(self):
+        self.assertEqual("instance", self.provider.compile()())
+
+        self.listener.on_instance_created.assert_called_once()
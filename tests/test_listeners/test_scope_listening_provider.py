@@ -0,0 +1,80 @@
+import asyncio
+import unittest
+from unittest.mock import create_autospec
+
+from opyoid import InjectionListener, Target
+from opyoid.bindings import FromInstanceProvider
+from opyoid.listeners import ConstructionListeningProvider, ScopeListeningProvider
+from opyoid.scopes import SingletonScopedProvider
+
+
+class TestScopeListeningProvider(unittest.TestCase):
+    def setUp(self) -> None:
+        self.listener = create_autospec(InjectionListener, spec_set=True)
+        self.target = Target(str)
+        self.listeners = [self.listener]
+        construction_provider = ConstructionListeningProvider(
+            FromInstanceProvider("instance"),
+            self.target,
+            [self.target],
+            self.listeners,
+        )
+        self.provider = ScopeListeningProvider(
+            SingletonScopedProvider(construction_provider),
+            construction_provider,
+            self.target,
+            [self.target],
+            self.listeners,
+        )
+
+    def test_first_get_is_a_scope_miss(self):
+        instance = self.provider.get()
+
+        self.assertEqual("instance", instance)
+        self.listener.on_scope_miss.assert_called_once()
+        self.listener.on_scope_hit.assert_not_called()
+        self.assertEqual(self.target, self.listener.on_scope_miss.call_args[0][0].target)
+
+    def test_next_get_are_scope_hits(self):
+        self.provider.get()
+
+        self.provider.get()
+        self.provider.get()
+
+        self.listener.on_scope_miss.assert_called_once()
+        self.assertEqual(2, self.listener.on_scope_hit.call_count)
+        self.listener.on_instance_created.assert_called_once()
+
+    def test_get_async_notifies_scope_miss_then_hits(self):
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+
+        instance = loop.run_until_complete(self.provider.get_async())
+        loop.run_until_complete(self.provider.get_async())
+
+        self.assertEqual("instance", instance)
+        self.listener.on_scope_miss.assert_called_once()
+        self.listener.on_scope_hit.assert_called_once()
+
+    def test_concurrent_tasks_are_notified_independently(self):
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+
+        async def inject_concurrently():
+            return await asyncio.gather(self.provider.get_async(), self.provider.get_async())
+
+        loop.run_until_complete(inject_concurrently())
+
+        self.listener.on_scope_miss.assert_called_once()
+        self.listener.on_scope_hit.assert_called_once()
+        self.listener.on_instance_created.assert_called_once()
+
+    def test_listeners_are_skipped_once_removed(self):
+        self.provider.get()
+        self.listener.reset_mock()
+        self.listeners.clear()
+
+        self.assertEqual("instance", self.provider.get())
+        self.assertEqual("instance", self.provider.compile()())
+
+        self.listener.on_scope_hit.assert_not_called()
@@ -0,0 +1,32 @@
+import unittest
+from unittest.mock import create_autospec
+
+from opyoid import InjectionListener, InjectorOptions, PerLookupScope, SingletonScope, Target
+from opyoid.bindings import BindingRegistry, FromInstanceProvider
+from opyoid.injection_context import InjectionContext
+from opyoid.injection_state import InjectionState
+from opyoid.listeners import ScopeListeningProvider, create_scoped_provider
+from opyoid.providers import ProviderCreator
+from opyoid.scopes import SingletonScopedProvider
+
+
+class TestScopedProviderFactory(unittest.TestCase):
+    def create_context(self, options: InjectorOptions) -> InjectionContext:
+        return InjectionContext(Target(str), InjectionState(ProviderCreator(), BindingRegistry(), options))
+
+    def test_provider_is_not_wrapped_without_listeners(self):
+        provider = create_scoped_provider(SingletonScope(), FromInstanceProvider("instance"),
+                                          self.create_context(InjectorOptions()))
+
+        self.assertIsInstance(provider, SingletonScopedProvider)
+
+    def test_provider_is_wrapped_with_listeners(self):
+        listener = create_autospec(InjectionListener, spec_set=True)
+        context = self.create_context(InjectorOptions(listeners=[listener]))
+
+        provider = create_scoped_provider(PerLookupScope(), FromInstanceProvider("instance"), context)
+
+        self.assertIsInstance(provider, ScopeListeningProvider)
+        self.assertEqual("instance", provider.get())
+        listener.on_instance_created.assert_called_once()
+        listener.on_scope_miss.assert_called_once()
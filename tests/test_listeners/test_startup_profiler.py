@@ -0,0 +1,56 @@
+import unittest
+from threading import Thread
+
+from opyoid import Module, Target
+from opyoid.listeners import InjectionEvent, StartupProfiler, TimingNode
+
+
+class MyModule(Module):
+    def configure(self) -> None:
+        pass
+
+
+class MyParentModule(Module):
+    def configure(self) -> None:
+        self.install(MyModule())
+
+
+class TestStartupProfiler(unittest.TestCase):
+    def setUp(self) -> None:
+        self.profiler = StartupProfiler()
+        self.module = MyParentModule()
+        self.module.configure_once()
+
+    def test_events_are_nested_by_time(self):
+        self.profiler.on_instance_created(InjectionEvent(Target(int), [], 1., 11.))
+        self.profiler.on_instance_created(InjectionEvent(Target(float), [], 2., 13.))
+        self.profiler.on_instance_created(InjectionEvent(Target(str), [], 5., 10.))
+        self.profiler.on_instance_created(InjectionEvent(Target(bytes), [], 1., 20.))
+
+        report = self.profiler.stop(self.module)
+
+        self.assertEqual([
+            TimingNode("str", 5., [TimingNode("int", 1.), TimingNode("float", 2.)]),
+            TimingNode("bytes", 1.),
+        ], report.instances)
+
+    def test_modules_configuration_is_reported(self):
+        report = self.profiler.stop(self.module)
+
+        self.assertEqual(1, len(report.modules))
+        self.assertEqual("tests.test_listeners.test_startup_profiler.MyParentModule", report.modules[0].name)
+        self.assertEqual(["tests.test_listeners.test_startup_profiler.MyModule"],
+                         [node.name for node in report.modules[0].children])
+
+    def test_events_are_not_recorded_once_stopped(self):
+        self.profiler.stop(self.module)
+        self.profiler.on_provider_created(InjectionEvent(Target(int), [], 1., 11.))
+
+        self.assertEqual([], self.profiler.stop(self.module).providers)
+
+    def test_events_from_other_threads_are_ignored(self):
+        thread = Thread(target=self.profiler.on_provider_created, args=(InjectionEvent(Target(int), [], 1., 11.),))
+        thread.start()
+        thread.join()
+
+        self.assertEqual([], self.profiler.stop(self.module).providers)
@@ -0,0 +1,53 @@
+import json
+import unittest
+
+from opyoid.listeners import StartupReport, TimingNode
+
+
+class TestStartupReport(unittest.TestCase):
+    def setUp(self) -> None:
+        self.report = StartupReport(
+            1.,
+            [TimingNode("RootModule", 0.3, [TimingNode("my_module.MyModule", 0.2)])],
+            [TimingNode("MyParentType", 0.1, [TimingNode("MyType", 0.05)])],
+            [
+                TimingNode("MyFastType", 0.1),
+                TimingNode("MyParentType", 0.5, [
+                    TimingNode("MyType", 0.1),
+                    TimingNode("MySlowType", 0.3),
+                ]),
+            ],
+        )
+
+    def test_critical_path_follows_slowest_instances(self):
+        self.assertEqual(["MyParentType", "MySlowType"], [node.name for node in self.report.critical_path])
+
+    def test_to_json(self):
+        report_dict = json.loads(self.report.to_json())
+
+        self.assertEqual(1., report_dict["total_duration"])
+        self.assertEqual("my_module.MyModule", report_dict["modules"][0]["children"][0]["name"])
+        self.assertEqual([
+            {"name": "MyParentType", "duration": 0.5},
+            {"name": "MySlowType", "duration": 0.3},
+        ], report_dict["critical_path"])
+
+    def test_to_collapsed_stacks_uses_self_durations(self):
+        self.assertEqual(
+            "\n".join([
+                "configure;RootModule 100000",
+                "configure;RootModule;my_module.MyModule 200000",
+                "providers;MyParentType 50000",
+                "providers;MyParentType;MyType 50000",
+                "instances;MyFastType 100000",
+                "instances;MyParentType 100000",
+                "instances;MyParentType;MyType 100000",
+                "instances;MyParentType;MySlowType 300000",
+            ]),
+            self.report.to_collapsed_stacks(),
+        )
+
+    def test_collapsed_stacks_names_do_not_contain_separators(self):
+        report = StartupReport(1., [TimingNode("my module;1", 1.)], [], [])
+
+        self.assertEqual("configure;my_module,1 1000000", report.to_collapsed_stacks())
@@ -0,0 +1,83 @@
+import asyncio
+import unittest
+
+from opyoid import InjectionListener, Injector, InjectorOptions, Pooled, PooledScope, SelfBinding
+from opyoid.exceptions import NonInjectableTypeError
+
+
+class MyType:
+    pass
+
+
+class TestPooled(unittest.TestCase):
+    def setUp(self) -> None:
+        self.injector = Injector(bindings=[SelfBinding(MyType, scope=PooledScope)])
+        self.pool = self.injector.inject(Pooled[MyType])
+
+    def test_checkout_returns_instance_to_pool(self):
+        with self.pool.checkout() as instance_1:
+            self.assertIsInstance(instance_1, MyType)
+            with self.pool.checkout() as instance_2:
+                self.assertIsNot(instance_1, instance_2)
+
+        # The most recently released instance is lent first
+        with self.pool.checkout() as instance_3:
+            self.assertIs(instance_1, instance_3)
+
+    def test_async_checkout(self):
+        async def use_pool():
+            async with self.pool.checkout() as instance:
+                return instance
+
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+
+        instance = loop.run_until_complete(use_pool())
+
+        self.assertIs(instance, self.pool.acquire())
+
+    def test_acquire_release(self):
+        instance = self.pool.acquire()
+        self.pool.release(instance)
+
+        self.assertIs(instance, self.pool.acquire())
+
+    def test_acquire_async(self):
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+
+        instance = loop.run_until_complete(self.pool.acquire_async())
+        self.pool.release(instance)
+
+        self.assertIs(instance, loop.run_until_complete(self.pool.acquire_async()))
+
+    def test_pool_with_listeners(self):
+        injector = Injector(
+            bindings=[SelfBinding(MyType, scope=PooledScope)],
+            options=InjectorOptions(listeners=[InjectionListener()]),
+        )
+        pool = injector.inject(Pooled[MyType])
+        instance = pool.acquire()
+        pool.release(instance)
+
+        self.assertIs(instance, pool.acquire())
+
+    def test_pools_are_shared(self):
+        with self.pool.checkout() as instance:
+            pass
+
+        with self.injector.inject(Pooled[MyType]).checkout() as other_instance:
+            self.assertIs(instance, other_instance)
+
+    def test_non_pooled_binding_raises_exception(self):
+        class MyOtherType:
+            pass
+
+        injector = Injector(bindings=[SelfBinding(MyOtherType)])
+
+        with self.assertRaises(NonInjectableTypeError):
+            injector.inject(Pooled[MyOtherType])
+
+    def test_direct_injection_raises_exception(self):
+        with self.assertRaises(NonInjectableTypeError):
+            self.injector.inject(MyType)
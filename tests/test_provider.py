@@ -0,0 +1,45 @@
+import asyncio
+import unittest
+
+from opyoid.provider import Provider
+
+
+class MyProvider(Provider[str]):
+    def get(self) -> str:
+        return "instance"
+
+
+class MyCompiledProvider(Provider[str]):
+    def __init__(self) -> None:
+        self.compile_count = 0
+
+    def get(self) -> str:
+        return "instance"
+
+    def _compile(self, compiled_getters):
+        self.compile_count += 1
+        return lambda: "compiled instance"
+
+
+class TestProvider(unittest.TestCase):
+    def test_get_async_calls_get(self):
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+
+        self.assertEqual("instance", loop.run_until_complete(MyProvider().get_async()))
+
+    def test_compile_returns_get(self):
+        provider = MyProvider()
+
+        self.assertEqual("instance", provider.compile()())
+
+    def test_compile_reuses_compiled_getters(self):
+        provider = MyCompiledProvider()
+        compiled_getters = {}
+
+        getter = provider.compile(compiled_getters)
+
+        self.assertIs(getter, provider.compile(compiled_getters))
+        self.assertEqual("compiled instance", getter())
+        self.assertEqual(1, provider.compile_count)
+        self.assertEqual({provider: getter}, compiled_getters)
@@ -0,0 +1,87 @@
+import asyncio
+import unittest
+from unittest.mock import MagicMock, create_autospec
+
+from opyoid.provider import Provider
+from opyoid.provider_proxy import ProviderProxy
+
+
+class MyType:
+    def __init__(self) -> None:
+        self.my_attribute = "value"
+
+
+class MyAsyncContextManager:
+    def __init__(self) -> None:
+        self.calls = []
+
+    async def __aenter__(self) -> str:
+        self.calls.append("enter")
+        return "entered"
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.calls.append("exit")
+
+
+class TestProviderProxy(unittest.TestCase):
+    def setUp(self) -> None:
+        self.provider = create_autospec(Provider, spec_set=True)
+        self.proxy = ProviderProxy(self.provider)
+
+    def test_attributes_are_read_from_current_instance(self):
+        self.provider.get.side_effect = [MyType(), MyType()]
+        self.proxy.my_attribute = "new value"
+
+        self.assertEqual("value", self.proxy.my_attribute)
+
+    def test_container_methods_are_forwarded(self):
+        self.provider.get.return_value = [1, 2]
+
+        self.assertEqual([1, 2], list(self.proxy))
+        self.assertEqual(2, len(self.proxy))
+        self.assertEqual(2, self.proxy[1])
+        self.assertIn(1, self.proxy)
+        self.assertTrue(self.proxy)
+
+    def test_call_is_forwarded(self):
+        self.assertIs(self.provider.get.return_value.return_value, self.proxy("arg"))
+        self.provider.get.return_value.assert_called_once_with("arg")
+
+    def test_comparisons_and_hash_are_forwarded(self):
+        self.provider.get.return_value = "instance"
+
+        self.assertEqual("instance", self.proxy)
+        self.assertEqual(self.proxy, "instance")
+        self.assertNotEqual("other instance", self.proxy)
+        self.assertEqual(hash("instance"), hash(self.proxy))
+        self.assertEqual("instance", str(self.proxy))
+
+    def test_context_manager_is_forwarded(self):
+        instance = MagicMock()
+        instance.__exit__.return_value = False
+        self.provider.get.return_value = instance
+
+        with self.proxy as entered_instance:
+            pass
+
+        self.assertIs(instance.__enter__.return_value, entered_instance)
+        instance.__exit__.assert_called_once_with(None, None, None)
+
+    def test_async_context_manager_is_forwarded(self):
+        instance = MyAsyncContextManager()
+        self.provider.get.return_value = instance
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+
+        async def use_proxy():
+            async with self.proxy as entered_value:
+                return entered_value
+
+        self.assertEqual("entered", loop.run_until_complete(use_proxy()))
+        self.assertEqual(["enter", "exit"], instance.calls)
+
+    def test_operators_are_not_forwarded(self):
+        self.provider.get.return_value = 1
+
+        with self.assertRaises(TypeError):
+            self.proxy + 1  # pylint: disable=pointless-statement
@@ -2,6 +2,7 @@ import unittest
 from unittest.mock import create_autospec
 
 from opyoid import NonInjectableTypeError, Provider, Target
+from opyoid.scopes import ScopeLifetime
 from opyoid.provider_registry import ProviderRegistry
 
 
@@ -10,7 +11,8 @@ class MyType:
 
 
 class MyOtherType:
-    pass
+    class MyNestedType:
+        pass
 
 
 class TestProviderRegistry(unittest.TestCase):
@@ -49,6 +51,13 @@ class TestProviderRegistry(unittest.TestCase):
 
         self.assertEqual(self.provider_2, provider)
 
+    def test_get_provider_from_qualified_name_string(self):
+        self.registry.set_provider(Target(MyOtherType.MyNestedType), self.provider_1)
+        self.registry.set_provider(self.other_target, self.provider_2)
+        provider = self.registry.get_provider(Target("MyOtherType.MyNestedType"))
+
+        self.assertEqual(self.provider_1, provider)
+
     def test_get_provider_from_unknown_string(self):
         provider = self.registry.get_provider(Target("MyUnknownType"))
         self.assertIsNone(provider)
@@ -70,3 +79,12 @@ class TestProviderRegistry(unittest.TestCase):
 
         with self.assertRaises(NonInjectableTypeError):
             self.registry.get_provider(Target("MyNewType"))
+
+    def test_get_lifetime(self):
+        self.registry.set_provider(self.target, self.provider_1, ScopeLifetime.THREAD)
+        self.registry.set_provider(self.named_target, self.provider_2)
+
+        self.assertEqual(ScopeLifetime.THREAD, self.registry.get_lifetime(self.target))
+        self.assertEqual(ScopeLifetime.THREAD, self.registry.get_lifetime(Target("MyType")))
+        self.assertIsNone(self.registry.get_lifetime(self.named_target))
+        self.assertIsNone(self.registry.get_lifetime(self.other_target))
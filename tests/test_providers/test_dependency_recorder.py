@@ -0,0 +1,49 @@
+import unittest
+
+from opyoid import SelfBinding
+from opyoid.bindings.registered_binding import RegisteredBinding
+from opyoid.frozen_target import FrozenTarget
+from opyoid.providers.dependency_recorder import DependencyRecorder
+
+
+class MyType:
+    pass
+
+
+class MyOtherType:
+    pass
+
+
+class TestDependencyRecorder(unittest.TestCase):
+    def setUp(self) -> None:
+        self.recorder = DependencyRecorder()
+        self.target = (FrozenTarget.create(MyType), "my_state")
+        self.other_target = (FrozenTarget.create(MyOtherType), "my_state")
+        self.binding = RegisteredBinding(SelfBinding(MyType))
+
+    def test_record_saves_targets_used_since_start(self):
+        self.recorder.start()
+        self.recorder.start()
+        self.recorder.record(self.other_target, None, self.recorder.stop())
+        self.recorder.record(self.target, self.binding, self.recorder.stop())
+
+        self.assertEqual([self.other_target, self.target], list(self.recorder.get_recorded_targets()))
+        self.assertEqual((self.other_target,), self.recorder.get_dependencies(self.target))
+        self.assertEqual((), self.recorder.get_dependencies(self.other_target))
+        self.assertIs(self.binding, self.recorder.get_binding(self.target))
+        self.assertIsNone(self.recorder.get_binding(self.other_target))
+
+    def test_record_ignores_target_itself(self):
+        self.recorder.start()
+        self.recorder.record(self.target, self.binding, {self.target})
+
+        self.assertEqual((), self.recorder.get_dependencies(self.target))
+
+    def test_record_merges_dependencies_and_keeps_first_binding(self):
+        self.recorder.record(self.target, self.binding, {self.other_target})
+        self.recorder.record(self.target, None, set())
+        self.recorder.record(self.target, RegisteredBinding(SelfBinding(MyType)), {(FrozenTarget.create(str), None)})
+
+        self.assertEqual({self.other_target, (FrozenTarget.create(str), None)},
+                         set(self.recorder.get_dependencies(self.target)))
+        self.assertIs(self.binding, self.recorder.get_binding(self.target))
@@ -2,17 +2,19 @@ import unittest
 from typing import List, Optional, Set, Tuple, Type
 from unittest.mock import ANY
 
-from opyoid import Provider, SelfBinding
+from opyoid import Lazy, Provider, SelfBinding
 from opyoid.bindings import BindingRegistry, ClassBinding, FromClassProvider, FromInstanceProvider, \
     InstanceBinding, ListProvider, MultiBinding, ProviderBinding
 from opyoid.bindings.multi_binding import ItemBinding
 from opyoid.bindings.registered_binding import RegisteredBinding
 from opyoid.bindings.registered_multi_binding import RegisteredMultiBinding
-from opyoid.exceptions import NoBindingFound, NonInjectableTypeError
+from opyoid.exceptions import CyclicDependencyError, NoBindingFound, NonInjectableTypeError
+from opyoid.frozen_target import FrozenTarget
 from opyoid.injection_context import InjectionContext
 from opyoid.injection_state import InjectionState
 from opyoid.providers import ProviderCreator
-from opyoid.scopes import SingletonScope
+from opyoid.providers.providers_factories import LazyProvider
+from opyoid.scopes import PerLookupScope, ScopeLifetime, SingletonScope
 from opyoid.target import Target
 
 
@@ -239,6 +241,18 @@ class TestProviderCreator(unittest.TestCase):
         with self.assertRaises(NonInjectableTypeError):
             self.provider_creator.get_provider(context)
 
+    def test_lazy_binding(self):
+        self.binding_registry.register(RegisteredBinding(self.my_instance_binding))
+
+        context = InjectionContext(Target(Lazy[MyType]), self.state)
+        provider = self.provider_creator.get_provider(context)
+        self.assertIsInstance(provider, LazyProvider)
+        lazy_instance = provider.get()
+        self.assertIsInstance(lazy_instance, Lazy)
+        self.assertIsNot(lazy_instance, provider.get())
+        self.my_instance.my_attribute = "my_value"
+        self.assertEqual("my_value", lazy_instance.my_attribute)
+
     def test_provider_binding(self):
         class MyInjectee:
             pass
@@ -265,3 +279,77 @@ class TestProviderCreator(unittest.TestCase):
         self.assertIsInstance(provider, ListProvider)
         list_instance = provider.get()
         self.assertEqual([instance], list_instance)
+
+    def test_cyclic_dependency_raises_exception_with_dependency_chain(self):
+        class MyParentClass:
+            def __init__(self, my_param: "MyChildClass"):
+                self.my_param = my_param
+
+        class MyChildClass:
+            def __init__(self, my_param: MyParentClass):
+                self.my_param = my_param
+
+        self.binding_registry.register(RegisteredBinding(SelfBinding(MyParentClass)))
+        self.binding_registry.register(RegisteredBinding(SelfBinding(MyChildClass)))
+        context = InjectionContext(Target(MyParentClass), self.state)
+
+        with self.assertRaises(CyclicDependencyError) as context_manager:
+            self.provider_creator.get_provider(context)
+        self.assertIn("MyParentClass", str(context_manager.exception))
+        self.assertIn("MyChildClass", str(context_manager.exception))
+
+    def test_same_target_in_sibling_dependencies_is_not_cyclic(self):
+        class MyParentClass:
+            def __init__(self, my_param_1: MyType, my_param_2: MyType):
+                self.my_param_1 = my_param_1
+                self.my_param_2 = my_param_2
+
+        self.binding_registry.register(RegisteredBinding(SelfBinding(MyParentClass, scope=SingletonScope)))
+        self.binding_registry.register(RegisteredBinding(self.my_instance_binding))
+        context = InjectionContext(Target(MyParentClass), self.state)
+
+        instance = self.provider_creator.get_provider(context).get()
+        self.assertIs(self.my_instance, instance.my_param_1)
+        self.assertIs(self.my_instance, instance.my_param_2)
+
+    def test_dependency_recorder_records_multi_binding_items(self):
+        class MyItemClass:
+            def __init__(self, my_param: MyOtherType):
+                self.my_param = my_param
+
+        provider_creator = ProviderCreator(record_dependencies=True)
+        state = InjectionState(provider_creator, self.binding_registry)
+        self.binding_registry.register(RegisteredBinding(self.my_other_instance_binding))
+        item_binding = RegisteredBinding(SelfBinding(MyItemClass))
+        self.binding_registry.register(RegisteredMultiBinding(
+            MultiBinding(MyType, [ItemBinding(MyItemClass)]),
+            item_bindings=[item_binding],
+        ))
+
+        provider_creator.get_provider(InjectionContext(Target(List[MyType]), state))
+
+        recorder = provider_creator.dependency_recorder
+        item_target = (FrozenTarget.create(MyItemClass), state, id(item_binding.raw_binding))
+        self.assertEqual({item_target, (FrozenTarget.create(SingletonScope), state)},
+                         set(recorder.get_dependencies((FrozenTarget.create(List[MyType]), state))))
+        self.assertEqual({(FrozenTarget.create(MyOtherType), state), (FrozenTarget.create(SingletonScope), state)},
+                         set(recorder.get_dependencies(item_target)))
+        self.assertIs(item_binding, recorder.get_binding(item_target))
+
+    def test_dependencies_are_not_recorded_by_default(self):
+        self.provider_creator.get_provider(InjectionContext(Target(SingletonScope), self.state))
+
+        self.assertIsNone(self.provider_creator.dependency_recorder)
+
+    def test_get_provider_saves_lifetime_following_unscoped_targets(self):
+        self.binding_registry.register(RegisteredBinding(InstanceBinding(PerLookupScope, PerLookupScope())))
+        self.binding_registry.register(RegisteredBinding(SelfBinding(MyType, scope=PerLookupScope)))
+        self.provider_creator.get_provider(InjectionContext(Target(Optional[MyType]), self.state))
+        self.provider_creator.get_provider(InjectionContext(Target(Provider[MyType]), self.state))
+        # From the cache
+        self.provider_creator.get_provider(InjectionContext(Target(Optional[MyType]), self.state))
+
+        provider_registry = self.state.provider_registry
+        self.assertEqual(ScopeLifetime.PER_LOOKUP, provider_registry.get_lifetime(Target(MyType)))
+        self.assertEqual(ScopeLifetime.PER_LOOKUP, provider_registry.get_lifetime(Target(Optional[MyType])))
+        self.assertIsNone(provider_registry.get_lifetime(Target(Provider[MyType])))
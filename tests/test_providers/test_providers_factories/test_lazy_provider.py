@@ -0,0 +1,34 @@
+import unittest
+from unittest.mock import create_autospec
+
+from opyoid import Lazy, Provider
+from opyoid.providers.providers_factories import LazyProvider
+
+
+class MyType:
+    def __init__(self, my_param: str = "my_value") -> None:
+        self.my_param = my_param
+
+
+class TestLazyProvider(unittest.TestCase):
+    def setUp(self) -> None:
+        self.mock_provider = create_autospec(Provider, spec_set=True)
+        self.mock_provider.get.return_value = MyType()
+        self.provider = LazyProvider(self.mock_provider)
+
+    def test_get_returns_new_lazy_proxy(self):
+        lazy_instance = self.provider.get()
+
+        self.assertIsInstance(lazy_instance, Lazy)
+        self.assertIsNot(lazy_instance, self.provider.get())
+        self.mock_provider.get.assert_not_called()
+
+    def test_compile_returns_new_lazy_proxy(self):
+        getter = self.provider.compile()
+        lazy_instance = getter()
+
+        self.assertIsInstance(lazy_instance, Lazy)
+        self.assertIsNot(lazy_instance, getter())
+        self.mock_provider.get.assert_not_called()
+        self.assertEqual("my_value", lazy_instance.my_param)
+        self.mock_provider.get.assert_called_once_with()
@@ -0,0 +1,149 @@
+import unittest
+from threading import Barrier
+from typing import List
+
+from opyoid import PerLookupScope, SelfBinding, SingletonScope
+from opyoid.bindings import BindingRegistry, InstanceBinding, ItemBinding, MultiBinding
+from opyoid.bindings.registered_binding import RegisteredBinding
+from opyoid.bindings.registered_multi_binding import RegisteredMultiBinding
+from opyoid.injection_context import InjectionContext
+from opyoid.injection_state import InjectionState
+from opyoid.providers import ProviderCreator, SingletonWarmer
+from opyoid.target import Target
+
+
+class TestSingletonWarmer(unittest.TestCase):
+    def setUp(self) -> None:
+        self.binding_registry = BindingRegistry()
+        self.binding_registry.register(RegisteredBinding(InstanceBinding(SingletonScope, SingletonScope())))
+        self.binding_registry.register(RegisteredBinding(InstanceBinding(PerLookupScope, PerLookupScope())))
+        self.provider_creator = ProviderCreator(record_dependencies=True)
+        self.state = InjectionState(self.provider_creator, self.binding_registry)
+        self.warmer = SingletonWarmer(self.provider_creator.dependency_recorder)
+
+    def get_provider(self, target_type):
+        return InjectionContext(Target(target_type), self.state).get_provider()
+
+    def test_singletons_are_created_after_their_dependencies(self):
+        created_types = []
+
+        class MyType:
+            def __init__(self):
+                created_types.append(MyType)
+
+        class MyPerLookupType:
+            def __init__(self, my_param: MyType):
+                self.my_param = my_param
+
+        class MyParentType:
+            def __init__(self, my_param: MyPerLookupType):
+                created_types.append(MyParentType)
+                self.my_param = my_param
+
+        self.binding_registry.register(RegisteredBinding(SelfBinding(MyType)))
+        self.binding_registry.register(RegisteredBinding(SelfBinding(MyPerLookupType, scope=PerLookupScope)))
+        self.binding_registry.register(RegisteredBinding(SelfBinding(MyParentType)))
+
+        errors = self.warmer.warm_up([self.get_provider(MyParentType)])
+
+        self.assertEqual([], errors)
+        self.assertEqual([MyType, MyParentType], created_types)
+
+    def test_independent_singletons_are_created_concurrently(self):
+        barrier = Barrier(2, timeout=5)
+
+        class MyType:
+            def __init__(self):
+                barrier.wait()
+
+        class MyOtherType:
+            def __init__(self):
+                barrier.wait()
+
+        self.binding_registry.register(RegisteredBinding(SelfBinding(MyType)))
+        self.binding_registry.register(RegisteredBinding(SelfBinding(MyOtherType)))
+
+        errors = self.warmer.warm_up([self.get_provider(MyType), self.get_provider(MyOtherType)], max_workers=2)
+
+        self.assertEqual([], errors)
+
+    def test_all_errors_are_returned_and_dependents_are_skipped(self):
+        created_types = []
+        error_1 = ValueError("error 1")
+        error_2 = ValueError("error 2")
+
+        class MyType:
+            def __init__(self):
+                raise error_1
+
+        class MyOtherType:
+            def __init__(self):
+                raise error_2
+
+        class MyParentType:
+            def __init__(self, my_param: MyType):
+                created_types.append(MyParentType)
+                self.my_param = my_param
+
+        self.binding_registry.register(RegisteredBinding(SelfBinding(MyType)))
+        self.binding_registry.register(RegisteredBinding(SelfBinding(MyOtherType)))
+        self.binding_registry.register(RegisteredBinding(SelfBinding(MyParentType)))
+
+        errors = self.warmer.warm_up([self.get_provider(MyParentType), self.get_provider(MyOtherType)])
+
+        self.assertCountEqual([error_1, error_2], errors)
+        self.assertEqual([], created_types)
+
+    def test_dependents_through_multi_bindings_are_skipped(self):
+        created_types = []
+        error = ValueError("error")
+
+        class MyType:
+            def __init__(self):
+                raise error
+
+        class MyItemType:
+            def __init__(self, my_param: MyType):
+                self.my_param = my_param
+
+        class MyParentType:
+            def __init__(self, my_param: List[MyItemType]):
+                created_types.append(MyParentType)
+                self.my_param = my_param
+
+        self.binding_registry.register(RegisteredBinding(SelfBinding(MyType)))
+        self.binding_registry.register(RegisteredMultiBinding(
+            MultiBinding(MyItemType, [ItemBinding(MyItemType)]),
+            item_bindings=[RegisteredBinding(SelfBinding(MyItemType, scope=PerLookupScope))],
+        ))
+        self.binding_registry.register(RegisteredBinding(SelfBinding(MyParentType)))
+
+        errors = self.warmer.warm_up([self.get_provider(MyType), self.get_provider(MyParentType)])
+
+        self.assertEqual([error], errors)
+        self.assertEqual([], created_types)
+
+    def test_without_dependency_recorder_only_given_singletons_are_created(self):
+        created_types = []
+
+        class MyType:
+            def __init__(self):
+                created_types.append(MyType)
+
+        class MyPerLookupType:
+            def __init__(self, my_param: MyType):
+                self.my_param = my_param
+
+        class MyParentType:
+            def __init__(self, my_param: MyType):
+                created_types.append(MyParentType)
+                self.my_param = my_param
+
+        self.binding_registry.register(RegisteredBinding(SelfBinding(MyType)))
+        self.binding_registry.register(RegisteredBinding(SelfBinding(MyPerLookupType, scope=PerLookupScope)))
+        self.binding_registry.register(RegisteredBinding(SelfBinding(MyParentType)))
+
+        errors = SingletonWarmer(None).warm_up([self.get_provider(MyPerLookupType), self.get_provider(MyParentType)])
+
+        self.assertEqual([], errors)
+        self.assertEqual([MyType, MyParentType], created_types)
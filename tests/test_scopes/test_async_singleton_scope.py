@@ -0,0 +1,33 @@
+import asyncio
+import unittest
+from unittest.mock import create_autospec
+
+from opyoid import AsyncSingletonScope
+from opyoid.provider import Provider
+from opyoid.scopes import AsyncSingletonScopedProvider
+
+
+class TestAsyncSingletonScope(unittest.TestCase):
+    def test_get_scoped_provider_returns_async_singleton_scoped_provider(self):
+        inner_provider = create_autospec(Provider, spec_set=True)
+        inner_provider.get_async.return_value = "instance"
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+
+        scoped_provider = AsyncSingletonScope().get_scoped_provider(inner_provider)
+        self.assertIsInstance(scoped_provider, AsyncSingletonScopedProvider)
+
+        instance = loop.run_until_complete(scoped_provider.get_async())
+        self.assertEqual("instance", instance)
+        inner_provider.get_async.assert_called_once_with()
+
+    def test_pop_created_instances_returns_created_instances(self):
+        inner_provider = create_autospec(Provider, spec_set=True)
+        inner_provider.get_async.return_value = "instance"
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+        scope = AsyncSingletonScope()
+
+        loop.run_until_complete(scope.get_scoped_provider(inner_provider).get_async())
+
+        self.assertEqual(["instance"], [instance for _, instance in scope.pop_created_instances()])
@@ -0,0 +1,62 @@
+import asyncio
+import unittest
+
+from opyoid import AsyncProvider
+from opyoid.exceptions import NonInjectableTypeError
+from opyoid.scopes import AsyncSingletonScopedProvider
+
+
+class MyType:
+    pass
+
+
+class MyAsyncProvider(AsyncProvider[MyType]):
+    def __init__(self):
+        self.call_count = 0
+        self.failures = 0
+
+    async def get_async(self) -> MyType:
+        self.call_count += 1
+        await asyncio.sleep(0)
+        if self.failures:
+            self.failures -= 1
+            raise ValueError("creation failed")
+        return MyType()
+
+
+class TestAsyncSingletonScopedProvider(unittest.TestCase):
+    def setUp(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        self.addCleanup(self.loop.close)
+        self.inner_provider = MyAsyncProvider()
+        self.provider = AsyncSingletonScopedProvider(self.inner_provider)
+
+    def test_concurrent_get_async_create_a_single_instance(self):
+        async def inject_concurrently():
+            return await asyncio.gather(*(self.provider.get_async() for _ in range(5)))
+
+        instances = self.loop.run_until_complete(inject_concurrently())
+
+        self.assertIsInstance(instances[0], MyType)
+        for instance in instances:
+            self.assertIs(instances[0], instance)
+        self.assertEqual(1, self.inner_provider.call_count)
+
+    def test_get_async_retries_after_failure(self):
+        self.inner_provider.failures = 1
+
+        with self.assertRaises(ValueError):
+            self.loop.run_until_complete(self.provider.get_async())
+        instance = self.loop.run_until_complete(self.provider.get_async())
+
+        self.assertIsInstance(instance, MyType)
+        self.assertEqual(2, self.inner_provider.call_count)
+
+    def test_get_before_creation_raises_non_injectable_type_error(self):
+        with self.assertRaises(NonInjectableTypeError):
+            self.provider.get()
+
+    def test_get_after_creation_returns_instance(self):
+        instance = self.loop.run_until_complete(self.provider.get_async())
+
+        self.assertIs(instance, self.provider.get())
@@ -0,0 +1,51 @@
+import asyncio
+import unittest
+from unittest.mock import MagicMock
+
+from opyoid import close_instance, close_instance_async
+
+
+class MyAsyncResource:
+    def __init__(self):
+        self.closed = False
+
+    async def aclose(self):
+        self.closed = True
+
+
+class TestCloseInstance(unittest.TestCase):
+    def test_close_method_is_called(self):
+        instance = MagicMock()
+
+        close_instance(instance)
+
+        instance.close.assert_called_once_with()
+        instance.__exit__.assert_not_called()
+
+    def test_context_manager_is_exited(self):
+        instance = MagicMock(spec=["__enter__", "__exit__"])
+
+        close_instance(instance)
+
+        instance.__exit__.assert_called_once_with(None, None, None)
+
+    def test_other_instances_are_ignored(self):
+        close_instance(object())
+
+    def test_aclose_method_is_awaited(self):
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+        instance = MyAsyncResource()
+
+        loop.run_until_complete(close_instance_async(instance))
+
+        self.assertTrue(instance.closed)
+
+    def test_close_instance_async_falls_back_to_close_instance(self):
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+        instance = MagicMock(spec=["close"])
+
+        loop.run_until_complete(close_instance_async(instance))
+
+        instance.close.assert_called_once_with()
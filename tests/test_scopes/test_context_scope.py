@@ -0,0 +1,19 @@
+import contextvars
+import unittest
+from unittest.mock import create_autospec
+
+from opyoid import ContextScope
+from opyoid.provider import Provider
+from opyoid.scopes import ContextScopedProvider
+
+
+class TestContextScope(unittest.TestCase):
+    def test_get_scoped_provider_returns_context_scoped_provider(self):
+        inner_provider = create_autospec(Provider, spec_set=True)
+
+        context_scoped_provider = ContextScope().get_scoped_provider(inner_provider)
+        self.assertIsInstance(context_scoped_provider, ContextScopedProvider)
+
+        instance = contextvars.copy_context().run(context_scoped_provider.get)
+        self.assertIs(inner_provider.get.return_value, instance)
+        inner_provider.get.assert_called_once_with()
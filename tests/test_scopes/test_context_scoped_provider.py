@@ -0,0 +1,77 @@
+import asyncio
+import contextvars
+import gc
+import unittest
+from weakref import ref
+
+from opyoid.bindings import FromClassProvider
+from opyoid.scopes import ContextScopedProvider
+
+
+class MyType:
+    pass
+
+
+class TestContextScopedProvider(unittest.TestCase):
+    def setUp(self) -> None:
+        self.provider = ContextScopedProvider(FromClassProvider(MyType, [], None, {}))
+
+    def test_get_returns_instance(self):
+        instance = contextvars.copy_context().run(self.provider.get)
+
+        self.assertIsInstance(instance, MyType)
+
+    def test_multiple_get_in_same_context_return_same_instance(self):
+        context = contextvars.copy_context()
+
+        instance_1 = context.run(self.provider.get)
+        instance_2 = context.run(self.provider.get)
+
+        self.assertIs(instance_1, instance_2)
+
+    def test_different_contexts_return_different_instances(self):
+        instance_1 = contextvars.copy_context().run(self.provider.get)
+        instance_2 = contextvars.copy_context().run(self.provider.get)
+
+        self.assertIsNot(instance_1, instance_2)
+
+    def test_concurrent_tasks_get_different_instances(self):
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+
+        async def inject_twice():
+            instance = await self.provider.get_async()
+            await asyncio.sleep(0)
+            self.assertIs(instance, await self.provider.get_async())
+            return instance
+
+        async def inject_in_tasks():
+            return await asyncio.gather(inject_twice(), inject_twice())
+
+        instance_1, instance_2 = contextvars.copy_context().run(loop.run_until_complete, inject_in_tasks())
+
+        self.assertIsInstance(instance_1, MyType)
+        self.assertIsInstance(instance_2, MyType)
+        self.assertIsNot(instance_1, instance_2)
+
+    def test_context_copy_keeps_its_own_instances(self):
+        context = contextvars.copy_context()
+        instance_1 = context.run(self.provider.get)
+        other_provider = ContextScopedProvider(FromClassProvider(MyType, [], None, {}))
+
+        context_copy = context.copy()
+        context_copy.run(other_provider.get)
+
+        self.assertIs(instance_1, context_copy.run(self.provider.get))
+        self.assertIsNot(context_copy.run(other_provider.get), context.run(other_provider.get))
+
+    def test_context_does_not_keep_provider_alive(self):
+        context = contextvars.copy_context()
+        provider = ContextScopedProvider(FromClassProvider(MyType, [], None, {}))
+        context.run(provider.get)
+        provider_reference = ref(provider)
+
+        del provider
+        gc.collect()
+
+        self.assertIsNone(provider_reference())
@@ -0,0 +1,32 @@
+import unittest
+from unittest.mock import MagicMock, create_autospec
+
+from opyoid import PooledScope
+from opyoid.provider import Provider
+from opyoid.scopes import PooledScopedProvider
+
+
+class TestPooledScope(unittest.TestCase):
+    def setUp(self) -> None:
+        self.inner_provider = create_autospec(Provider, spec_set=True)
+        self.inner_provider.get.side_effect = lambda: MagicMock()
+
+    def test_get_scoped_provider_returns_pooled_scoped_provider(self):
+        scope = PooledScope(max_size=2)
+        pooled_scoped_provider = scope.get_scoped_provider(self.inner_provider)
+        self.assertIsInstance(pooled_scoped_provider, PooledScopedProvider)
+
+        instance = pooled_scoped_provider.acquire()
+        pooled_scoped_provider.release(instance)
+
+        self.assertIs(instance, pooled_scoped_provider.acquire())
+
+    def test_pop_created_instances_returns_idle_instances(self):
+        scope = PooledScope()
+        pooled_scoped_provider = scope.get_scoped_provider(self.inner_provider)
+        idle_instance = pooled_scoped_provider.acquire()
+        pooled_scoped_provider.acquire()
+        pooled_scoped_provider.release(idle_instance)
+
+        self.assertEqual([idle_instance], [instance for _, instance in scope.pop_created_instances()])
+        self.assertEqual([], scope.pop_created_instances())
@@ -0,0 +1,200 @@
+import asyncio
+import unittest
+from threading import Timer
+from unittest.mock import MagicMock, call, create_autospec, patch
+
+from opyoid.exceptions import NonInjectableTypeError, PoolExhaustedError
+from opyoid.provider import Provider
+from opyoid.scopes import PooledScopedProvider
+
+
+class TestPooledScopedProvider(unittest.TestCase):
+    def setUp(self) -> None:
+        self.inner_provider = create_autospec(Provider, spec_set=True)
+        self.inner_provider.get.side_effect = lambda: MagicMock()
+        self.reset = MagicMock()
+        self.dispose = MagicMock()
+        self.provider = PooledScopedProvider(self.inner_provider, 2, 10., self.reset, self.dispose, 0.01)
+
+    def test_acquire_creates_instances_when_pool_is_empty(self):
+        instance_1 = self.provider.acquire()
+        instance_2 = self.provider.acquire()
+
+        self.assertIsNot(instance_1, instance_2)
+        self.assertEqual(2, self.inner_provider.get.call_count)
+
+    def test_released_instances_are_reset_and_reused(self):
+        instance = self.provider.acquire()
+        self.provider.release(instance)
+
+        self.assertIs(instance, self.provider.acquire())
+        self.reset.assert_called_once_with(instance)
+        self.inner_provider.get.assert_called_once_with()
+
+    def test_get_raises_error(self):
+        with self.assertRaises(NonInjectableTypeError):
+            self.provider.get()
+
+        self.inner_provider.get.assert_not_called()
+
+    def test_acquire_raises_error_when_max_size_instances_are_lent(self):
+        self.provider.acquire()
+        self.provider.acquire()
+
+        with self.assertRaises(PoolExhaustedError):
+            self.provider.acquire()
+
+        self.assertEqual(2, self.inner_provider.get.call_count)
+
+    def test_acquire_waits_for_released_instance(self):
+        provider = PooledScopedProvider(self.inner_provider, 1, acquire_timeout=5)
+        instance = provider.acquire()
+        timer = Timer(0.01, provider.release, [instance])
+        timer.start()
+        self.addCleanup(timer.join)
+
+        self.assertIs(instance, provider.acquire())
+
+    def test_failed_creations_do_not_count_as_lent(self):
+        provider = PooledScopedProvider(self.inner_provider, 1, acquire_timeout=0.01)
+        self.inner_provider.get.side_effect = [ValueError(), "instance"]
+
+        with self.assertRaises(ValueError):
+            provider.acquire()
+
+        self.assertEqual("instance", provider.acquire())
+
+    def test_instances_not_lent_by_pool_are_disposed_when_pool_is_full(self):
+        instance_1 = self.provider.acquire()
+        instance_2 = self.provider.acquire()
+        self.provider.release(instance_1)
+        self.provider.release(instance_2)
+        other_instance = MagicMock()
+
+        self.provider.release(other_instance)
+
+        self.dispose.assert_called_once_with(other_instance)
+        self.assertEqual([instance_1, instance_2], self.provider.pop_idle_instances())
+
+    def test_idle_instances_are_evicted(self):
+        with patch("opyoid.scopes.pooled_scoped_provider.monotonic") as monotonic:
+            monotonic.return_value = 100.
+            instance_1 = self.provider.acquire()
+            self.provider.release(instance_1)
+            monotonic.return_value = 111.
+            instance_2 = self.provider.acquire()
+
+        self.assertIsNot(instance_1, instance_2)
+        self.dispose.assert_called_once_with(instance_1)
+
+    def test_instances_failing_to_reset_are_discarded(self):
+        self.reset.side_effect = ValueError
+        instance = self.provider.acquire()
+        self.provider.acquire()
+
+        with self.assertLogs("opyoid", "ERROR"):
+            self.provider.release(instance)
+
+        self.dispose.assert_called_once_with(instance)
+        self.assertEqual([], self.provider.pop_idle_instances())
+        self.assertIsNot(instance, self.provider.acquire())
+
+    def test_dispose_errors_are_logged(self):
+        self.dispose.side_effect = ValueError
+        self.reset.side_effect = ValueError
+        instance = self.provider.acquire()
+
+        with self.assertLogs("opyoid", "ERROR"):
+            self.provider.release(instance)
+
+        self.assertEqual([call(instance)], self.dispose.call_args_list)
+
+    def test_acquire_async(self):
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+
+        instance = loop.run_until_complete(self.provider.acquire_async())
+        self.provider.release(instance)
+
+        self.assertIs(instance, loop.run_until_complete(self.provider.acquire_async()))
+        self.inner_provider.get_async.assert_called_once_with()
+
+    def test_acquire_async_waits_for_released_instance(self):
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+        provider = PooledScopedProvider(self.inner_provider, 1, acquire_timeout=5)
+        instance = loop.run_until_complete(provider.acquire_async())
+
+        async def release_later():
+            await asyncio.sleep(0.01)
+            provider.release(instance)
+
+        async def acquire_while_releasing():
+            return (await asyncio.gather(provider.acquire_async(), release_later()))[0]
+
+        self.assertIs(instance, loop.run_until_complete(acquire_while_releasing()))
+
+    def test_acquire_async_raises_error_when_max_size_instances_are_lent(self):
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+        self.provider.acquire()
+        self.provider.acquire()
+
+        with self.assertRaises(PoolExhaustedError):
+            loop.run_until_complete(self.provider.acquire_async())
+
+    def test_failed_async_creations_do_not_count_as_lent(self):
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+        provider = PooledScopedProvider(self.inner_provider, 1, acquire_timeout=0.01)
+        self.inner_provider.get_async.side_effect = ValueError
+
+        with self.assertRaises(ValueError):
+            loop.run_until_complete(provider.acquire_async())
+
+        self.assertIsNotNone(provider.acquire())
+
+    def test_get_async_raises_error(self):
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+
+        with self.assertRaises(NonInjectableTypeError):
+            loop.run_until_complete(self.provider.get_async())
+
+        self.inner_provider.get_async.assert_not_called()
+
+    def test_instances_are_dropped_without_dispose(self):
+        provider = PooledScopedProvider(self.inner_provider, 1)
+        instance = provider.acquire()
+        provider.release(instance)
+        provider.release(MagicMock())
+
+        self.assertEqual([instance], provider.pop_idle_instances())
+
+    def test_releasing_idle_instance_does_nothing(self):
+        provider = PooledScopedProvider(self.inner_provider, 2, reset=self.reset)
+        instance = provider.acquire()
+        provider.release(instance)
+
+        with self.assertLogs("opyoid", "WARNING"):
+            provider.release(instance)
+
+        self.reset.assert_called_once_with(instance)
+        self.assertIs(instance, provider.acquire())
+        self.assertIsNot(instance, provider.acquire())
+
+    def test_concurrent_releases_of_same_instance_keep_it_once(self):
+        provider = PooledScopedProvider(self.inner_provider, 2, reset=self.reset)
+        instance = provider.acquire()
+
+        def release_concurrently(_):
+            if self.reset.call_count == 1:
+                provider.release(instance)
+
+        # The second release happens while the first one resets the instance
+        self.reset.side_effect = release_concurrently
+
+        with self.assertLogs("opyoid", "WARNING"):
+            provider.release(instance)
+
+        self.assertEqual([instance], provider.pop_idle_instances())
@@ -0,0 +1,75 @@
+import unittest
+from unittest.mock import MagicMock, call, create_autospec
+
+from opyoid import RequestScope
+from opyoid.exceptions import NonInjectableTypeError
+from opyoid.provider import Provider
+from opyoid.scopes import RequestScopedProvider
+
+
+class TestRequestScope(unittest.TestCase):
+    def setUp(self) -> None:
+        self.inner_provider = create_autospec(Provider, spec_set=True)
+        self.inner_provider.get.side_effect = lambda: MagicMock()
+
+    def test_get_scoped_provider_returns_request_scoped_provider(self):
+        scope = RequestScope()
+        request_scoped_provider = scope.get_scoped_provider(self.inner_provider)
+        self.assertIsInstance(request_scoped_provider, RequestScopedProvider)
+
+        with scope:
+            instance_1 = request_scoped_provider.get()
+            instance_2 = request_scoped_provider.get()
+        with scope:
+            instance_3 = request_scoped_provider.get()
+
+        self.assertIs(instance_1, instance_2)
+        self.assertIsNot(instance_1, instance_3)
+        self.assertEqual(2, self.inner_provider.get.call_count)
+
+    def test_instances_are_released_on_exit(self):
+        scope = RequestScope()
+        request_scoped_provider = scope.get_scoped_provider(self.inner_provider)
+
+        with scope:
+            request_scoped_provider.get()
+
+        with self.assertRaises(NonInjectableTypeError):
+            request_scoped_provider.get()
+
+    def test_nested_blocks_have_their_own_instances(self):
+        scope = RequestScope()
+        request_scoped_provider = scope.get_scoped_provider(self.inner_provider)
+
+        with scope:
+            outer_instance = request_scoped_provider.get()
+            with scope:
+                inner_instance = request_scoped_provider.get()
+            self.assertIs(outer_instance, request_scoped_provider.get())
+
+        self.assertIsNot(outer_instance, inner_instance)
+
+    def test_dispose_is_called_in_reverse_creation_order(self):
+        dispose = MagicMock()
+        scope = RequestScope(dispose)
+        provider_1 = scope.get_scoped_provider(self.inner_provider)
+        provider_2 = scope.get_scoped_provider(self.inner_provider)
+
+        with scope:
+            instance_1 = provider_1.get()
+            instance_2 = provider_2.get()
+            dispose.assert_not_called()
+
+        self.assertEqual([call(instance_2), call(instance_1)], dispose.call_args_list)
+
+    def test_dispose_errors_do_not_stop_disposal(self):
+        dispose = MagicMock(side_effect=[ValueError(), None])
+        scope = RequestScope(dispose)
+        provider_1 = scope.get_scoped_provider(self.inner_provider)
+        provider_2 = scope.get_scoped_provider(self.inner_provider)
+
+        with scope:
+            provider_1.get()
+            provider_2.get()
+
+        self.assertEqual(2, dispose.call_count)
@@ -0,0 +1,55 @@
+import asyncio
+import unittest
+from contextvars import ContextVar
+
+from opyoid.bindings import FromClassProvider
+from opyoid.exceptions import NonInjectableTypeError
+from opyoid.scopes import RequestScopedProvider
+from opyoid.scopes.request_scoped_provider import RequestCache
+
+
+class MyType:
+    pass
+
+
+class TestRequestScopedProvider(unittest.TestCase):
+    def setUp(self) -> None:
+        self.current_request = ContextVar("current_request", default=None)
+        self.provider = RequestScopedProvider(FromClassProvider(MyType, [], None, {}), self.current_request)
+
+    def test_get_outside_of_request_raises_non_injectable_type_error(self):
+        with self.assertRaises(NonInjectableTypeError):
+            self.provider.get()
+
+    def test_multiple_get_in_same_request_return_same_instance(self):
+        request_cache = RequestCache()
+        token = self.current_request.set(request_cache)
+        self.addCleanup(self.current_request.reset, token)
+
+        instance_1 = self.provider.get()
+        instance_2 = self.provider.get()
+
+        self.assertIsInstance(instance_1, MyType)
+        self.assertIs(instance_1, instance_2)
+        self.assertEqual({self.provider: instance_1}, request_cache.instances)
+
+    def test_different_requests_return_different_instances(self):
+        token = self.current_request.set(RequestCache())
+        instance_1 = self.provider.get()
+        self.current_request.reset(token)
+        token = self.current_request.set(RequestCache())
+        self.addCleanup(self.current_request.reset, token)
+
+        instance_2 = self.provider.get()
+
+        self.assertIsNot(instance_1, instance_2)
+
+    def test_get_async_uses_request_cache(self):
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+        token = self.current_request.set(RequestCache())
+        self.addCleanup(self.current_request.reset, token)
+
+        instance = loop.run_until_complete(self.provider.get_async())
+
+        self.assertIs(instance, self.provider.get())
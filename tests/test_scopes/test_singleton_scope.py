@@ -1,5 +1,6 @@
 import unittest
-from unittest.mock import create_autospec
+from threading import RLock
+from unittest.mock import MagicMock, create_autospec
 
 from opyoid import SingletonScope
 from opyoid.provider import Provider
@@ -16,3 +17,27 @@ class TestSingletonScope(unittest.TestCase):
         instance = singleton_scoped_provider.get()
         self.assertIs(inner_provider.get.return_value, instance)
         inner_provider.get.assert_called_once_with()
+
+    def test_lock_factory_is_called_for_each_scoped_provider(self):
+        shared_lock = RLock()
+        lock_factory = MagicMock(return_value=shared_lock)
+        scope = SingletonScope(lock_factory)
+
+        scope.get_scoped_provider(create_autospec(Provider, spec_set=True))
+        scope.get_scoped_provider(create_autospec(Provider, spec_set=True))
+
+        self.assertEqual(2, lock_factory.call_count)
+
+    def test_pop_created_instances_returns_instances_in_creation_order(self):
+        scope = SingletonScope()
+        provider_1 = scope.get_scoped_provider(create_autospec(Provider, spec_set=True))
+        provider_2 = scope.get_scoped_provider(create_autospec(Provider, spec_set=True))
+
+        instance_2 = provider_2.get()
+        instance_1 = provider_1.get()
+        provider_1.get()
+
+        created_instances = scope.pop_created_instances()
+        self.assertEqual([instance_2, instance_1], [instance for _, instance in created_instances])
+        self.assertLess(created_instances[0][0], created_instances[1][0])
+        self.assertEqual([], scope.pop_created_instances())
@@ -1,8 +1,11 @@
+import asyncio
 import unittest
 from queue import Queue
-from threading import Thread
+from threading import RLock, Thread
+from unittest.mock import MagicMock
 
 from opyoid.bindings import FromClassProvider
+from opyoid.provider import Provider
 from opyoid.scopes.singleton_scoped_provider import SingletonScopedProvider
 
 
@@ -50,3 +53,72 @@ class TestSingletonScopedProvider(unittest.TestCase):
         instance_2 = provider_2.get()
 
         self.assertIsNot(instance_1, instance_2)
+
+    def test_compile_before_instantiation_returns_same_instance(self):
+        compiled_provider = self.provider.compile()
+        instance_1 = compiled_provider()
+        instance_2 = self.provider.get()
+
+        self.assertIsInstance(instance_1, MyType)
+        self.assertIs(instance_1, instance_2)
+
+    def test_compile_after_instantiation_returns_cached_instance(self):
+        instance_1 = self.provider.get()
+        instance_2 = self.provider.compile()()
+
+        self.assertIs(instance_1, instance_2)
+
+    def test_get_does_not_lock_once_instance_is_cached(self):
+        lock = MagicMock(wraps=RLock())
+        provider = SingletonScopedProvider(self.class_provider, lock)
+        instance_1 = provider.get()
+        instance_2 = provider.get()
+
+        self.assertIs(instance_1, instance_2)
+        lock.__enter__.assert_called_once_with()
+
+    def test_on_created_is_called_once(self):
+        on_created = MagicMock()
+        provider = SingletonScopedProvider(self.class_provider, on_created=on_created)
+
+        instance = provider.get()
+        provider.get()
+
+        on_created.assert_called_once_with(instance)
+
+    def test_concurrent_get_async_create_a_single_instance(self):
+        created_instances = []
+
+        class MyAsyncProvider(Provider[MyType]):
+            async def get_async(self) -> MyType:
+                await asyncio.sleep(0)
+                created_instances.append(MyType())
+                return created_instances[-1]
+
+        on_created = MagicMock()
+        provider = SingletonScopedProvider(MyAsyncProvider(), on_created=on_created)
+
+        async def inject_concurrently():
+            return await asyncio.gather(*(provider.get_async() for _ in range(5)))
+
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+        instances = loop.run_until_complete(inject_concurrently())
+
+        self.assertEqual(1, len(created_instances))
+        self.assertEqual(created_instances * 5, instances)
+        on_created.assert_called_once_with(created_instances[0])
+
+    def test_get_async_retries_after_failure(self):
+        inner_provider = MagicMock(spec=Provider)
+        inner_provider.get_async.side_effect = [ValueError(), "instance"]
+        provider = SingletonScopedProvider(inner_provider)
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+
+        with self.assertRaises(ValueError):
+            loop.run_until_complete(provider.get_async())
+        instance = loop.run_until_complete(provider.get_async())
+
+        self.assertEqual("instance", instance)
+        self.assertEqual("instance", loop.run_until_complete(provider.get_async()))
@@ -1,5 +1,6 @@
 import unittest
-from unittest.mock import create_autospec
+from threading import Thread
+from unittest.mock import MagicMock, create_autospec
 
 from opyoid import ThreadScope
 from opyoid.provider import Provider
@@ -16,3 +17,14 @@ class TestThreadScope(unittest.TestCase):
         instance = thread_scoped_provider.get()
         self.assertIs(inner_provider.get.return_value, instance)
         inner_provider.get.assert_called_once_with()
+
+    def test_dispose_is_passed_to_scoped_providers(self):
+        dispose = MagicMock()
+        inner_provider = create_autospec(Provider, spec_set=True)
+        thread_scoped_provider = ThreadScope(dispose).get_scoped_provider(inner_provider)
+
+        thread = Thread(target=thread_scoped_provider.get)
+        thread.start()
+        thread.join(1)
+
+        dispose.assert_called_once_with(inner_provider.get.return_value)
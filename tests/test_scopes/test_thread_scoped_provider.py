@@ -1,6 +1,8 @@
+import asyncio
 import unittest
 from queue import Queue
 from threading import Thread
+from unittest.mock import MagicMock
 
 from opyoid.bindings import FromClassProvider
 from opyoid.scopes.thread_scoped_provider import ThreadScopedProvider
@@ -54,3 +56,38 @@ class TestThreadScopedProvider(unittest.TestCase):
         instance_2 = provider_2.get()
 
         self.assertIsNot(instance_1, instance_2)
+
+    def test_dispose_is_called_when_thread_exits(self):
+        dispose = MagicMock()
+        provider = ThreadScopedProvider(self.class_provider, dispose)
+        queue = Queue()
+
+        def put_in_queue():
+            queue.put(provider.get())
+
+        thread = Thread(target=put_in_queue)
+        thread.start()
+        thread.join(1)
+        instance = queue.get()
+
+        dispose.assert_called_once_with(instance)
+
+    def test_dispose_is_not_called_while_thread_is_alive(self):
+        dispose = MagicMock()
+        provider = ThreadScopedProvider(self.class_provider, dispose)
+
+        provider.get()
+        provider.get()
+
+        dispose.assert_not_called()
+
+    def test_get_async_returns_thread_instance(self):
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+
+        instance_1 = loop.run_until_complete(self.provider.get_async())
+        instance_2 = loop.run_until_complete(self.provider.get_async())
+
+        self.assertIsInstance(instance_1, MyType)
+        self.assertIs(instance_1, instance_2)
+        self.assertIs(instance_1, self.provider.get())
@@ -1,7 +1,7 @@
 import unittest
 from typing import List, Optional, Set, Tuple, Type, Union
 
-from opyoid import Provider
+from opyoid import Lazy, Pooled, Provider
 from opyoid.named import Named
 from opyoid.type_checker import PEP_585, TypeChecker
 
@@ -107,6 +107,25 @@ class TestTypeChecker(unittest.TestCase):
         self.assertTrue(self.type_checker.is_provider(Provider[str]))
         self.assertTrue(self.type_checker.is_provider(Provider[TestClass]))
 
+    def test_is_lazy(self):
+        self.assertFalse(self.type_checker.is_lazy(str))
+        self.assertFalse(self.type_checker.is_lazy(TestClass))
+        self.assertFalse(self.type_checker.is_lazy(Lazy))
+        self.assertFalse(self.type_checker.is_lazy(List[TestClass]))
+        self.assertFalse(self.type_checker.is_lazy(Optional[TestClass]))
+        self.assertFalse(self.type_checker.is_lazy(Provider[TestClass]))
+        self.assertTrue(self.type_checker.is_lazy(Lazy[str]))
+        self.assertTrue(self.type_checker.is_lazy(Lazy[TestClass]))
+
+    def test_is_pooled(self):
+        self.assertFalse(self.type_checker.is_pooled(str))
+        self.assertFalse(self.type_checker.is_pooled(TestClass))
+        self.assertFalse(self.type_checker.is_pooled(Pooled))
+        self.assertFalse(self.type_checker.is_pooled(Lazy[TestClass]))
+        self.assertFalse(self.type_checker.is_pooled(Provider[TestClass]))
+        self.assertTrue(self.type_checker.is_pooled(Pooled[str]))
+        self.assertTrue(self.type_checker.is_pooled(Pooled[TestClass]))
+
     def test_is_named(self):
         class MyNamedType(Named):
             original_type = str
@@ -0,0 +1,40 @@
+import unittest
+
+from opyoid import NonInjectableTypeError
+from opyoid.type_name_index import TypeNameIndex
+
+
+class MyType:
+    class MyNestedType:
+        pass
+
+
+class TestTypeNameIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        self.index = TypeNameIndex()
+
+    def test_get_type_by_name_and_qualified_name(self):
+        self.index.add(MyType.MyNestedType)
+
+        self.assertIs(MyType.MyNestedType, self.index.get_type("MyNestedType"))
+        self.assertIs(MyType.MyNestedType, self.index.get_type("MyType.MyNestedType"))
+
+    def test_get_unknown_type_returns_none(self):
+        self.index.add(MyType)
+
+        self.assertIsNone(self.index.get_type("MyOtherType"))
+
+    def test_non_types_are_ignored(self):
+        self.index.add("MyType")
+
+        self.assertIsNone(self.index.get_type("MyType"))
+
+    def test_get_type_with_several_types_raises_error(self):
+        class MyType:  # pylint: disable=redefined-outer-name
+            pass
+
+        self.index.add(MyType)
+        self.index.add(globals()["MyType"])
+
+        with self.assertRaises(NonInjectableTypeError):
+            self.index.get_type("MyType")